@@ -1,16 +1,18 @@
 """Audio package: microphone discovery and capture utilities.
 
 This package exposes a clean namespace for audio operations; implementations
-live in ``src.audio.capture``.
+live in ``src.audio.capture`` (microphones) and ``src.audio.replay`` (WAV
+files fed through the same pipeline).
+
+The capture functions are imported on first use: they need sounddevice and
+the PortAudio library, which headless machines replaying WAV files lack.
 """
 
-from .capture import (
-    get_microphone_list,
-    capture_audio,
-    capture_audio_with_callback,
-    capture_audio_realtime,
-    is_microphone_active,
-)
+from .pipeline import create_segmenter, dispatch_segments
+from .replay import read_wav, replay_wav_realtime
+from .resample import PolyphaseResampler, resample
+from .ring_buffer import AudioRingBuffer
+from .segmentation import FixedChunkSegmenter, VadSegmenter
 
 __all__ = [
     "get_microphone_list",
@@ -18,4 +20,29 @@ __all__ = [
     "capture_audio_with_callback",
     "capture_audio_realtime",
     "is_microphone_active",
+    "create_segmenter",
+    "dispatch_segments",
+    "read_wav",
+    "replay_wav_realtime",
+    "AudioRingBuffer",
+    "PolyphaseResampler",
+    "resample",
+    "FixedChunkSegmenter",
+    "VadSegmenter",
 ]
+
+_CAPTURE_NAMES = (
+    "get_microphone_list",
+    "capture_audio",
+    "capture_audio_with_callback",
+    "capture_audio_realtime",
+    "is_microphone_active",
+)
+
+
+def __getattr__(name):
+    if name in _CAPTURE_NAMES:
+        from . import capture
+
+        return getattr(capture, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
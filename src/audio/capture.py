@@ -3,11 +3,18 @@ import numpy as np
 import threading
 import tkinter as tk
 import time
+import itertools
+from .resample import PolyphaseResampler
+from .ring_buffer import AudioRingBuffer
+from .pipeline import create_segmenter, dispatch_segments
+from src.transcription.worker_pool import get_transcription_pool
 from src.config_pkg import (
     CHUNK_DURATION,
-    OVERLAP_DURATION,
     MICROPHONE_ACTIVITY_THRESHOLD,
     DEFAULT_RECORDING_DURATION,
+    RESAMPLER_TAPS_PER_PHASE,
+    TRANSCRIPTION_SAMPLE_RATE,
+    get_ring_buffer_samples,
     get_test_samples,
     get_recording_samples,
 )
@@ -98,96 +105,131 @@ def capture_audio(device_index, duration=None):
         return None, None
 
 
+def _format_upload_rate(
+    device_index, dispatched_samples, recorded_samples, samplerate, native_rate
+):
+    """
+    Describe the bytes sent for transcription per recorded minute, at the
+    transcription rate and at what the native capture rate would have cost
+    """
+    minutes = recorded_samples / samplerate / 60 if samplerate else 0
+    if minutes <= 0:
+        return f"Device {device_index} upload: no audio recorded"
+    after = dispatched_samples * 2 / minutes / 1024
+    before = after * native_rate / samplerate
+    return (
+        f"Device {device_index} upload: {after:.0f} KiB/min at {samplerate} Hz "
+        f"(was {before:.0f} KiB/min at {native_rate} Hz)"
+    )
+
+
 def capture_audio_realtime(
-    device_index, on_audio_chunk, stop_event, chunk_duration=None
+    device_index,
+    on_audio_chunk,
+    stop_event,
+    chunk_duration=None,
+    worker_pool=None,
+    sequence=None,
+    on_chunk_discarded=None,
 ):
     """
-    Capture audio in real-time with configured samples and overlap for continuity
+    Capture audio in real-time and dispatch it for transcription
     Audio capture never pauses - transcription happens in parallel
-    Never loses conversation by maintaining overlap between chunks
+    With SEGMENTATION_MODE "vad" utterances are cut at natural pauses; with
+    "fixed" chunks of chunk_duration keep an overlap for continuity
 
     Args:
         device_index (int): The index of the audio device
-        on_audio_chunk: Callback function to call with each audio chunk
+        on_audio_chunk: Called as on_audio_chunk(device_index, audio_chunk,
+            samplerate, seq, captured_at) for each chunk
         stop_event: Threading event to signal when to stop recording
         chunk_duration (float): Duration in seconds for each audio chunk (uses config default if None)
+        worker_pool: TranscriptionWorkerPool that runs on_audio_chunk (shared pool if None)
+        sequence: Iterator of sequence numbers; share one between devices so
+            chunks of a session are numbered in capture order (new counter if None)
+        on_chunk_discarded: Called with the same arguments as on_audio_chunk
+            when the pool drops or merges a chunk instead of handling it
     """
     if chunk_duration is None:
         chunk_duration = CHUNK_DURATION
+    pool = worker_pool or get_transcription_pool()
+    if sequence is None:
+        sequence = itertools.count()
 
     try:
-        samplerate = int(sd.query_devices(device_index)["default_samplerate"])
-        chunk_samples = get_recording_samples(samplerate, chunk_duration)
-        overlap_samples = get_recording_samples(samplerate, OVERLAP_DURATION)
-
+        native_rate = int(sd.query_devices(device_index)["default_samplerate"])
+        # Downsample to the transcription rate right after capture (never upsample)
+        samplerate = native_rate
+        if TRANSCRIPTION_SAMPLE_RATE:
+            samplerate = min(native_rate, TRANSCRIPTION_SAMPLE_RATE)
+        resampler = PolyphaseResampler(
+            native_rate, samplerate, RESAMPLER_TAPS_PER_PHASE
+        )
         # Continuous audio buffer - never stops collecting
-        audio_buffer = []
-        buffer_lock = threading.Lock()
+        ring = AudioRingBuffer(get_ring_buffer_samples(samplerate))
+        segmenter = create_segmenter(ring, samplerate, chunk_duration)
+        # Wall-clock time of ring position 0, set by the first callback
+        stream_started_at = None
 
-        def audio_callback(indata, frames, time, status):
+        def audio_callback(indata, frames, time_info, status):
             """Callback function for continuous streaming audio input"""
+            nonlocal stream_started_at
             if status:
                 print(f"Audio status for device {device_index}: {status}")
+            if stream_started_at is None:
+                stream_started_at = time.time() - frames / native_rate
 
-            # Convert to int16 and add to buffer (non-blocking)
-            audio_data = (indata[:, 0] * 32767).astype(np.int16)
-
-            with buffer_lock:
-                audio_buffer.extend(audio_data)
+            # Resample, then scale to int16 straight into the ring
+            ring.write(resampler.process(indata[:, 0]))
 
         # Start continuous streaming audio input
         with sd.InputStream(
             callback=audio_callback,
             device=device_index,
             channels=1,
-            samplerate=samplerate,
+            samplerate=native_rate,
             dtype=np.float32,
             blocksize=512,  # Smaller block size for lower latency
             latency="low",  # Request low latency mode
         ):
 
-            last_chunk_time = 0
-
-            while not stop_event.is_set():
-                try:
-                    # Check if we have enough audio data for a new chunk
-                    with buffer_lock:
-                        buffer_length = len(audio_buffer)
-
-                    if buffer_length >= chunk_samples:
-                        # Extract chunk from buffer without stopping audio capture
-                        with buffer_lock:
-                            audio_chunk = np.array(
-                                audio_buffer[:chunk_samples], dtype=np.int16
-                            )
-                            # Keep overlap to never lose conversation
-                            # Remove everything except the last overlap for next chunk continuity
-                            audio_buffer = audio_buffer[
-                                chunk_samples - overlap_samples :
-                            ]
-
-                        # Check if we got meaningful audio (not just silence)
-                        if np.max(np.abs(audio_chunk)) > MICROPHONE_ACTIVITY_THRESHOLD:
-                            # Process chunk in completely separate thread - never blocks audio
-                            processing_thread = threading.Thread(
-                                target=on_audio_chunk,
-                                args=(device_index, audio_chunk, samplerate),
-                                daemon=True,
-                                name=f"Transcription-{device_index}-{int(time.time())}",
-                            )
-                            processing_thread.start()
-
-                        last_chunk_time = time.time()
-
-                    # Very small sleep to prevent busy waiting but keep responsiveness
-                    time.sleep(0.05)  # 50ms sleep - audio still captures continuously
-
-                except Exception as e:
-                    print(
-                        f"Error processing audio chunk from device {device_index}: {e}"
-                    )
-                    # Don't break - continue capturing audio even if processing fails
-                    time.sleep(0.1)
+            # Wake the consumer as soon as recording is stopped
+            def close_on_stop():
+                stop_event.wait()
+                ring.close()
+
+            threading.Thread(
+                target=close_on_stop, daemon=True, name=f"CaptureStop-{device_index}"
+            ).start()
+
+            stats = dispatch_segments(
+                device_index,
+                ring,
+                segmenter,
+                samplerate,
+                lambda start: stream_started_at + start / samplerate,
+                stop_event,
+                pool,
+                on_audio_chunk,
+                sequence,
+                on_chunk_discarded,
+            )
+
+        print(
+            stats["dispatch_latency"].format_summary(
+                f"Device {device_index} dispatch latency"
+            )
+        )
+        print(pool.format_summary())
+        print(
+            _format_upload_rate(
+                device_index,
+                stats["dispatched_samples"],
+                ring.write_position,
+                samplerate,
+                native_rate,
+            )
+        )
 
     except Exception as e:
         print(f"Error setting up real-time capture for device {device_index}: {e}")
@@ -0,0 +1,120 @@
+"""
+Source-independent half of real-time capture: ring buffer -> segmenter ->
+transcription pool.
+
+``capture_audio_realtime`` (microphone) and ``replay_wav_realtime`` (WAV
+files) only differ in what writes samples into the ring; both run the same
+consumer loop below, so a replay exercises exactly the chunking used while
+recording.
+"""
+
+import time
+
+from src.config_pkg import (
+    CHUNK_DURATION,
+    ERROR_SLEEP_INTERVAL,
+    OVERLAP_DURATION,
+    SEGMENTATION_MODE,
+    get_recording_samples,
+)
+from src.metrics import LatencyStats
+from .segmentation import FixedChunkSegmenter, VadSegmenter
+
+
+def create_segmenter(ring, samplerate, chunk_duration=None):
+    """
+    Build the segmenter selected by SEGMENTATION_MODE
+
+    Returns:
+        FixedChunkSegmenter or VadSegmenter reading from ``ring``
+    """
+    if chunk_duration is None:
+        chunk_duration = CHUNK_DURATION
+    if SEGMENTATION_MODE == "vad":
+        return VadSegmenter(ring, samplerate)
+    chunk_samples = get_recording_samples(samplerate, chunk_duration)
+    overlap_samples = get_recording_samples(samplerate, OVERLAP_DURATION)
+    return FixedChunkSegmenter(ring, chunk_samples, overlap_samples)
+
+
+def dispatch_segments(
+    device_index,
+    ring,
+    segmenter,
+    samplerate,
+    timestamp,
+    stop_event,
+    pool,
+    on_audio_chunk,
+    sequence,
+    on_chunk_discarded=None,
+):
+    """
+    Consume the ring until stopped, submitting each segment to the pool
+
+    Runs until ``stop_event`` is set or the ring is closed by its writer;
+    the segmenter is then flushed so the last utterance is not lost.
+
+    Args:
+        device_index: Identifier passed to the chunk handler
+        ring: AudioRingBuffer written by the audio source
+        segmenter: Segmenter reading from ``ring``
+        samplerate (int): Sample rate of the ring contents
+        timestamp: Callable mapping a ring position to the wall-clock time
+            that sample was captured (the chunk's captured_at)
+        stop_event: Threading event that ends the loop
+        pool: TranscriptionWorkerPool that runs on_audio_chunk
+        on_audio_chunk: Called as on_audio_chunk(device_index, audio_chunk,
+            samplerate, seq, captured_at) for each chunk
+        sequence: Iterator of sequence numbers
+        on_chunk_discarded: Called when the pool drops or merges a chunk
+
+    Returns:
+        dict: dispatched_samples and dispatch_latency (LatencyStats)
+    """
+    dispatch_latency = LatencyStats()
+    dispatched_samples = 0
+
+    def submit(segments):
+        nonlocal dispatched_samples
+        for audio_chunk, chunk_overlap, start in segments:
+            dispatched_samples += audio_chunk.shape[0]
+            captured_at = timestamp(start)
+            # Hand off to the shared transcription workers - never blocks
+            # audio unless the "block" overflow policy is configured
+            pool.submit(
+                on_audio_chunk,
+                device_index,
+                audio_chunk,
+                samplerate,
+                next(sequence),
+                captured_at,
+                overlap_samples=chunk_overlap,
+                on_discard=on_chunk_discarded,
+            )
+
+    while not stop_event.is_set():
+        try:
+            # Block until the source writes what the segmenter needs next
+            if not ring.wait_for_position(segmenter.next_position):
+                if ring.closed:
+                    break
+                continue
+            if ring.last_wake_latency is not None:
+                dispatch_latency.record(ring.last_wake_latency)
+
+            submit(segmenter.process())
+
+        except Exception as e:
+            print(f"Error processing audio chunk from device {device_index}: {e}")
+            # Don't break - continue capturing audio even if processing fails
+            time.sleep(ERROR_SLEEP_INTERVAL)
+    try:
+        # The utterance (or partial chunk) still open at Stop
+        submit(segmenter.flush())
+    except Exception as e:
+        print(f"Error flushing the last audio chunk from device {device_index}: {e}")
+    return {
+        "dispatched_samples": dispatched_samples,
+        "dispatch_latency": dispatch_latency,
+    }
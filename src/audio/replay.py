@@ -0,0 +1,178 @@
+"""
+Replay WAV files through the real-time capture pipeline.
+
+``replay_wav_realtime`` stands in for ``capture_audio_realtime``: instead of a
+PortAudio callback, a feeder thread writes the file into the ring buffer in
+512-frame blocks, paced at ``speed`` times real time (``speed=0`` writes as
+fast as possible). Everything downstream - resampling, segmentation, the
+transcription worker pool and the chunk handler - is the code used while
+recording, so replays give reproducible end-to-end measurements.
+"""
+
+import itertools
+import threading
+import time
+import wave
+
+import numpy as np
+
+from src.config_pkg import (
+    CHUNK_DURATION,
+    RESAMPLER_TAPS_PER_PHASE,
+    TRANSCRIPTION_SAMPLE_RATE,
+    get_recording_samples,
+    get_ring_buffer_samples,
+)
+from src.transcription.worker_pool import get_transcription_pool
+from .pipeline import create_segmenter, dispatch_segments
+from .resample import PolyphaseResampler
+from .ring_buffer import AudioRingBuffer
+
+_PCM_SCALE = {1: 128.0, 2: 32768.0, 4: 2147483648.0}
+
+
+def read_wav(path):
+    """
+    Read a PCM WAV file as mono float32 in [-1, 1]
+
+    Multi-channel files are mixed down by averaging the channels.
+
+    Returns:
+        tuple: (samples, samplerate)
+    """
+    with wave.open(str(path), "rb") as wav:
+        width = wav.getsampwidth()
+        channels = wav.getnchannels()
+        samplerate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        # 8-bit WAV is unsigned
+        samples = np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0
+    elif width in (2, 4):
+        dtype = np.int16 if width == 2 else np.int32
+        samples = np.frombuffer(frames, dtype=dtype).astype(np.float32)
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width * 8} bits")
+
+    samples = samples.reshape(-1, channels).mean(axis=1) / _PCM_SCALE[width]
+    return samples.astype(np.float32, copy=False), samplerate
+
+
+def replay_wav_realtime(
+    path,
+    on_audio_chunk,
+    stop_event,
+    speed=1.0,
+    device_index=0,
+    chunk_duration=None,
+    worker_pool=None,
+    sequence=None,
+    on_chunk_discarded=None,
+    blocksize=512,
+):
+    """
+    Feed a WAV file through the capture pipeline as if it were a microphone
+
+    Blocks until the whole file has been dispatched (or ``stop_event`` is
+    set); chunks still queued in the pool keep being transcribed afterwards.
+    A chunk's captured_at is the time its first sample was fed, so it
+    becomes available captured_at + duration / speed later (unpaced replays
+    stamp the dispatch time instead).
+
+    Args:
+        path: WAV file to replay
+        on_audio_chunk: Called as on_audio_chunk(device_index, audio_chunk,
+            samplerate, seq, captured_at) for each chunk
+        stop_event: Threading event to stop the replay early
+        speed (float): Playback rate relative to real time (0 = unpaced)
+        device_index: Identifier passed to the chunk handler
+        chunk_duration (float): Fixed-mode chunk length (uses config default if None)
+        worker_pool: TranscriptionWorkerPool that runs on_audio_chunk
+            (shared pool if None)
+        sequence: Iterator of sequence numbers (new counter if None)
+        on_chunk_discarded: Called when the pool drops or merges a chunk
+        blocksize (int): Frames written per simulated audio callback
+
+    Returns:
+        dict: audio_seconds, wall_seconds, dispatched_samples, dropped_samples,
+        samplerate and dispatch_latency (LatencyStats)
+    """
+    if chunk_duration is None:
+        chunk_duration = CHUNK_DURATION
+    pool = worker_pool or get_transcription_pool()
+    if sequence is None:
+        sequence = itertools.count()
+
+    audio, native_rate = read_wav(path)
+    samplerate = native_rate
+    if TRANSCRIPTION_SAMPLE_RATE:
+        samplerate = min(native_rate, TRANSCRIPTION_SAMPLE_RATE)
+    resampler = PolyphaseResampler(native_rate, samplerate, RESAMPLER_TAPS_PER_PHASE)
+    ring = AudioRingBuffer(get_ring_buffer_samples(samplerate))
+    segmenter = create_segmenter(ring, samplerate, chunk_duration)
+    # Trailing silence flushes the last partial chunk / utterance
+    tail = np.zeros(
+        get_recording_samples(native_rate, chunk_duration), dtype=np.float32
+    )
+    feed = np.concatenate((audio, tail))
+    time_scale = 1.0 / speed if speed > 0 else 0.0
+    started_at = time.time()
+
+    def timestamp(start):
+        """Wall-clock time the sample at ``start`` was fed (as if live)"""
+        if not time_scale:
+            return time.time()
+        return started_at + start / samplerate * time_scale
+
+    def feeder():
+        """Stand-in for the PortAudio callback"""
+        start = time.perf_counter()
+        try:
+            for offset in range(0, feed.shape[0], blocksize):
+                if stop_event.is_set():
+                    break
+                end = min(offset + blocksize, feed.shape[0])
+                due = start + end / native_rate * time_scale
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    stop_event.wait(delay)
+                # A microphone cannot outrun the consumer like an unpaced
+                # file can: wait for room instead of overwriting unread audio
+                while (
+                    ring.available + blocksize > ring.capacity
+                    and not stop_event.is_set()
+                ):
+                    stop_event.wait(0.001)
+                ring.write(resampler.process(feed[offset:end]))
+        finally:
+            ring.close()
+
+    wall_start = time.perf_counter()
+    thread = threading.Thread(
+        target=feeder, daemon=True, name=f"ReplayFeeder-{device_index}"
+    )
+    thread.start()
+    stats = dispatch_segments(
+        device_index,
+        ring,
+        segmenter,
+        samplerate,
+        timestamp,
+        stop_event,
+        pool,
+        on_audio_chunk,
+        sequence,
+        on_chunk_discarded,
+    )
+    thread.join()
+
+    stats.update(
+        {
+            "audio_seconds": audio.shape[0] / native_rate,
+            "wall_seconds": time.perf_counter() - wall_start,
+            "dropped_samples": ring.dropped_samples,
+            "samplerate": samplerate,
+        }
+    )
+    return stats
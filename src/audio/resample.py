@@ -0,0 +1,97 @@
+"""
+Streaming polyphase resampler used to bring capture audio down to the
+transcription sample rate before it enters the ring buffer.
+
+Speech recognition does not need more than 16 kHz; converting right after
+capture makes every later buffer, copy and upload proportionally smaller.
+"""
+
+from math import gcd
+
+import numpy as np
+
+
+def _design_polyphase_filter(up: int, down: int, taps_per_phase: int):
+    """Kaiser-windowed sinc low-pass split into ``up`` phases.
+
+    Returns an array of shape ``(up, taps_per_phase)`` where row ``p`` holds
+    the coefficients applied to the newest-to-oldest input samples for output
+    phase ``p``.
+    """
+    length = up * taps_per_phase
+    # Cut off just below the lower of the two Nyquist frequencies, expressed in
+    # cycles per sample at the (virtual) upsampled rate
+    cutoff = 0.5 / max(up, down) * 0.9
+    n = np.arange(length) - (length - 1) / 2
+    prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, 8.0)
+    prototype *= up / prototype.sum()
+    return prototype.reshape(taps_per_phase, up).T.astype(np.float32)
+
+
+class PolyphaseResampler:
+    """Rational-ratio resampler that keeps state across blocks.
+
+    Feed consecutive blocks of float samples to :meth:`process`; each call
+    returns every output sample that can be computed from the input seen so
+    far, so arbitrary block sizes (e.g. the 512-frame PortAudio blocks) give
+    the same result as resampling the whole signal at once.
+    """
+
+    def __init__(self, from_rate: int, to_rate: int, taps_per_phase: int = 32):
+        if from_rate <= 0 or to_rate <= 0:
+            raise ValueError("Sample rates must be positive")
+        self.from_rate = int(from_rate)
+        self.to_rate = int(to_rate)
+        divisor = gcd(self.from_rate, self.to_rate)
+        self.up = self.to_rate // divisor
+        self.down = self.from_rate // divisor
+        self.taps = taps_per_phase
+        self.passthrough = self.up == self.down
+
+        if not self.passthrough:
+            self._phases = _design_polyphase_filter(self.up, self.down, self.taps)
+            self._history = np.zeros(self.taps - 1, dtype=np.float32)
+            self._offsets = np.arange(self.taps)
+        self._consumed = 0  # absolute number of input samples seen
+        self._next_output = 0  # absolute index of the next output sample
+
+    def process(self, block, max_outputs_per_pass: int = 8192):
+        """Resample the next block of input; returns float32 samples in [-1, 1]."""
+        block = np.asarray(block, dtype=np.float32).reshape(-1)
+        if self.passthrough:
+            return block
+
+        buffer = np.concatenate((self._history, block))
+        # Absolute input index of buffer[0]
+        buffer_start = self._consumed - (self.taps - 1)
+        self._consumed += block.shape[0]
+        # Every output whose newest input sample has arrived can be produced
+        end = (self._consumed * self.up + self.down - 1) // self.down
+
+        outputs = []
+        for first in range(self._next_output, end, max_outputs_per_pass):
+            m = np.arange(first, min(end, first + max_outputs_per_pass), dtype=np.int64)
+            position = m * self.down
+            newest = position // self.up - buffer_start
+            phase = position % self.up
+            window = buffer[newest[:, None] - self._offsets[None, :]]
+            outputs.append(np.einsum("ij,ij->i", window, self._phases[phase]))
+        self._next_output = end
+        self._history = buffer[buffer.shape[0] - (self.taps - 1) :]
+
+        if not outputs:
+            return np.zeros(0, dtype=np.float32)
+        result = np.concatenate(outputs).astype(np.float32, copy=False)
+        return np.clip(result, -1.0, 1.0, out=result)
+
+
+def resample(audio, from_rate: int, to_rate: int, taps_per_phase: int = 32):
+    """Resample a whole signal (float in [-1, 1] or int16, same dtype out)."""
+    audio = np.asarray(audio)
+    if int(from_rate) == int(to_rate):
+        return audio
+    resampler = PolyphaseResampler(from_rate, to_rate, taps_per_phase)
+    if np.issubdtype(audio.dtype, np.integer):
+        out = resampler.process(audio.astype(np.float32) / 32768.0)
+        return (out * 32767).astype(audio.dtype)
+    return resampler.process(audio).astype(audio.dtype, copy=False)
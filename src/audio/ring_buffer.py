@@ -0,0 +1,200 @@
+"""
+Fixed-capacity int16 ring buffer shared by the capture callback and the
+chunking loop.
+
+The PortAudio callback writes each block with a single vectorized copy and
+the consumer reads chunks back as zero-copy views (or one contiguous copy when
+the requested window wraps around the end of the storage). The consumer blocks
+on a condition variable that the writer signals only when the position it is
+waiting for has been reached, so there is no polling.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Single-producer/single-consumer ring of int16 samples.
+
+    Positions are absolute sample counts since the buffer was created, so the
+    write cursor only ever grows and ``write_position - read_position`` is the
+    number of unread samples. When the writer laps the reader the oldest
+    samples are discarded and counted in ``dropped_samples``.
+
+    Views returned by :meth:`peek` alias the internal storage and are only
+    valid until the writer overwrites that region; copy them before handing
+    them to another thread.
+    """
+
+    def __init__(self, capacity: int, dtype=np.int16):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self._buffer = np.zeros(self.capacity, dtype=dtype)
+        self._write_pos = 0
+        self._read_pos = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._wake_position = None
+        self._wake_time = None
+        self._closed = False
+        self.dropped_samples = 0
+        # Seconds between the writer reaching the awaited position and the
+        # waiting consumer running again (None if the last wait did not block)
+        self.last_wake_latency = None
+
+    @property
+    def write_position(self) -> int:
+        return self._write_pos
+
+    @property
+    def read_position(self) -> int:
+        return self._read_pos
+
+    @property
+    def available(self) -> int:
+        """Number of unread samples currently held."""
+        with self._lock:
+            return self._write_pos - self._read_pos
+
+    def write(self, samples) -> None:
+        """Append a block of samples.
+
+        Float input in ``[-1.0, 1.0]`` (the format delivered by
+        ``sd.InputStream``) is scaled to int16 directly into the storage, so no
+        intermediate array is allocated. Integer input is copied as-is.
+        """
+        samples = np.asarray(samples).reshape(-1)
+        count = samples.shape[0]
+        if count == 0:
+            return
+        if count > self.capacity:
+            # Only the newest `capacity` samples can be kept
+            skipped = count - self.capacity
+            samples = samples[skipped:]
+            count = self.capacity
+        else:
+            skipped = 0
+
+        with self._lock:
+            start = self._write_pos + skipped
+            offset = start % self.capacity
+            first = min(count, self.capacity - offset)
+            self._store(samples[:first], offset)
+            if first < count:
+                self._store(samples[first:], 0)
+
+            self._write_pos = start + count
+            overrun = self._write_pos - self._read_pos - self.capacity
+            if overrun > 0:
+                self._read_pos += overrun
+                self.dropped_samples += overrun
+
+            if (
+                self._wake_position is not None
+                and self._write_pos >= self._wake_position
+            ):
+                self._wake_position = None
+                self._wake_time = time.monotonic()
+                self._ready.notify_all()
+
+    def _store(self, block, offset: int) -> None:
+        target = self._buffer[offset : offset + block.shape[0]]
+        if np.issubdtype(block.dtype, np.floating):
+            np.multiply(block, 32767, out=target, casting="unsafe")
+        else:
+            target[:] = block
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Wake any waiting consumer; subsequent waits return immediately."""
+        with self._ready:
+            self._closed = True
+            self._ready.notify_all()
+
+    def wait_for_position(self, position: int, timeout=None) -> bool:
+        """Block until the write cursor reaches the absolute ``position``.
+
+        Returns True once the position has been written, False if the buffer
+        was closed or ``timeout`` elapsed first.
+        """
+        with self._ready:
+            self.last_wake_latency = None
+            if self._write_pos >= position or self._closed:
+                return self._write_pos >= position
+            self._wake_position = position
+            self._wake_time = None
+            self._ready.wait_for(
+                lambda: self._closed or self._write_pos >= position, timeout
+            )
+            self._wake_position = None
+            if self._wake_time is not None:
+                self.last_wake_latency = time.monotonic() - self._wake_time
+            return self._write_pos >= position
+
+    def wait_for_available(self, count: int, timeout=None) -> bool:
+        """Block until at least ``count`` unread samples are buffered."""
+        with self._lock:
+            target = self._read_pos + count
+        return self.wait_for_position(target, timeout)
+
+    def peek(self, count: int):
+        """Return the next ``count`` unread samples without consuming them.
+
+        Returns a view into the storage when the window is contiguous, a single
+        concatenated copy when it wraps, or ``None`` if fewer than ``count``
+        samples are available.
+        """
+        with self._lock:
+            if self._write_pos - self._read_pos < count:
+                return None
+            offset = self._read_pos % self.capacity
+            end = offset + count
+            if end <= self.capacity:
+                return self._buffer[offset:end]
+            return np.concatenate(
+                (self._buffer[offset:], self._buffer[: end - self.capacity])
+            )
+
+    def peek_range(self, start: int, end: int):
+        """Return the samples at absolute positions ``[start, end)``.
+
+        Same view/copy semantics as :meth:`peek`. Returns ``None`` if part of
+        the range has not been written yet or has already been consumed or
+        overwritten.
+        """
+        with self._lock:
+            if start < self._read_pos or end > self._write_pos or end < start:
+                return None
+            offset = start % self.capacity
+            stop = offset + (end - start)
+            if stop <= self.capacity:
+                return self._buffer[offset:stop]
+            return np.concatenate(
+                (self._buffer[offset:], self._buffer[: stop - self.capacity])
+            )
+
+    def release_to(self, position: int) -> None:
+        """Consume everything before the absolute ``position``."""
+        with self._lock:
+            self._read_pos = max(self._read_pos, min(position, self._write_pos))
+
+    def advance(self, count: int) -> None:
+        """Consume ``count`` samples (clamped to what is available)."""
+        with self._lock:
+            self._read_pos = min(self._read_pos + count, self._write_pos)
+
+    def read(self, count: int, keep: int = 0):
+        """Return the next ``count`` samples and consume all but the last ``keep``.
+
+        ``keep`` lets consecutive windows overlap, e.g. ``read(chunk, overlap)``.
+        """
+        window = self.peek(count)
+        if window is not None:
+            self.advance(count - keep)
+        return window
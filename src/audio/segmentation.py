@@ -0,0 +1,222 @@
+"""
+Segmenters that turn the capture ring buffer into transcription requests.
+
+Both segmenters share one interface used by ``capture_audio_realtime``:
+
+- ``next_position``: absolute ring position to wait for before calling
+  :meth:`process` again.
+- ``process()``: returns a list of ``(audio_chunk, overlap_samples,
+  start_position)`` tuples. ``audio_chunk`` is an int16 copy, detached from
+  the ring, and ``start_position`` is the absolute ring position of its first
+  sample (used to derive the capture time).
+- ``flush()``: same return value; called once when recording stops, for the
+  audio :meth:`process` is still holding back.
+"""
+
+import numpy as np
+
+from src.config_pkg import (
+    MICROPHONE_ACTIVITY_THRESHOLD,
+    VAD_FRAME_DURATION,
+    VAD_BATCH_DURATION,
+    VAD_ENERGY_THRESHOLD_DB,
+    VAD_NOISE_MARGIN_DB,
+    VAD_ZCR_THRESHOLD,
+    VAD_HANGOVER_DURATION,
+    VAD_PRE_ROLL_DURATION,
+    VAD_MIN_UTTERANCE_DURATION,
+    VAD_MAX_UTTERANCE_DURATION,
+)
+
+
+class FixedChunkSegmenter:
+    """Fixed-length chunks with overlap (the original chunking behaviour)."""
+
+    def __init__(self, ring, chunk_samples: int, overlap_samples: int):
+        self.ring = ring
+        self.chunk_samples = chunk_samples
+        self.overlap_samples = overlap_samples
+
+    @property
+    def next_position(self) -> int:
+        return self.ring.read_position + self.chunk_samples
+
+    def process(self):
+        start = self.ring.read_position
+        # Keep overlap to never lose conversation: consume everything except
+        # the last overlap so the next chunk starts with it
+        window = self.ring.read(self.chunk_samples, keep=self.overlap_samples)
+        if window is None:
+            return []
+        # Check if we got meaningful audio (not just silence)
+        if np.max(np.abs(window)) <= MICROPHONE_ACTIVITY_THRESHOLD:
+            return []
+        # Detach from the ring before handing off to another thread
+        return [(np.array(window, dtype=np.int16), self.overlap_samples, start)]
+
+    def flush(self):
+        """Return the audio after the last full chunk as a shorter chunk."""
+        start = self.ring.read_position
+        remaining = self.ring.write_position - start
+        if remaining <= self.overlap_samples:
+            return []
+        window = self.ring.read(remaining)
+        if window is None or np.max(np.abs(window)) <= MICROPHONE_ACTIVITY_THRESHOLD:
+            return []
+        return [(np.array(window, dtype=np.int16), self.overlap_samples, start)]
+
+
+def frame_features(frames):
+    """Vectorized per-frame energy (dBFS) and zero-crossing rate.
+
+    Args:
+        frames: int16 array of shape ``(n_frames, frame_samples)``
+
+    Returns:
+        tuple: (energy_db, zcr) arrays of length ``n_frames``
+    """
+    samples = frames.astype(np.float32) / 32768.0
+    rms = np.sqrt(np.mean(samples * samples, axis=1))
+    energy_db = 20.0 * np.log10(rms + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (
+        frames.shape[1] - 1
+    )
+    return energy_db, zcr
+
+
+class VadSegmenter:
+    """Streaming voice-activity segmenter over the capture ring buffer.
+
+    Frames are classified as speech when their energy is above an adaptive
+    threshold (noise floor + margin, never below ``VAD_ENERGY_THRESHOLD_DB``),
+    or slightly below it with a high zero-crossing rate (unvoiced consonants).
+    An utterance ends after ``VAD_HANGOVER_DURATION`` of non-speech, and is
+    cut early at ``VAD_MAX_UTTERANCE_DURATION``. Utterances shorter than
+    ``VAD_MIN_UTTERANCE_DURATION`` are discarded as clicks/noise.
+
+    Utterance audio stays in the ring until it is emitted; the ring read
+    cursor is only released up to the start of the utterance in progress.
+    """
+
+    def __init__(self, ring, samplerate: int):
+        self.ring = ring
+        self.frame_samples = max(1, int(VAD_FRAME_DURATION * samplerate))
+        frames_per_batch = max(1, round(VAD_BATCH_DURATION / VAD_FRAME_DURATION))
+        self.batch_samples = self.frame_samples * frames_per_batch
+        self.hangover_frames = max(
+            1, round(VAD_HANGOVER_DURATION / VAD_FRAME_DURATION)
+        )
+        self.pre_roll_samples = int(VAD_PRE_ROLL_DURATION * samplerate)
+        self.min_samples = int(VAD_MIN_UTTERANCE_DURATION * samplerate)
+        self.max_samples = int(VAD_MAX_UTTERANCE_DURATION * samplerate)
+
+        self.noise_floor_db = VAD_ENERGY_THRESHOLD_DB - VAD_NOISE_MARGIN_DB
+        self._position = ring.read_position  # analysis cursor (absolute)
+        self._utterance_start = None
+        self._speech_start = None
+        self._speech_end = None
+        self._silent_frames = 0
+
+    @property
+    def next_position(self) -> int:
+        return self._position + self.batch_samples
+
+    @property
+    def threshold_db(self) -> float:
+        return max(
+            VAD_ENERGY_THRESHOLD_DB, self.noise_floor_db + VAD_NOISE_MARGIN_DB
+        )
+
+    def _classify(self, energy_db, zcr):
+        speech = np.empty(energy_db.shape[0], dtype=bool)
+        for i, (db, rate) in enumerate(zip(energy_db, zcr)):
+            threshold = self.threshold_db
+            is_speech = db > threshold or (
+                db > threshold - VAD_NOISE_MARGIN_DB / 2 and rate > VAD_ZCR_THRESHOLD
+            )
+            if not is_speech:
+                # Track the noise floor: drop fast, rise slowly
+                if db < self.noise_floor_db:
+                    self.noise_floor_db = db
+                else:
+                    self.noise_floor_db += 0.05 * (db - self.noise_floor_db)
+            speech[i] = is_speech
+        return speech
+
+    def _emit(self, start, end, segments):
+        # Judge the length on the detected speech, not pre-roll/hangover padding
+        if self._speech_end - self._speech_start < self.min_samples:
+            return
+        start = max(start, self.ring.read_position)
+        audio = self.ring.peek_range(start, end)
+        if audio is not None:
+            segments.append((np.array(audio, dtype=np.int16), 0, start))
+
+    def process(self):
+        available = self.ring.write_position - self._position
+        n_frames = available // self.frame_samples
+        if n_frames <= 0:
+            return []
+
+        start = max(self._position, self.ring.read_position)
+        if start != self._position:
+            # The writer lapped us; resynchronise on a frame boundary
+            self._position = start
+            n_frames = (self.ring.write_position - start) // self.frame_samples
+            if n_frames <= 0:
+                return []
+
+        end = self._position + n_frames * self.frame_samples
+        frames = self.ring.peek_range(self._position, end)
+        if frames is None:
+            return []
+        frames = frames.reshape(n_frames, self.frame_samples)
+        energy_db, zcr = frame_features(frames)
+        speech = self._classify(energy_db, zcr)
+
+        segments = []
+        for i, is_speech in enumerate(speech):
+            frame_start = self._position + i * self.frame_samples
+            frame_end = frame_start + self.frame_samples
+
+            if self._utterance_start is None:
+                if is_speech:
+                    self._utterance_start = max(
+                        frame_start - self.pre_roll_samples, self.ring.read_position
+                    )
+                    self._speech_start = frame_start
+                    self._speech_end = frame_end
+                    self._silent_frames = 0
+                continue
+
+            if is_speech:
+                self._silent_frames = 0
+                self._speech_end = frame_end
+            else:
+                self._silent_frames += 1
+
+            if self._silent_frames >= self.hangover_frames:
+                self._emit(self._utterance_start, frame_end, segments)
+                self._utterance_start = None
+            elif frame_end - self._utterance_start >= self.max_samples:
+                # Forced cut at the length limit; the utterance continues
+                self._emit(self._utterance_start, frame_end, segments)
+                self._utterance_start = frame_end
+                self._speech_start = frame_end
+                self._speech_end = frame_end
+
+        self._position = end
+        if self._utterance_start is not None:
+            self.ring.release_to(self._utterance_start)
+        else:
+            self.ring.release_to(self._position - self.pre_roll_samples)
+        return segments
+
+    def flush(self):
+        """Analyse what is left and emit the utterance still open at Stop."""
+        segments = self.process()
+        if self._utterance_start is not None:
+            self._emit(self._utterance_start, self._position, segments)
+            self._utterance_start = None
+        return segments
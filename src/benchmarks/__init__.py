@@ -0,0 +1 @@
+"""Offline benchmark harnesses, runnable with ``python -m src.benchmarks.<name>``."""
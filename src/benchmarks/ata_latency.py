@@ -0,0 +1,161 @@
+"""
+Benchmark: end-to-end ATA generation latency against a fake Ollama server.
+
+Starts ``FakeOllamaServer`` in-process (or targets ``--url``), points an
+``OllamaService`` at it with the response cache disabled and runs
+``generate_meeting_minutes`` on a synthetic transcript, reporting latency
+percentiles, time to first token and throughput. Longer ``--minutes`` make
+the transcript exceed ``num_ctx`` and exercise the map-reduce path.
+
+Usage:
+    python -m src.benchmarks.ata_latency [--requests 20] [--concurrency 2]
+        [--minutes 10] [--ttft 0.2] [--tps 50] [--failure-rate 0.0]
+        [--no-stream] [--url http://host:11434]
+"""
+
+import argparse
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.metrics import LatencyStats
+from src.services import OllamaService
+
+from .fake_ollama import FakeOllamaServer, FakeOllamaSettings
+
+_WORDS = (
+    "então vamos revisar o cronograma da entrega com a equipe de vendas e "
+    "definir quem fica responsável pelo relatório do cliente na próxima semana"
+).split()
+
+
+def synthetic_transcript(minutes: float, lines_per_minute: int = 6, seed=0) -> str:
+    """Transcript in the recorder's format, two speakers, ``minutes`` long."""
+    rng = random.Random(seed)
+    lines = ["# Meeting Transcript", "", "Started: 2025-01-01 10:00:00", ""]
+    total = int(minutes * lines_per_minute)
+    for i in range(total):
+        seconds = int(i * 60 / lines_per_minute)
+        hours, rest = divmod(seconds, 3600)
+        stamp = f"{10 + hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+        mic = "Mic1" if rng.random() < 0.6 else "Mic2"
+        text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 18)))
+        lines.append(f"- [{stamp}] [{mic}] {text}")
+    return "\n".join(lines) + "\n"
+
+
+def run(
+    requests: int = 20,
+    concurrency: int = 2,
+    minutes: float = 10,
+    stream: bool = True,
+    url: str = None,
+    settings: FakeOllamaSettings = None,
+    model_name: str = "qwen3:8b",
+) -> dict:
+    server = None
+    if url is None:
+        server = FakeOllamaServer(settings=settings).start()
+        url = server.url
+    try:
+        service = OllamaService(model_name=model_name, base_url=url)
+        service.response_cache = None  # every request must reach the server
+        service.config.setdefault("ollama", {})["base_urls"] = []
+        service.set_base_url(url)
+        transcript = synthetic_transcript(minutes)
+
+        latency = LatencyStats()
+        ttft = LatencyStats()
+        tokens = []
+        failures = []
+
+        def _one(_):
+            start = time.perf_counter()
+            result = service.generate_meeting_minutes(
+                transcript, stream=stream, use_cache=False
+            )
+            elapsed = time.perf_counter() - start
+            if not result.get("success"):
+                failures.append(result.get("error"))
+                return
+            latency.record(elapsed)
+            metrics = result.get("metrics") or {}
+            if metrics.get("ttft") is not None:
+                ttft.record(metrics["ttft"])
+            if metrics.get("tokens"):
+                tokens.append(metrics["tokens"])
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            list(executor.map(_one, range(requests)))
+        wall = time.perf_counter() - started
+    finally:
+        if server is not None:
+            server.stop()
+
+    mode = "streaming" if stream else "blocking"
+    print(
+        f"{requests} ATAs ({mode}, {minutes:g} min transcript, "
+        f"concurrency {concurrency}) against {url}"
+    )
+    for label, stats in (("end-to-end", latency), ("first token", ttft)):
+        if not stats.count:
+            continue
+        snap = stats.snapshot()
+        print(
+            f"  {label:<12} p50={snap['p50']:.2f}s p90={stats.percentile(90):.2f}s "
+            f"p95={snap['p95']:.2f}s p99={stats.percentile(99):.2f}s "
+            f"max={snap['max']:.2f}s mean={snap['mean']:.2f}s"
+        )
+    token_rate = f", {sum(tokens) / wall:.1f} tok/s" if tokens else ""
+    print(
+        f"  throughput   {latency.count / wall * 60:.1f} ATAs/min{token_rate}; "
+        f"failed={len(failures)} in {wall:.1f}s"
+    )
+    if server is not None:
+        print(f"  server       {server.requests}")
+    return {
+        "latency": latency.snapshot(),
+        "ttft": ttft.snapshot(),
+        "failed": len(failures),
+        "wall_seconds": wall,
+        "server_requests": dict(server.requests) if server is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--minutes", type=float, default=10)
+    parser.add_argument("--no-stream", action="store_true")
+    parser.add_argument("--url", default=None, help="Use this server instead")
+    parser.add_argument("--model", default="qwen3:8b")
+    parser.add_argument("--ttft", type=float, default=0.2)
+    parser.add_argument("--tps", type=float, default=50.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--load", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    run(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        minutes=args.minutes,
+        stream=not args.no_stream,
+        url=args.url,
+        settings=FakeOllamaSettings(
+            ttft=args.ttft,
+            tokens_per_second=args.tps,
+            failure_rate=args.failure_rate,
+            load_seconds=args.load,
+            seed=args.seed,
+        ),
+        model_name=args.model,
+    )
+
+
+if __name__ == "__main__":
+    main()
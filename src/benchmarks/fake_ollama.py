@@ -0,0 +1,391 @@
+"""
+Stand-in Ollama HTTP server with deterministic latency and throughput.
+
+Speaks enough of the Ollama API for ``OllamaService``: ``/api/tags``,
+``/api/ps``, ``/api/chat`` and ``/api/generate`` (streaming and not) and
+``/api/pull``. Time to first token, tokens per second, model load time and
+the failure rate are configurable, and the answer is a canned text, so the
+ATA path can be measured without a real Ollama host.
+
+Usage:
+    python -m src.benchmarks.fake_ollama [--port 11435] [--ttft 0.3]
+        [--tps 40] [--failure-rate 0.0] [--load 2.0] [--output-file ata.md]
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_MODELS = ["qwen3:8b", "llama3.2:latest"]
+
+DEFAULT_OUTPUT = """<think>
+Organizar a transcrição por temas.
+</think>
+# Ata da Reunião
+
+## Tema 1: Planejamento do trimestre
+
+**Resumo:** A equipe revisou as metas do trimestre e os prazos das entregas.
+
+**Pontos principais:**
+- Revisão das metas de vendas
+- Ajuste do cronograma de entregas
+
+**Decisões:**
+- Manter a data de lançamento
+
+**Ações:**
+- Atualizar o cronograma até sexta-feira
+
+## Tema 2: Próximos passos
+
+**Resumo:** Foram definidos os responsáveis pelas próximas tarefas.
+
+**Pontos principais:**
+- Distribuição das tarefas entre as equipes
+"""
+
+_TOKEN = re.compile(r"\s*\S+|\s+")
+
+
+def tokenize(text: str) -> list:
+    """Split text into word-sized tokens that concatenate back to it."""
+    return _TOKEN.findall(text)
+
+
+class FakeOllamaSettings:
+    """Behaviour of the fake server; can be changed while it runs.
+
+    Args:
+        ttft: Seconds before the first token (prompt processing)
+        tokens_per_second: Generation speed after the first token
+        failure_rate: Probability (0-1) that a chat/generate request fails
+            with HTTP 500
+        load_seconds: Extra delay of the first request for each model,
+            reported as ``load_duration``
+        outputs: Canned answers, used in turn
+        models: Model names returned by ``/api/tags``
+        seed: Seed for the failure draws
+    """
+
+    def __init__(
+        self,
+        ttft: float = 0.2,
+        tokens_per_second: float = 50.0,
+        failure_rate: float = 0.0,
+        load_seconds: float = 0.0,
+        outputs=None,
+        models=None,
+        seed: int = None,
+    ):
+        self.ttft = ttft
+        self.tokens_per_second = tokens_per_second
+        self.failure_rate = failure_rate
+        self.load_seconds = load_seconds
+        self.outputs = list(outputs or [DEFAULT_OUTPUT])
+        self.models = list(models or DEFAULT_MODELS)
+        self.seed = seed
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeOllama/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def fake(self) -> "FakeOllamaServer":
+        return self.server.fake
+
+    # --- Responses ---
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _send_line(self, payload: dict) -> None:
+        line = (json.dumps(payload) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.flush()
+
+    def _end_stream(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    # --- Routes ---
+    def do_GET(self):
+        self.fake.count(self.path)
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": self.fake.model_entries()})
+        elif self.path == "/api/ps":
+            self._send_json(200, {"models": self.fake.model_entries(loaded=True)})
+        elif self.path == "/api/version":
+            self._send_json(200, {"version": "0.0.0-fake"})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        self.fake.count(self.path)
+        try:
+            request = self._read_body()
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON"})
+            return
+        if self.path == "/api/chat":
+            messages = request.get("messages") or []
+            prompt = "".join(m.get("content") or "" for m in messages)
+            self._generate(request, prompt, chat=True)
+        elif self.path == "/api/generate":
+            self._generate(request, request.get("prompt") or "", chat=False)
+        elif self.path == "/api/pull":
+            self._pull(request)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def _pull(self, request: dict) -> None:
+        model = request.get("model") or request.get("name") or ""
+        self.fake.add_model(model)
+        steps = ["pulling manifest", "verifying sha256 digest", "success"]
+        if request.get("stream", True):
+            self._start_stream()
+            for status in steps:
+                self._send_line({"status": status})
+            self._end_stream()
+        else:
+            self._send_json(200, {"status": "success"})
+
+    def _generate(self, request: dict, prompt: str, chat: bool) -> None:
+        fake = self.fake
+        settings = fake.settings
+        model = request.get("model") or ""
+        if model not in settings.models:
+            self._send_json(404, {"error": f"model '{model}' not found"})
+            return
+        if fake.should_fail():
+            self._send_json(500, {"error": "injected failure"})
+            return
+
+        started = time.monotonic()
+        load = fake.load(model)
+        if load:
+            time.sleep(load)
+        # An empty generate prompt only loads the model (warm-up)
+        tokens = [] if not chat and not prompt else tokenize(fake.next_output())
+        stream = request.get("stream", True)
+        if tokens:
+            time.sleep(settings.ttft)
+        tps = settings.tokens_per_second
+        interval = 1.0 / tps if tps else 0.0
+
+        def _message(text: str) -> dict:
+            base = {"model": model, "created_at": _now()}
+            if chat:
+                base["message"] = {"role": "assistant", "content": text}
+            else:
+                base["response"] = text
+            base["done"] = False
+            return base
+
+        def _final() -> dict:
+            final = _message("")
+            total_ns = int((time.monotonic() - started) * 1e9)
+            final.update(
+                done=True,
+                done_reason="stop" if tokens else "load",
+                total_duration=total_ns,
+                load_duration=int(load * 1e9),
+                prompt_eval_count=max(1, len(prompt) // 4),
+                prompt_eval_duration=int(settings.ttft * 1e9) if tokens else 0,
+                eval_count=len(tokens),
+                eval_duration=int(len(tokens) * interval * 1e9),
+            )
+            return final
+
+        if not stream:
+            time.sleep(len(tokens) * interval)
+            final = _final()
+            text = "".join(tokens)
+            if chat:
+                final["message"]["content"] = text
+            else:
+                final["response"] = text
+            self._send_json(200, final)
+            return
+
+        self._start_stream()
+        try:
+            for i, token in enumerate(tokens):
+                if i:
+                    time.sleep(interval)
+                self._send_line(_message(token))
+            self._send_line(_final())
+            self._end_stream()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client cancelled the stream
+            fake.count("cancelled")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class FakeOllamaServer:
+    """Threaded fake Ollama server; use as a context manager or start/stop.
+
+    ``requests`` counts calls per path (plus "failures" and "cancelled").
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, settings=None):
+        self.settings = settings or FakeOllamaSettings()
+        self.requests = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(self.settings.seed)
+        self._outputs = itertools.cycle(self.settings.outputs)
+        self._loaded = set()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOllamaServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True, name="FakeOllama"
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- State used by the handler ---
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            failed = self._random.random() < self.settings.failure_rate
+        if failed:
+            self.count("failures")
+        return failed
+
+    def next_output(self) -> str:
+        with self._lock:
+            return next(self._outputs)
+
+    def load(self, model: str) -> float:
+        """Seconds to wait for loading ``model`` (0 once it is loaded)."""
+        with self._lock:
+            if model in self._loaded:
+                return 0.0
+            self._loaded.add(model)
+        return self.settings.load_seconds
+
+    def add_model(self, model: str) -> None:
+        with self._lock:
+            if model and model not in self.settings.models:
+                self.settings.models.append(model)
+
+    def model_entries(self, loaded: bool = False) -> list:
+        with self._lock:
+            names = [
+                m for m in self.settings.models if not loaded or m in self._loaded
+            ]
+        return [
+            {
+                "name": name,
+                "model": name,
+                "modified_at": _now(),
+                "size": 0,
+                "digest": "0" * 64,
+                "details": {"format": "gguf", "family": "fake"},
+            }
+            for name in names
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--ttft", type=float, default=0.2)
+    parser.add_argument("--tps", type=float, default=50.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--load", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--output-file",
+        action="append",
+        default=[],
+        help="Canned answer (repeat to rotate between several)",
+    )
+    args = parser.parse_args()
+
+    outputs = []
+    for path in args.output_file:
+        with open(path, "r", encoding="utf-8") as f:
+            outputs.append(f.read())
+    settings = FakeOllamaSettings(
+        ttft=args.ttft,
+        tokens_per_second=args.tps,
+        failure_rate=args.failure_rate,
+        load_seconds=args.load,
+        outputs=outputs,
+        seed=args.seed,
+    )
+    server = FakeOllamaServer(args.host, args.port, settings)
+    print(f"Fake Ollama listening on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
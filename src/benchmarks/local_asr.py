@@ -0,0 +1,151 @@
+"""
+Benchmark: real-time factor per CPU core of the offline recognizers.
+
+Loads the backend once per thread count (the load and warm-up are reported
+separately), then transcribes the same chunks with ``--concurrency``
+simultaneous callers, like the transcription worker pool does. The real-time
+factor is wall seconds per audio second; multiplied by the number of cores
+it gives core-seconds per audio second, the figure to size a machine with.
+
+Chunks are taken from ``--wav`` (cut into CHUNK_DURATION pieces) or
+synthesized. Options for the backend default to the config.json
+"transcription" section.
+
+Usage:
+    python -m src.benchmarks.local_asr [--backend whisper] [--model tiny]
+        [--threads 1 2 4] [--concurrency 2] [--chunks 12] [--wav file.wav]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import speech_recognition as sr
+
+from src.config_pkg import CHUNK_DURATION
+from src.transcription import create_recognizer
+
+from .upload_encoding import synthetic_chunk
+
+SAMPLE_RATE = 16000
+
+
+def _load_chunks(wav, count, duration):
+    if wav:
+        from src.audio.replay import read_wav
+        from src.audio.resample import resample
+
+        audio, rate = read_wav(wav)
+        if rate != SAMPLE_RATE:
+            audio = resample(audio, rate, SAMPLE_RATE)
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+        size = int(duration * SAMPLE_RATE)
+        chunks = [pcm[i : i + size] for i in range(0, pcm.shape[0] - size + 1, size)]
+        return (chunks * count)[:count] if chunks else []
+    return [synthetic_chunk(SAMPLE_RATE, duration) for _ in range(count)]
+
+
+def _config_options(backend):
+    config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config.json")
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            return dict(json.load(f).get("transcription", {}).get(backend) or {})
+    except (OSError, ValueError):
+        return {}
+
+
+def run(backend, options, threads, concurrency, chunks, language="pt-BR"):
+    audio_seconds = sum(c.shape[0] for c in chunks) / SAMPLE_RATE
+    print(
+        f"{backend}: {len(chunks)} chunks, {audio_seconds:.0f}s of audio, "
+        f"concurrency {concurrency}"
+    )
+    print(
+        f"  {'cores':>5} {'load':>7} {'wall':>7} {'RTF':>6} {'RTF/core':>9} "
+        f"{'p50':>6} {'max':>6} {'batches':>7} {'empty':>5}"
+    )
+    results = []
+    for cores in threads:
+        # Vosk has no thread setting; its parallelism is the caller count
+        if backend == "whisper":
+            options = dict(options, cpu_threads=cores)
+            workers = concurrency
+        else:
+            workers = cores
+        started = time.perf_counter()
+        recognizer = create_recognizer(backend, **options)
+        load = time.perf_counter() - started
+        timings = []
+        empty = 0
+
+        def _one(chunk):
+            nonlocal empty
+            begin = time.perf_counter()
+            try:
+                recognizer.recognize(chunk, SAMPLE_RATE, language)
+            except sr.UnknownValueError:
+                empty += 1
+            timings.append(time.perf_counter() - begin)
+
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                list(executor.map(_one, chunks))
+            wall = time.perf_counter() - started
+            stats = recognizer.stats() if hasattr(recognizer, "stats") else {}
+        finally:
+            recognizer.close()
+
+        timings.sort()
+        rtf = wall / audio_seconds if audio_seconds else 0.0
+        row = {
+            "cores": cores,
+            "load_seconds": load,
+            "wall_seconds": wall,
+            "rtf": rtf,
+            "rtf_per_core": rtf * cores,
+            "batches": stats.get("batches"),
+            "empty": empty,
+        }
+        results.append(row)
+        print(
+            f"  {cores:>5} {load:>6.1f}s {wall:>6.1f}s {rtf:>6.3f} "
+            f"{rtf * cores:>9.3f} {timings[len(timings) // 2]:>5.2f}s "
+            f"{timings[-1]:>5.2f}s {str(row['batches'] or '-'):>7} {empty:>5}"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", choices=("whisper", "vosk"), default="whisper")
+    parser.add_argument("--model", help="Whisper model size or path")
+    parser.add_argument("--model-path", help="Vosk model directory")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--chunks", type=int, default=12)
+    parser.add_argument("--duration", type=float, default=CHUNK_DURATION)
+    parser.add_argument("--batch-size", type=int, help="Whisper chunks per window")
+    parser.add_argument("--wav", help="Cut chunks from this recording")
+    parser.add_argument("--language", default="pt-BR")
+    args = parser.parse_args()
+
+    options = _config_options(args.backend)
+    if args.model:
+        options["model"] = args.model
+    if args.model_path:
+        options["model_path"] = args.model_path
+    if args.batch_size:
+        options["batch_size"] = args.batch_size
+
+    chunks = _load_chunks(args.wav, args.chunks, args.duration)
+    if not chunks:
+        parser.error(f"{args.wav} is shorter than one {args.duration}s chunk")
+    run(args.backend, options, args.threads, args.concurrency, chunks, args.language)
+
+
+if __name__ == "__main__":
+    main()
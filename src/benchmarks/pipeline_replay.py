@@ -0,0 +1,200 @@
+"""
+Benchmark: capture-to-transcript latency of the real-time pipeline.
+
+Replays WAV files through ``replay_wav_realtime`` (same resampling,
+segmentation and worker pool as live recording) with a ``FakeRecognizer``
+standing in for the speech service, so runs are reproducible and need no
+network. Reports how long each chunk waited from becoming available to
+having its text, the real-time factor and the pool/executor counters.
+Without WAV arguments a synthetic speech-like recording is generated.
+
+Usage:
+    python -m src.benchmarks.pipeline_replay [file.wav ...] [--speed 4]
+        [--latency 0.8] [--jitter 0.2] [--distribution lognormal]
+        [--error-rate 0.05] [--seconds 120] [--real-recognizer]
+"""
+
+import argparse
+import itertools
+import os
+import tempfile
+import threading
+import time
+import wave
+
+import numpy as np
+
+from src.audio.replay import replay_wav_realtime
+from src.metrics import LatencyStats
+from src.transcription import (
+    FakeRecognizer,
+    TranscriptionWorkerPool,
+    get_transcription_executor_stats,
+    set_recognizer,
+    transcribe_audio_async,
+)
+
+from .upload_encoding import synthetic_chunk
+
+
+def write_synthetic_wav(path, seconds=120.0, samplerate=48000, seed=0):
+    """Speech-like bursts of 1-6 s separated by 0.3-1.5 s pauses, 16-bit mono."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    total = 0
+    while total < seconds * samplerate:
+        burst = synthetic_chunk(samplerate, rng.uniform(1.0, 6.0))
+        pause = rng.normal(0, 60, int(rng.uniform(0.3, 1.5) * samplerate))
+        parts += [burst, pause.astype(np.int16)]
+        total += burst.shape[0] + pause.shape[0]
+    audio = np.concatenate(parts)[: int(seconds * samplerate)]
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(samplerate)
+        wav.writeframes(audio.tobytes())
+    return path
+
+
+def run(paths, speed=1.0, recognizer=None, language="pt-BR"):
+    """Replay ``paths`` concurrently (one simulated device each)."""
+    previous = set_recognizer(recognizer) if recognizer is not None else None
+    pool = TranscriptionWorkerPool()
+    sequence = itertools.count()
+    stop_event = threading.Event()
+    latency = LatencyStats()
+    results = {"text": 0, "silent": 0, "errors": 0, "discarded": 0}
+    lock = threading.Lock()
+    time_scale = 1.0 / speed if speed > 0 else 0.0
+
+    def on_audio_chunk(device_index, audio_chunk, samplerate, seq, captured_at):
+        text = transcribe_audio_async(audio_chunk, samplerate, language)
+        available_at = captured_at + len(audio_chunk) / samplerate * time_scale
+        with lock:
+            latency.record(time.time() - available_at)
+            if text is None:
+                results["silent"] += 1
+            elif text.startswith(("Network error", "Transcription timeout", "Async")):
+                results["errors"] += 1
+            else:
+                results["text"] += 1
+
+    def on_chunk_discarded(*_):
+        with lock:
+            results["discarded"] += 1
+
+    replays = {}
+
+    def _replay(device_index, path):
+        replays[device_index] = replay_wav_realtime(
+            path,
+            on_audio_chunk,
+            stop_event,
+            speed=speed,
+            device_index=device_index,
+            worker_pool=pool,
+            sequence=sequence,
+            on_chunk_discarded=on_chunk_discarded,
+        )
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=_replay, args=(i, path), name=f"Replay-{i}")
+        for i, path in enumerate(paths)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Wait for the chunks still queued or being transcribed
+        while True:
+            stats = pool.stats()
+            if not stats["queued"] and not stats["in_flight"]:
+                break
+            time.sleep(0.05)
+    except KeyboardInterrupt:
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        pool.shutdown(cancel_pending=True)
+        if recognizer is not None:
+            set_recognizer(previous)
+    wall = time.perf_counter() - started
+
+    audio_seconds = sum(r["audio_seconds"] for r in replays.values())
+    dropped = sum(r["dropped_samples"] for r in replays.values())
+    pace = f"{speed:g}x" if speed > 0 else "unpaced"
+    rtf = wall / audio_seconds if audio_seconds else 0.0
+    print(
+        f"Replayed {len(paths)} file(s), {audio_seconds:.1f}s of audio at {pace} "
+        f"in {wall:.1f}s (real-time factor {rtf:.3f})"
+    )
+    if latency.count:
+        snap = latency.snapshot()
+        print(
+            f"  chunk latency p50={snap['p50']:.2f}s p90={latency.percentile(90):.2f}s "
+            f"p95={snap['p95']:.2f}s p99={latency.percentile(99):.2f}s "
+            f"max={snap['max']:.2f}s over {latency.count} chunks"
+        )
+    print(
+        f"  results      text={results['text']} silent={results['silent']} "
+        f"errors={results['errors']} discarded={results['discarded']} "
+        f"ring_dropped_samples={dropped}"
+    )
+    print(f"  {pool.format_summary()}")
+    print(f"  Executor: {get_transcription_executor_stats()}")
+    return {
+        "latency": latency.snapshot(),
+        "results": results,
+        "audio_seconds": audio_seconds,
+        "wall_seconds": wall,
+        "pool": pool.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("wavs", nargs="*", help="WAV files (synthetic if none)")
+    parser.add_argument("--speed", type=float, default=1.0, help="0 = unpaced")
+    parser.add_argument("--devices", type=int, default=1, help="Synthetic files")
+    parser.add_argument("--seconds", type=float, default=120.0)
+    parser.add_argument("--latency", type=float, default=0.8)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument(
+        "--distribution", choices=("normal", "lognormal", "uniform"), default="normal"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--no-speech-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--real-recognizer",
+        action="store_true",
+        help="Use the configured TRANSCRIPTION_BACKEND instead of the fake",
+    )
+    args = parser.parse_args()
+
+    recognizer = None
+    if not args.real_recognizer:
+        recognizer = FakeRecognizer(
+            latency_mean=args.latency,
+            latency_jitter=args.jitter,
+            distribution=args.distribution,
+            error_rate=args.error_rate,
+            no_speech_rate=args.no_speech_rate,
+            seed=args.seed,
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = args.wavs or [
+            write_synthetic_wav(
+                os.path.join(tmp, f"synthetic-{i}.wav"), args.seconds, seed=i
+            )
+            for i in range(args.devices)
+        ]
+        run(paths, speed=args.speed, recognizer=recognizer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: per-chunk upload encoding cost.
+
+Compares the legacy path (``sr.AudioData.get_flac_data``, which spawns the
+external ``flac`` binary for every chunk) with the in-process ``audio/l16``
+encoding used by ``recognize_google_pcm``. No network access is needed; only
+the encoding step that precedes each upload is timed.
+
+Usage:
+    python -m src.benchmarks.upload_encoding [--iterations 20] [--rate 48000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import speech_recognition as sr
+
+from src.config_pkg import CHUNK_DURATION
+from src.transcription.google_upload import encode_l16
+
+
+def synthetic_chunk(samplerate, duration):
+    """Speech-like test signal: a few harmonics with noise, int16."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(samplerate * duration)) / samplerate
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)
+    voiced = sum(
+        np.sin(2 * np.pi * f * t) / (i + 1) for i, f in enumerate((140, 280, 560))
+    )
+    signal = envelope * voiced * 6000 + rng.normal(0, 300, t.shape)
+    return np.clip(signal, -32768, 32767).astype(np.int16)
+
+
+def _time(fn, iterations):
+    timings = []
+    payload = b""
+    for _ in range(iterations):
+        start = time.perf_counter()
+        payload = fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "mean_ms": 1000 * sum(timings) / len(timings),
+        "p50_ms": 1000 * timings[len(timings) // 2],
+        "max_ms": 1000 * timings[-1],
+        "bytes": len(payload),
+    }
+
+
+def run(iterations=20, samplerate=48000, duration=CHUNK_DURATION):
+    chunk = synthetic_chunk(samplerate, duration)
+    audio_sr = sr.AudioData(chunk.tobytes(), samplerate, 2)
+
+    results = {
+        "flac (subprocess)": _time(
+            lambda: audio_sr.get_flac_data(convert_width=2), iterations
+        ),
+        "l16 (in-process)": _time(lambda: encode_l16(chunk), iterations),
+    }
+
+    print(f"{duration}s chunk @ {samplerate} Hz, {iterations} iterations")
+    for name, r in results.items():
+        print(
+            f"  {name:<18} mean={r['mean_ms']:8.2f}ms p50={r['p50_ms']:8.2f}ms "
+            f"max={r['max_ms']:8.2f}ms payload={r['bytes'] / 1024:8.1f} KiB"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--rate", type=int, default=48000)
+    parser.add_argument("--duration", type=float, default=CHUNK_DURATION)
+    args = parser.parse_args()
+    run(args.iterations, args.rate, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Headless command-line entry points, runnable with ``python -m src.cli.<name>``."""
@@ -0,0 +1,230 @@
+"""
+Batch ATA regeneration over a directory (or glob) of transcripts.
+
+Regenerating the minutes of old meetings after a model change used to mean
+clicking "Regenerate ATA" once per file. This runs
+``OllamaService.generate_and_save_minutes`` headless over many transcripts,
+skipping those whose ATA is already newer than the transcript.
+
+Usage:
+    python -m src.cli.batch_ata [PATH_OR_GLOB ...] [--jobs 2] [--force]
+        [--fresh] [--model qwen3:8b] [--language pt-BR] [--ata-dir DIR]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.config_pkg import ata_path_for, meet_audio_dir
+from src.metrics import LatencyStats
+from src.services import OllamaService
+
+
+def find_transcripts(patterns) -> list:
+    """
+    Expand directories and glob patterns into transcript paths
+
+    A directory stands for every ``*.md`` file directly inside it.
+
+    Returns:
+        list: Unique, sorted file paths
+    """
+    found = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*.md")
+        for path in glob.glob(pattern, recursive=True):
+            if os.path.isfile(path):
+                found.add(os.path.abspath(path))
+    return sorted(found)
+
+
+def is_up_to_date(transcript_path: str, ata_path: str) -> bool:
+    """True if the ATA exists and is not older than its transcript."""
+    try:
+        return os.path.getmtime(ata_path) >= os.path.getmtime(transcript_path)
+    except OSError:
+        return False
+
+
+def run(
+    patterns,
+    jobs: int = None,
+    force: bool = False,
+    use_cache: bool = True,
+    model_name: str = None,
+    language: str = None,
+    ata_dir: str = None,
+) -> dict:
+    """
+    Regenerate the ATAs of every matching transcript
+
+    Returns:
+        dict: Counts, wall time and per-file results
+    """
+    service = OllamaService(model_name=model_name)
+    ollama_config = service.config.get("ollama", {})
+    jobs = max(1, int(jobs or ollama_config.get("ata_max_workers", 1)))
+    language = language or service.config.get("language", "pt-BR")
+    # Same folders as the GUI, including its config.json overrides
+    ata_dir = ata_dir or meet_audio_dir("ata", service.config)
+    os.makedirs(ata_dir, exist_ok=True)
+
+    transcripts = find_transcripts(
+        patterns or [meet_audio_dir("transcript", service.config)]
+    )
+    todo = []
+    skipped = 0
+    for path in transcripts:
+        ata_path = ata_path_for(path, ata_dir)
+        if not force and is_up_to_date(path, ata_path):
+            skipped += 1
+        else:
+            todo.append((path, ata_path))
+
+    print(
+        f"{len(transcripts)} transcripts, {skipped} up to date, "
+        f"{len(todo)} to generate with {service.model_name} ({jobs} at a time)"
+    )
+    latency = LatencyStats()
+    results = []
+    cancel_event = threading.Event()
+
+    def _generate(path, ata_path):
+        start = time.perf_counter()
+        result = service.generate_and_save_minutes(
+            path,
+            ata_path,
+            language=language,
+            use_cache=use_cache,
+            cancel_event=cancel_event,
+        )
+        return path, result, time.perf_counter() - start
+
+    started = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="Batch-ATA")
+    futures = []
+    try:
+        futures = [executor.submit(_generate, path, ata) for path, ata in todo]
+        for done, future in enumerate(as_completed(futures), 1):
+            path, result, seconds = future.result()
+            latency.record(seconds)
+            tokens = (result.get("metrics") or {}).get("tokens")
+            results.append(
+                {
+                    "transcript": path,
+                    "success": bool(result.get("success")),
+                    "cached": bool(result.get("cached")),
+                    "seconds": seconds,
+                    "tokens": tokens,
+                    "error": result.get("error"),
+                }
+            )
+            if result.get("success"):
+                outcome = "ok"
+            else:
+                outcome = f"FAILED: {result.get('error')}"
+            if result.get("cached"):
+                outcome += " (cached)"
+            print(
+                f"[{done}/{len(todo)}] {os.path.basename(path)} "
+                f"{seconds:.1f}s {outcome}"
+            )
+    except KeyboardInterrupt:
+        print("Interrupted, cancelling running generations...")
+        cancel_event.set()
+        for future in futures:
+            future.cancel()
+    finally:
+        executor.shutdown(wait=True)
+    wall = time.perf_counter() - started
+
+    succeeded = sum(1 for r in results if r["success"])
+    summary = {
+        "transcripts": len(transcripts),
+        "skipped": skipped,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "wall_seconds": wall,
+        "latency": latency.snapshot(),
+        "results": results,
+    }
+    _print_summary(summary)
+    return summary
+
+
+def _print_summary(summary: dict) -> None:
+    results = summary["results"]
+    wall = summary["wall_seconds"]
+    print()
+    if results:
+        print("Per-file latency:")
+        width = max(len(os.path.basename(r["transcript"])) for r in results)
+        for r in sorted(results, key=lambda r: r["seconds"], reverse=True):
+            tokens = f"{r['tokens']} tokens" if r["tokens"] is not None else ""
+            status = "ok" if r["success"] else "failed"
+            print(
+                f"  {os.path.basename(r['transcript']):<{width}} "
+                f"{r['seconds']:8.1f}s  {status:<6} {tokens}"
+            )
+    latency = summary["latency"]
+    per_minute = len(results) / wall * 60 if wall > 0 else 0.0
+    total_tokens = sum(r["tokens"] or 0 for r in results)
+    print(
+        f"Done: {summary['succeeded']} ok, {summary['failed']} failed, "
+        f"{summary['skipped']} skipped in {wall:.1f}s "
+        f"({per_minute:.2f} ATAs/min, "
+        f"{total_tokens / wall if wall > 0 else 0.0:.1f} tok/s overall)"
+    )
+    if results:
+        print(
+            f"Latency: mean={latency['mean']:.1f}s p50={latency['p50']:.1f}s "
+            f"p95={latency['p95']:.1f}s max={latency['max']:.1f}s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="Transcript directories or glob patterns "
+        "(default: the GUI transcript folder)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Concurrent generations (default: ollama.ata_max_workers)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Regenerate ATAs that are up to date"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Do not reuse cached LLM answers",
+    )
+    parser.add_argument("--model", default=None, help="Override ollama.model_name")
+    parser.add_argument("--language", default=None, help="Override language")
+    parser.add_argument("--ata-dir", default=None, help="Output folder for ATAs")
+    args = parser.parse_args()
+
+    summary = run(
+        args.paths,
+        jobs=args.jobs,
+        force=args.force,
+        use_cache=not args.fresh,
+        model_name=args.model,
+        language=args.language,
+        ata_dir=args.ata_dir,
+    )
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
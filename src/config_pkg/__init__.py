@@ -6,6 +6,7 @@ keeping the original `src.config` module as the single source of truth.
 
 # Re-export configuration for consumers importing from src.config_pkg
 from .config import *  # noqa: F401,F403
+from .paths import ata_path_for, documents_dir, meet_audio_dir  # noqa: F401
 
 __all__ = [name for name in globals() if not name.startswith("_")]
 
@@ -8,20 +8,68 @@ CHUNK_DURATION = 10  # Duration in seconds for each audio chunk
 OVERLAP_DURATION = 1  # Overlap duration in seconds
 SILENCE_THRESHOLD = 50  # Minimum amplitude to consider as meaningful audio
 
+# Segmentation Settings
+# "vad" cuts utterances at natural pauses (no overlap re-upload);
+# "fixed" cuts CHUNK_DURATION chunks with OVERLAP_DURATION overlap
+SEGMENTATION_MODE = "vad"
+VAD_FRAME_DURATION = 0.03  # Analysis frame length (seconds)
+VAD_BATCH_DURATION = 0.3  # How much new audio to analyse per wakeup (seconds)
+VAD_ENERGY_THRESHOLD_DB = -45  # Minimum frame energy considered speech (dBFS)
+VAD_NOISE_MARGIN_DB = 10  # Speech must be this far above the tracked noise floor
+VAD_ZCR_THRESHOLD = 0.25  # Zero-crossing rate that marks unvoiced speech frames
+VAD_HANGOVER_DURATION = 0.6  # Silence that ends an utterance (seconds)
+VAD_PRE_ROLL_DURATION = 0.2  # Audio kept before the detected speech onset (seconds)
+VAD_MIN_UTTERANCE_DURATION = 0.5  # Shorter utterances are discarded (seconds)
+VAD_MAX_UTTERANCE_DURATION = 15  # Longer utterances are cut (seconds)
+
 # Audio Quality Settings
 AUDIO_BLOCKSIZE = 512  # Smaller block size for lower latency
 AUDIO_LATENCY = "low"  # Request low latency mode
 AUDIO_DTYPE = "int16"  # Audio data type
+TRANSCRIPTION_SAMPLE_RATE = 16000  # Capture is downsampled to this rate (None = device rate)
+RESAMPLER_TAPS_PER_PHASE = 32  # Filter length per output phase of the resampler
+RING_BUFFER_DURATION = CHUNK_DURATION * 3  # Capacity of the capture ring buffer (seconds)
 
 # Speech Recognition Settings
 SPEECH_RECOGNITION_ENERGY_THRESHOLD = 200  # Lower threshold for sensitivity
 SPEECH_RECOGNITION_PAUSE_THRESHOLD = 0.3  # Shorter pause threshold for real-time
 SPEECH_RECOGNITION_PHRASE_THRESHOLD = 0.2  # Shorter phrase threshold
 
+# Upload format for the Google recognizer: "l16" posts raw PCM in-process,
+# "flac" uses speech_recognition's external flac encoder per chunk
+TRANSCRIPTION_UPLOAD_FORMAT = "l16"
+
+# Default speech recognition backend: "google" (Web Speech API), "whisper" /
+# "vosk" (offline CPU engines, optional packages) or "fake" (stand-in with
+# configurable latency, for benchmarks). config.json "transcription.backend"
+# overrides it per recording session
+TRANSCRIPTION_BACKEND = "google"
+
 # Transcription Timeout Settings
 TRANSCRIPTION_TIMEOUT = CHUNK_DURATION  # Operation timeout for transcription (seconds)
 ASYNC_TIMEOUT = CHUNK_DURATION * 1.1  # Async future timeout (seconds)
 SLOW_TRANSCRIPTION_THRESHOLD = 2
+# How long results wait for a slower earlier chunk before it is given up (seconds)
+TRANSCRIPT_REORDER_MAX_WAIT = ASYNC_TIMEOUT * 2
+# Max wait at Stop for chunks still queued or being transcribed (seconds)
+TRANSCRIPT_STOP_DRAIN_TIMEOUT = TRANSCRIPT_REORDER_MAX_WAIT * 2
+
+# Transcript File Writer Settings
+TRANSCRIPT_FLUSH_BYTES = 4096  # Write pending lines once this many bytes are queued
+TRANSCRIPT_FLUSH_INTERVAL = 1.0  # Max time a line waits before being written (seconds)
+TRANSCRIPT_FSYNC_INTERVAL = 30.0  # Max time between fsyncs while recording (seconds)
+
+# Failure Spool Settings - chunks whose transcription fails with a network
+# error or timeout are saved as WAV and retried in the background
+TRANSCRIPTION_SPOOL_ENABLED = True
+# First retry waits until the chunk's placeholder line is surely in the file
+SPOOL_RETRY_INITIAL_DELAY = TRANSCRIPT_REORDER_MAX_WAIT + TRANSCRIPT_FLUSH_INTERVAL * 5
+SPOOL_RETRY_MAX_DELAY = 300.0  # Cap of the exponential backoff (seconds)
+SPOOL_BREAKER_THRESHOLD = 3  # Consecutive failures that open the circuit breaker
+SPOOL_BREAKER_COOLDOWN = 120.0  # Seconds before a half-open probe request
+SPOOL_MAX_ATTEMPTS = 30  # Attempts per chunk before it is marked as failed
+# Transcript text of a spooled chunk until it is recovered; never sent to the LLM
+SPOOL_PLACEHOLDER_PREFIX = "[transcription pending #"
 
 # Aliases for consistent naming convention
 TRANSCRIPTION_OPERATION_TIMEOUT = TRANSCRIPTION_TIMEOUT  # Alias for consistent naming
@@ -44,6 +92,13 @@ DEFAULT_LANGUAGE = "pt-BR"  # Default language for transcription
 # Performance Settings
 MAX_TRANSCRIPTION_WORKERS = 2  # Number of parallel transcription workers
 TRANSCRIPTION_QUEUE_SIZE = 10  # Maximum size of transcription queue
+# Threads that talk to the recognizer (headroom for requests abandoned after a timeout)
+TRANSCRIPTION_EXECUTOR_WORKERS = MAX_TRANSCRIPTION_WORKERS * 2
+# What to do when the transcription queue is full:
+# "block", "drop_oldest" or "merge_adjacent"
+TRANSCRIPTION_OVERFLOW_POLICY = "merge_adjacent"
+# Upper bound for chunks merged by the "merge_adjacent" policy (seconds)
+TRANSCRIPTION_MAX_MERGED_DURATION = CHUNK_DURATION * 3
 
 
 def get_overlap_samples(samplerate):
@@ -72,6 +127,19 @@ def get_chunk_samples(samplerate):
     return int(CHUNK_DURATION * samplerate)
 
 
+def get_ring_buffer_samples(samplerate):
+    """
+    Calculate the capacity of the capture ring buffer based on sample rate.
+
+    Args:
+        samplerate (int): Audio sample rate
+
+    Returns:
+        int: Number of samples the ring buffer can hold
+    """
+    return int(RING_BUFFER_DURATION * samplerate)
+
+
 def get_test_samples(samplerate):
     """
     Calculate the number of samples for microphone test based on sample rate.
@@ -169,12 +237,69 @@ def validate_config():
     if OVERLAP_DURATION >= CHUNK_DURATION:
         raise ValueError("OVERLAP_DURATION must be less than CHUNK_DURATION")
 
+    if SEGMENTATION_MODE not in ("vad", "fixed"):
+        raise ValueError("SEGMENTATION_MODE must be vad or fixed")
+
+    if VAD_MIN_UTTERANCE_DURATION >= VAD_MAX_UTTERANCE_DURATION:
+        raise ValueError(
+            "VAD_MIN_UTTERANCE_DURATION must be less than VAD_MAX_UTTERANCE_DURATION"
+        )
+
+    if VAD_MAX_UTTERANCE_DURATION + VAD_BATCH_DURATION >= RING_BUFFER_DURATION:
+        raise ValueError("RING_BUFFER_DURATION must hold a full VAD utterance")
+
+    if TRANSCRIPTION_SAMPLE_RATE is not None and TRANSCRIPTION_SAMPLE_RATE < 8000:
+        raise ValueError("TRANSCRIPTION_SAMPLE_RATE must be at least 8000 Hz")
+
+    if RING_BUFFER_DURATION < CHUNK_DURATION * 2:
+        raise ValueError("RING_BUFFER_DURATION must hold at least two chunks")
+
     if TRANSCRIPTION_TIMEOUT <= 0:
         raise ValueError("TRANSCRIPTION_TIMEOUT must be positive")
 
     if ASYNC_TIMEOUT <= TRANSCRIPTION_TIMEOUT:
         raise ValueError("ASYNC_TIMEOUT should be greater than TRANSCRIPTION_TIMEOUT")
 
+    if MAX_TRANSCRIPTION_WORKERS <= 0:
+        raise ValueError("MAX_TRANSCRIPTION_WORKERS must be positive")
+
+    if TRANSCRIPTION_EXECUTOR_WORKERS < MAX_TRANSCRIPTION_WORKERS:
+        raise ValueError(
+            "TRANSCRIPTION_EXECUTOR_WORKERS must be at least MAX_TRANSCRIPTION_WORKERS"
+        )
+
+    if TRANSCRIPTION_QUEUE_SIZE <= 0:
+        raise ValueError("TRANSCRIPTION_QUEUE_SIZE must be positive")
+
+    if TRANSCRIPTION_OVERFLOW_POLICY not in ("block", "drop_oldest", "merge_adjacent"):
+        raise ValueError(
+            "TRANSCRIPTION_OVERFLOW_POLICY must be block, drop_oldest or merge_adjacent"
+        )
+
+    if TRANSCRIPTION_MAX_MERGED_DURATION < CHUNK_DURATION:
+        raise ValueError(
+            "TRANSCRIPTION_MAX_MERGED_DURATION must be at least CHUNK_DURATION"
+        )
+
+    if TRANSCRIPT_FLUSH_BYTES <= 0 or TRANSCRIPT_FLUSH_INTERVAL <= 0:
+        raise ValueError("Transcript flush thresholds must be positive")
+
+    if TRANSCRIPT_FSYNC_INTERVAL < TRANSCRIPT_FLUSH_INTERVAL:
+        raise ValueError(
+            "TRANSCRIPT_FSYNC_INTERVAL must be at least TRANSCRIPT_FLUSH_INTERVAL"
+        )
+
+    if SPOOL_RETRY_INITIAL_DELAY <= 0:
+        raise ValueError("SPOOL_RETRY_INITIAL_DELAY must be positive")
+
+    if SPOOL_RETRY_MAX_DELAY < SPOOL_RETRY_INITIAL_DELAY:
+        raise ValueError(
+            "SPOOL_RETRY_MAX_DELAY must be at least SPOOL_RETRY_INITIAL_DELAY"
+        )
+
+    if SPOOL_BREAKER_THRESHOLD <= 0 or SPOOL_MAX_ATTEMPTS <= 0:
+        raise ValueError("Spool breaker threshold and max attempts must be positive")
+
 
 def validate_speech_recognition_config():
     """
@@ -192,6 +317,12 @@ def validate_speech_recognition_config():
     if SPEECH_RECOGNITION_PHRASE_THRESHOLD <= 0:
         raise ValueError("SPEECH_RECOGNITION_PHRASE_THRESHOLD must be positive")
 
+    if TRANSCRIPTION_UPLOAD_FORMAT not in ("l16", "flac"):
+        raise ValueError("TRANSCRIPTION_UPLOAD_FORMAT must be l16 or flac")
+
+    if TRANSCRIPTION_BACKEND not in ("google", "whisper", "vosk", "fake"):
+        raise ValueError("TRANSCRIPTION_BACKEND must be google, whisper, vosk or fake")
+
 
 # Auto-validate configuration on import
 validate_config()
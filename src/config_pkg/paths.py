@@ -0,0 +1,45 @@
+"""
+Output folders shared by the GUI, the batch CLI and the on-disk caches.
+
+Everything lives under ``meet_audio`` in the user's Documents folder (the
+localized ``Documentos`` is preferred, then ``Documents``, else the home
+directory). ``transcript_dir`` and ``ata_dir`` in config.json move the
+transcript and ATA folders elsewhere.
+"""
+
+import os
+
+
+def documents_dir() -> str:
+    """The user's Documents folder, or the home directory if there is none."""
+    user_home = os.path.expanduser("~")
+    candidates = [
+        os.path.join(user_home, "Documentos"),
+        os.path.join(user_home, "Documents"),
+    ]
+    return next((p for p in candidates if os.path.isdir(p)), user_home)
+
+
+def meet_audio_dir(name: str, config: dict = None) -> str:
+    """
+    Folder ``Documents/meet_audio/<name>``
+
+    Args:
+        name: Sub-folder, e.g. "transcript", "ata" or "cache"
+        config: Main config; its ``<name>_dir`` entry overrides the default
+    """
+    override = (config or {}).get(f"{name}_dir")
+    if override:
+        return os.path.expanduser(override)
+    return os.path.join(documents_dir(), "meet_audio", name)
+
+
+def ata_path_for(transcript_path: str, ata_dir: str) -> str:
+    """ATA file for a transcript: ``<stamp>_transcript.md`` -> ``<stamp>_ata.md``."""
+    name = os.path.basename(transcript_path)
+    if name.endswith("_transcript.md"):
+        name = name.replace("_transcript.md", "_ata.md")
+    else:
+        stem, _ = os.path.splitext(name)
+        name = f"{stem}_ata.md"
+    return os.path.join(ata_dir, name)
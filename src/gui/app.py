@@ -1,4 +1,3 @@
-import threading
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 import json
@@ -13,6 +12,7 @@ from .mixins.microphone_mixin import MicrophoneTabMixin
 from .mixins.files_mixin import FilesMixin
 from .mixins.language_mixin import LanguageMixin
 from .mixins.menu_mixin import MenuActionsMixin
+from src.config_pkg import meet_audio_dir
 from src.services import OllamaService
 from src.i18n import get_translation_manager, set_global_language, t
 
@@ -101,6 +101,8 @@ class MicrophoneTranscriberGUI(
         self.migrate_old_mic_config()
         # Ensure service is synchronized with current config
         self.sync_ollama_service_with_config()
+        # ATA generations run through a bounded, persisted job queue
+        self.ata_jobs = self._create_ata_job_manager()
 
         # Create notebook for tabbed interface
         self.notebook = ttk.Notebook(self.root)
@@ -127,6 +129,15 @@ class MicrophoneTranscriberGUI(
         # Initialize recording controls state
         self.root.after(600, self.update_recording_controls_state)
 
+        # Resume ATA jobs left pending by the previous session
+        self.root.after(1500, self.ata_jobs.resume_pending)
+
+        # Load an offline speech model before the first recording needs it
+        self.root.after(1200, self._load_transcription_backend)
+
+        # Retry transcription chunks spooled by a previous session
+        self.root.after(2500, self._resume_transcript_spools)
+
         # Auto-start recording after everything is initialized
         self.root.after(3000, self.auto_start_recording)
 
@@ -146,9 +157,13 @@ class MicrophoneTranscriberGUI(
         self._selected_indices = []
 
         # Realtime transcript file state
-        self._file_write_lock = threading.Lock()
+        self._transcript_writer = None
         self._transcript_file_path = None
         self._last_transcript_file_path = None
+        self._rolling_summarizer = None
+        self._pending_rolling_summarizer = None
+        self._finishing_recording = False
+        self._model_warmer = None
 
         # Ensure Ollama config tab reflects current config
         self.load_config_tab_values()
@@ -266,10 +281,21 @@ class MicrophoneTranscriberGUI(
                     self.stop_realtime_recording()
                 except Exception:
                     pass
+                self._shutdown_ata_jobs()
+                self._close_transcript_spools()
                 self.root.destroy()
         else:
+            self._shutdown_ata_jobs()
+            self._close_transcript_spools()
             self.root.destroy()
 
+    def _shutdown_ata_jobs(self):
+        # Pending jobs stay in the state file and resume on the next start
+        try:
+            self.ata_jobs.shutdown()
+        except Exception:
+            pass
+
 
 def create_gui():
     """Factory function to create and return GUI instance"""
@@ -283,16 +309,8 @@ def run_gui():
     """
     # Create user Documents output directories before GUI starts
     try:
-        user_home = os.path.expanduser("~")
-        candidates = [
-            os.path.join(user_home, "Documentos"),
-            os.path.join(user_home, "Documents"),
-        ]
-        user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
-        transcript_dir = os.path.join(user_docs, "meet_audio", "transcript")
-        ata_dir = os.path.join(user_docs, "meet_audio", "ata")
-        os.makedirs(transcript_dir, exist_ok=True)
-        os.makedirs(ata_dir, exist_ok=True)
+        os.makedirs(meet_audio_dir("transcript"), exist_ok=True)
+        os.makedirs(meet_audio_dir("ata"), exist_ok=True)
     except Exception:
         # Non-fatal: proceed even if directory creation fails
         pass
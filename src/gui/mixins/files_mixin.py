@@ -2,6 +2,8 @@ import os
 from tkinter import filedialog, messagebox
 import tkinter as tk
 
+from src.config_pkg import documents_dir, meet_audio_dir
+
 
 class FilesMixin:
     """Transcript and ATA file listings and basic operations."""
@@ -12,25 +14,12 @@ class FilesMixin:
         return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
     def _get_transcript_dir(self) -> str:
-        # Save transcripts under the user's Documents folder by default.
-        # Prefer localized 'Documentos' then 'Documents', fallback to home.
-        user_home = os.path.expanduser("~")
-        candidates = [
-            os.path.join(user_home, "Documentos"),
-            os.path.join(user_home, "Documents"),
-        ]
-        user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
-        return os.path.join(user_docs, "meet_audio", "transcript")
+        # Documents/meet_audio/transcript unless config.json sets transcript_dir
+        return meet_audio_dir("transcript", self.config)
 
     def _get_ata_dir(self) -> str:
-        # Save ATA (meeting minutes) under the user's Documents folder by default.
-        user_home = os.path.expanduser("~")
-        candidates = [
-            os.path.join(user_home, "Documentos"),
-            os.path.join(user_home, "Documents"),
-        ]
-        user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
-        return os.path.join(user_docs, "meet_audio", "ata")
+        # Documents/meet_audio/ata unless config.json sets ata_dir
+        return meet_audio_dir("ata", self.config)
 
     # Transcript files tab helpers
     def refresh_transcript_files_list(self):
@@ -92,13 +81,7 @@ class FilesMixin:
         src_path = os.path.join(self._get_transcript_dir(), name)
         if not os.path.exists(src_path):
             return
-        # Prefer localized Documents folder (Portuguese 'Documentos') then 'Documents', else home
-        user_home = os.path.expanduser("~")
-        candidates = [
-            os.path.join(user_home, "Documentos"),
-            os.path.join(user_home, "Documents"),
-        ]
-        user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
+        user_docs = documents_dir()
 
         dest = filedialog.asksaveasfilename(
             defaultextension=".md",
@@ -124,7 +107,21 @@ class FilesMixin:
             if not os.path.exists(transcript_path):
                 messagebox.showerror("ATA", f"Transcript not found: {transcript_path}")
                 return
-            self._start_ata_generation(transcript_path, open_after=True)
+            use_cache = True
+            if os.path.exists(self._derive_ata_path(transcript_path)):
+                # Same transcript and options would be served from the cache
+                fresh = messagebox.askyesnocancel(
+                    "ATA",
+                    "An ATA already exists for this transcript.\n\n"
+                    "Yes: generate a fresh version\n"
+                    "No: reuse the cached result if available",
+                )
+                if fresh is None:
+                    return
+                use_cache = not fresh
+            self._start_ata_generation(
+                transcript_path, open_after=True, use_cache=use_cache
+            )
         except Exception as e:
             try:
                 self.status_var.set(f"ATA regeneration error: {e}")
@@ -177,6 +174,40 @@ class FilesMixin:
             except Exception:
                 os.startfile(path)
 
+    # ATA job queue helpers
+    def refresh_ata_jobs_list(self):
+        if not hasattr(self, "ata_jobs_listbox") or not hasattr(self, "ata_jobs"):
+            return
+        selected = self._selected_ata_job_id()
+        jobs = list(reversed(self.ata_jobs.jobs()))
+        self._ata_job_ids = [job.id for job in jobs]
+        self.ata_jobs_listbox.delete(0, tk.END)
+        for job in jobs:
+            self.ata_jobs_listbox.insert(tk.END, job.describe())
+        if selected in self._ata_job_ids:
+            self.ata_jobs_listbox.selection_set(self._ata_job_ids.index(selected))
+        self.on_ata_job_select()
+
+    def _selected_ata_job_id(self):
+        selection = self.ata_jobs_listbox.curselection()
+        ids = getattr(self, "_ata_job_ids", [])
+        if not selection or selection[0] >= len(ids):
+            return None
+        return ids[selection[0]]
+
+    def on_ata_job_select(self, event=None):
+        if not hasattr(self, "cancel_ata_job_btn"):
+            return
+        job_id = self._selected_ata_job_id()
+        job = next((j for j in self.ata_jobs.jobs() if j.id == job_id), None)
+        active = job is not None and job.active and not job.cancel_event.is_set()
+        self.cancel_ata_job_btn.config(state=("normal" if active else "disabled"))
+
+    def cancel_selected_ata_job(self):
+        job_id = self._selected_ata_job_id()
+        if job_id is not None and self.ata_jobs.cancel(job_id):
+            self.status_var.set(f"Cancelling ATA job #{job_id}...")
+
     def _open_document_window(self, file_path: str, title: str | None = None):
         """Open a simple editable document window for markdown files with Save and Save As."""
         if not hasattr(self, "root"):
@@ -240,12 +271,7 @@ class FilesMixin:
                 original_content = txt.get("1.0", tk.END)
 
         def on_save_as():
-            user_home = os.path.expanduser("~")
-            candidates = [
-                os.path.join(user_home, "Documentos"),
-                os.path.join(user_home, "Documents"),
-            ]
-            user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
+            user_docs = documents_dir()
 
             dest = filedialog.asksaveasfilename(
                 defaultextension=".md",
@@ -295,13 +321,7 @@ class FilesMixin:
         src_path = os.path.join(self._get_ata_dir(), name)
         if not os.path.exists(src_path):
             return
-        # Prefer localized Documents folder (Portuguese 'Documentos') then 'Documents', else home
-        user_home = os.path.expanduser("~")
-        candidates = [
-            os.path.join(user_home, "Documentos"),
-            os.path.join(user_home, "Documents"),
-        ]
-        user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
+        user_docs = documents_dir()
 
         dest = filedialog.asksaveasfilename(
             defaultextension=".md",
@@ -1,9 +1,29 @@
 import datetime
 import os
 import threading
+import time
 import tkinter as tk
 
+from src.config_pkg import (
+    TRANSCRIPT_REORDER_MAX_WAIT,
+    TRANSCRIPT_STOP_DRAIN_TIMEOUT,
+    TRANSCRIPTION_SPOOL_ENABLED,
+    ata_path_for,
+)
 from src.i18n import t
+from src.services.ata_jobs import FAILED, RUNNING, AtaJobManager
+from src.services.compaction import format_compaction_summary
+from src.services.model_warmup import ModelWarmer
+from src.services.response_cache import default_cache_dir
+from src.services.rolling_summary import RollingSummarizer
+from src.services.transcript_writer import TranscriptWriter, splice_transcript
+from src.transcription.reorder import ReorderBuffer, SequenceCounter
+from src.transcription.spool import (
+    ChunkSpool,
+    is_placeholder,
+    pending_sessions,
+    placeholder,
+)
 
 
 class RecordingMixin:
@@ -13,6 +33,9 @@ class RecordingMixin:
         """Start continuous recording and transcription threads for selected mics."""
         if self.is_recording:
             return
+        if getattr(self, "_finishing_recording", False):
+            self.status_var.set("Still finishing the previous recording...")
+            return
 
         # Determine selected microphones
         mic1_idx = (
@@ -60,43 +83,57 @@ class RecordingMixin:
         except Exception as e:
             self.status_var.set(f"Transcript file init error: {e}")
 
-        # Chunk handler used by capture threads
-        def on_audio_chunk(device_index, audio_chunk, samplerate):
-            if self.is_paused or not self.is_recording:
+        # Load the model on the Ollama host now so the ATA does not pay for it
+        if self.config.get("ollama", {}).get("warm_up_on_record", True):
+            try:
+                self._model_warmer = ModelWarmer(self.ollama_service).start()
+            except Exception as e:
+                print(f"Model warm-up not started: {e}")
+
+        # Pick up the transcription backend configured for this session
+        self._load_transcription_backend()
+
+        # Session-wide chunk numbering; results are written in capture order
+        sequence = SequenceCounter()
+        reorder = ReorderBuffer(
+            self._on_ordered_transcript, max_wait=TRANSCRIPT_REORDER_MAX_WAIT
+        )
+        self._transcript_sequence = sequence
+        self._transcript_reorder = reorder
+        # Bound to this session: late chunks must not reach the next one
+        session_writer = getattr(self, "_transcript_writer", None)
+        session_spool = getattr(self, "_transcript_spool", None)
+
+        # Chunk handler used by the transcription workers
+        def on_audio_chunk(device_index, audio_chunk, samplerate, seq, captured_at):
+            # Chunks captured before Stop are still transcribed while it drains
+            if self.is_paused:
+                reorder.skip(seq)
                 return
-            from src.transcription import transcribe_audio_async
+            from src.transcription import is_retryable_failure, transcribe_audio_async
 
             text = transcribe_audio_async(audio_chunk, samplerate)
             if text is None or (isinstance(text, str) and text.strip() == ""):
+                reorder.skip(seq)
                 return
-            try:
-                self._append_transcript_line(device_index, text)
-            except Exception:
-                pass
-
-            def ui_update():
-                outs = self.get_output_widgets_for_device(
-                    device_index, self._selected_indices
+            spooled = False
+            if is_retryable_failure(text) and session_spool is not None:
+                # Keep the audio and hold its place in the transcript
+                spooled = session_spool.add(
+                    device_index, audio_chunk, samplerate, seq, captured_at
+                )
+                if spooled:
+                    text = placeholder(seq)
+            accepted = reorder.submit(seq, (device_index, text, captured_at))
+            if not accepted and spooled and session_writer is not None:
+                # Stop gave up waiting for this chunk; without its placeholder
+                # in the file the recovered text would have nowhere to go
+                session_writer.write_line(
+                    self._format_transcript_line(device_index, text, captured_at)
                 )
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-                try:
-                    outs["log"].insert(
-                        tk.END,
-                        f"[{timestamp}] Device {device_index}: chunk processed\n",
-                    )
-                    outs["log"].see(tk.END)
-                except Exception:
-                    pass
-                try:
-                    outs["transcript"].insert(tk.END, f"[{timestamp}] {text}\n")
-                    outs["transcript"].see(tk.END)
-                except Exception:
-                    pass
 
-            try:
-                self.root.after(0, ui_update)
-            except Exception:
-                ui_update()
+        def on_chunk_discarded(device_index, audio_chunk, samplerate, seq, captured_at):
+            reorder.skip(seq)
 
         # Start capture threads
         from src.audio import capture_audio_realtime
@@ -107,6 +144,10 @@ class RecordingMixin:
             th = threading.Thread(
                 target=capture_audio_realtime,
                 args=(idx, on_audio_chunk, stop_evt),
+                kwargs={
+                    "sequence": sequence,
+                    "on_chunk_discarded": on_chunk_discarded,
+                },
                 daemon=True,
                 name=f"Capture-{idx}",
             )
@@ -153,26 +194,36 @@ class RecordingMixin:
             text=t("recording_stopped", "Recording stopped"), fg="red"
         )
         last_path = getattr(self, "_transcript_file_path", None)
-        try:
-            self._finalize_transcript_session()
-        except Exception:
-            pass
-        self.status_var.set("Recording stopped")
-        try:
-            self.root.after(250, self.refresh_transcript_files_list)
-        except Exception:
-            pass
-        try:
-            if (
-                self.config.get("auto_generate_ata", True)
-                and last_path
-                and os.path.exists(last_path)
-            ):
-                self._start_ata_generation(last_path)
-        except Exception:
-            pass
+        self._stop_model_warmer()
+        self._finishing_recording = True
+        self.status_var.set("Finishing transcription...")
         self.update_recording_controls_state()
 
+        def _finished():
+            self._finishing_recording = False
+            self.status_var.set("Recording stopped")
+            try:
+                self.refresh_transcript_files_list()
+            except Exception:
+                pass
+            try:
+                if (
+                    self.config.get("auto_generate_ata", True)
+                    and last_path
+                    and os.path.exists(last_path)
+                ):
+                    self._start_ata_generation(last_path)
+            except Exception:
+                pass
+            self.update_recording_controls_state()
+
+        def _finish():
+            # The last chunks are still being transcribed; keep the UI live
+            self._finish_recording_session()
+            self.root.after(0, _finished)
+
+        threading.Thread(target=_finish, daemon=True, name="FinishRecording").start()
+
     def stop_realtime_recording(self):
         try:
             for evt in self._stop_events.values():
@@ -180,10 +231,41 @@ class RecordingMixin:
         except Exception:
             pass
         self.is_recording = False
+        self._stop_model_warmer()
+        # Quitting: give the last chunks one transcription timeout
+        self._finish_recording_session(timeout=TRANSCRIPT_REORDER_MAX_WAIT)
+
+    def _finish_recording_session(self, timeout: float = TRANSCRIPT_STOP_DRAIN_TIMEOUT):
+        """Wait for the session's last chunks, then close its transcript."""
+        self._drain_transcription(timeout)
+        self._close_transcript_reorder()
         try:
             self._finalize_transcript_session()
         except Exception:
             pass
+        try:
+            from src.transcription import shutdown_transcription_executor
+
+            shutdown_transcription_executor(wait=False)
+        except Exception:
+            pass
+
+    def _drain_transcription(self, timeout: float):
+        """Wait until every chunk captured before Stop was handled or dropped."""
+        deadline = time.monotonic() + timeout
+        # Capture threads dispatch the audio still in the ring before exiting
+        for thread in getattr(self, "_capture_threads", {}).values():
+            thread.join(max(0.0, deadline - time.monotonic()))
+        reorder = getattr(self, "_transcript_reorder", None)
+        sequence = getattr(self, "_transcript_sequence", None)
+        if reorder is None or sequence is None:
+            return
+        remaining = max(0.0, deadline - time.monotonic())
+        if not reorder.wait_for_results(sequence.issued, remaining):
+            print(
+                f"Stop: gave up on {sequence.issued - reorder.received} chunks "
+                f"still being transcribed after {timeout:.0f}s"
+            )
 
     def update_recording_controls_state(self):
         if (
@@ -203,7 +285,9 @@ class RecordingMixin:
                     )
                 )
             else:
-                self.start_btn.config(state=tk.NORMAL)
+                # Start waits until the stopped session has been written out
+                finishing = getattr(self, "_finishing_recording", False)
+                self.start_btn.config(state=tk.DISABLED if finishing else tk.NORMAL)
                 self.pause_btn.config(state=tk.DISABLED)
                 self.stop_btn.config(state=tk.DISABLED)
 
@@ -212,16 +296,7 @@ class RecordingMixin:
 
     # --- Realtime transcript saving helpers ---
     def _start_transcript_file_session(self):
-        try:
-            base_dir = self._get_transcript_dir()
-        except Exception:
-            user_home = os.path.expanduser("~")
-            candidates = [
-                os.path.join(user_home, "Documentos"),
-                os.path.join(user_home, "Documents"),
-            ]
-            user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
-            base_dir = os.path.join(user_docs, "meet_audio", "transcript")
+        base_dir = self._get_transcript_dir()
         os.makedirs(base_dir, exist_ok=True)
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         fname = f"{ts}_transcript.md"
@@ -232,15 +307,121 @@ class RecordingMixin:
             f"- Devices: {', '.join(map(str, getattr(self, '_selected_indices', []) or []))}",
             "",
         ]
-        with self._file_write_lock:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(header_lines))
+        self._transcript_writer = TranscriptWriter(path, "\n".join(header_lines))
         self._transcript_file_path = path
         self._last_transcript_file_path = path
+        self._transcript_spool = None
+        if TRANSCRIPTION_SPOOL_ENABLED:
+            try:
+                self._transcript_spool = self._create_transcript_spool(
+                    os.path.join(
+                        default_cache_dir("spool"), os.path.splitext(fname)[0]
+                    ),
+                    path,
+                )
+            except Exception as e:
+                print(f"Transcription spool disabled: {e}")
+        self._rolling_summarizer = None
+        ollama_config = self.config.get("ollama", {})
+        if ollama_config.get("rolling_summary", True):
+            try:
+                self._rolling_summarizer = RollingSummarizer(
+                    self.ollama_service,
+                    path,
+                    language=self.config.get("language", "pt-BR"),
+                    window_seconds=ollama_config.get("rolling_summary_minutes", 5) * 60,
+                )
+            except Exception as e:
+                print(f"Rolling summary disabled: {e}")
 
-    def _append_transcript_line(self, device_index: int, text: str):
+    def _on_ordered_transcript(self, result):
+        """Write one transcription result; called in capture order by the reorder."""
+        device_index, text, captured_at = result
+        try:
+            self._append_transcript_line(device_index, text, captured_at)
+        except Exception:
+            pass
+
+        def ui_update():
+            outs = self.get_output_widgets_for_device(
+                device_index, self._selected_indices
+            )
+            timestamp = datetime.datetime.fromtimestamp(captured_at).strftime(
+                "%H:%M:%S"
+            )
+            try:
+                outs["log"].insert(
+                    tk.END,
+                    f"[{timestamp}] Device {device_index}: chunk processed\n",
+                )
+                outs["log"].see(tk.END)
+            except Exception:
+                pass
+            try:
+                outs["transcript"].insert(tk.END, f"[{timestamp}] {text}\n")
+                outs["transcript"].see(tk.END)
+            except Exception:
+                pass
+
+        try:
+            self.root.after(0, ui_update)
+        except Exception:
+            ui_update()
+
+    def _close_transcript_reorder(self):
+        """Flush results still held for ordering before the session ends."""
+        reorder = getattr(self, "_transcript_reorder", None)
+        self._transcript_reorder = None
+        if reorder is not None:
+            try:
+                reorder.close(timeout=5)
+            except Exception:
+                pass
+
+    def _load_transcription_backend(self):
+        """Activate the config.json transcription backend off the UI thread.
+
+        Offline models take seconds to load; until then the previous backend
+        keeps transcribing. Unchanged settings reuse the loaded model.
+        """
+        settings = self.config.get("transcription", {})
+
+        def _load():
+            from src.transcription import configure_recognizer
+
+            try:
+                recognizer = configure_recognizer(settings)
+                print(f"Transcription backend: {recognizer.name}")
+            except Exception as e:
+                message = f"Transcription backend error: {e}"
+                print(message)
+                try:
+                    self.root.after(0, lambda: self.status_var.set(message))
+                except Exception:
+                    pass
+
+        threading.Thread(target=_load, daemon=True, name="RecognizerLoad").start()
+
+    def _stop_model_warmer(self):
+        warmer = getattr(self, "_model_warmer", None)
+        self._model_warmer = None
+        if warmer is not None:
+            warmer.stop()
+
+    def _append_transcript_line(
+        self, device_index: int, text: str, captured_at: float = None
+    ):
         if not self._transcript_file_path:
             self._start_transcript_file_session()
+        line = self._format_transcript_line(device_index, text, captured_at)
+        self._transcript_writer.write_line(line)
+        summarizer = getattr(self, "_rolling_summarizer", None)
+        if summarizer is not None and not is_placeholder((text or "").strip()):
+            summarizer.add_line(line.rstrip("\n"))
+
+    def _format_transcript_line(
+        self, device_index: int, text: str, captured_at: float = None
+    ) -> str:
         label = f"Device {device_index}"
         try:
             if self._selected_indices:
@@ -248,81 +429,259 @@ class RecordingMixin:
                 label = f"Mic{pos + 1}"
         except Exception:
             pass
-        ts = datetime.datetime.now().strftime("%H:%M:%S")
+        if captured_at is not None:
+            ts = datetime.datetime.fromtimestamp(captured_at).strftime("%H:%M:%S")
+        else:
+            ts = datetime.datetime.now().strftime("%H:%M:%S")
         safe_text = (text or "").strip().replace("\r", " ").replace("\n", " ")
-        line = f"- [{ts}] [{label}] {safe_text}\n"
-        with self._file_write_lock:
-            with open(self._transcript_file_path, "a", encoding="utf-8") as f:
-                f.write(line)
+        return f"- [{ts}] [{label}] {safe_text}\n"
 
     def _finalize_transcript_session(self):
+        writer = getattr(self, "_transcript_writer", None)
+        self._transcript_writer = None
         self._transcript_file_path = None
+        spool = getattr(self, "_transcript_spool", None)
+        self._transcript_spool = None
+        if spool is not None:
+            # Spooled chunks keep being retried and spliced into the file
+            spool.end_session()
+            print(spool.format_summary())
+        summarizer = getattr(self, "_rolling_summarizer", None)
+        self._rolling_summarizer = None
+        if summarizer is not None:
+            # Windows already closed finish in the background; the ATA
+            # generation waits for them before reusing the cache
+            summarizer.close()
+            self._pending_rolling_summarizer = summarizer
+        if writer is not None:
+            # Flush and fsync so the ATA generation reads the complete file
+            writer.close(timeout=10)
+            print(writer.format_summary())
+
+    # --- Failed-chunk spool helpers ---
+    def _create_transcript_spool(self, directory, transcript_path, session_open=True):
+        spool = ChunkSpool(
+            directory,
+            transcript_path,
+            on_result=lambda chunk, text: self._on_spooled_result(
+                transcript_path, chunk, text
+            ),
+            session_open=session_open,
+            on_drained=lambda spool: self._on_spool_drained(transcript_path, spool),
+        )
+        if not hasattr(self, "_transcript_spools"):
+            self._transcript_spools = []
+        self._transcript_spools.append(spool)
+        return spool
+
+    def _on_spooled_result(self, transcript_path, chunk, text):
+        """Replace a chunk's placeholder line; called from the spool drainer."""
+        if text is None:
+            replacement = None  # no speech after all: drop the line
+        else:
+            replacement = text or "[transcription failed]"
+        marker = placeholder(chunk.seq)
+        writer = getattr(self, "_transcript_writer", None)
+        if writer is not None and writer.path == transcript_path:
+            found = writer.splice(marker, replacement, timeout=10)
+        elif os.path.exists(transcript_path):
+            found = splice_transcript(transcript_path, marker, replacement)
+        else:
+            found = False
+        if not found:
+            print(f"Placeholder for chunk #{chunk.seq} not found in {transcript_path}")
+            return
+        if text:
+            message = f"Recovered transcription #{chunk.seq}"
+            try:
+                self.root.after(0, lambda: self.status_var.set(message))
+            except Exception:
+                pass
 
-    # --- ATA generation helpers ---
-    def _ensure_ata_dir(self) -> str:
+    def _on_spool_drained(self, transcript_path, spool):
+        """Regenerate the ATA once text recovered after Stop is in the transcript."""
+        if not spool.stats()["recovered"] or not os.path.exists(transcript_path):
+            return
+        ata_path = self._derive_ata_path(transcript_path)
+        if not (self.config.get("auto_generate_ata", True) or os.path.exists(ata_path)):
+            return
+        # A queued job has not read the transcript yet; a running one reruns
+        self.ata_jobs.submit(
+            transcript_path,
+            ata_path,
+            self.config.get("language", "pt-BR"),
+            rerun=True,
+        )
+        message = f"Regenerating ATA with recovered text: {os.path.basename(ata_path)}"
         try:
-            base = self._get_ata_dir()
+            self.root.after(0, lambda: self.status_var.set(message))
         except Exception:
-            user_home = os.path.expanduser("~")
-            candidates = [
-                os.path.join(user_home, "Documentos"),
-                os.path.join(user_home, "Documents"),
-            ]
-            user_docs = next((p for p in candidates if os.path.isdir(p)), user_home)
-            base = os.path.join(user_docs, "meet_audio", "ata")
+            pass
+
+    def _resume_transcript_spools(self):
+        """Retry chunks left spooled when the app was last closed."""
+        if not TRANSCRIPTION_SPOOL_ENABLED:
+            return
+        for directory, session in pending_sessions(default_cache_dir("spool")):
+            try:
+                spool = self._create_transcript_spool(
+                    directory, session.get("transcript_path", ""), session_open=False
+                )
+                print(f"Resuming {spool.pending} spooled chunks from {directory}")
+            except Exception as e:
+                print(f"Could not resume spool {directory}: {e}")
+
+    def _close_transcript_spools(self):
+        # Files still spooled are retried on the next start
+        for spool in getattr(self, "_transcript_spools", []):
+            try:
+                spool.close(timeout=2)
+            except Exception:
+                pass
+
+    # --- ATA generation helpers ---
+    def _ensure_ata_dir(self) -> str:
+        base = self._get_ata_dir()
         os.makedirs(base, exist_ok=True)
         return base
 
     def _derive_ata_path(self, transcript_path: str) -> str:
-        ata_dir = self._ensure_ata_dir()
-        name = os.path.basename(transcript_path)
-        if name.endswith("_transcript.md"):
-            name = name.replace("_transcript.md", "_ata.md")
-        else:
-            stem, _ = os.path.splitext(name)
-            name = f"{stem}_ata.md"
-        return os.path.join(ata_dir, name)
+        return ata_path_for(transcript_path, self._ensure_ata_dir())
+
+    def _create_ata_job_manager(self) -> AtaJobManager:
+        ollama_config = self.config.get("ollama", {})
+        return AtaJobManager(
+            self._run_ata_job,
+            max_workers=ollama_config.get("ata_max_workers", 1),
+            state_path=os.path.join(default_cache_dir("jobs"), "ata_jobs.json"),
+            on_update=self._on_ata_job_update,
+        )
 
-    def _start_ata_generation(self, transcript_path: str, open_after: bool = True):
-        def _worker():
-            try:
-                ata_path = self._derive_ata_path(transcript_path)
-                lang = self.config.get("language", "pt-BR")
-                self.status_var.set(
-                    f"Generating ATA from {os.path.basename(transcript_path)}..."
-                )
-                result = self.ollama_service.generate_and_save_minutes(
-                    transcript_path, ata_path, language=lang
-                )
+    def _on_ata_job_update(self, job):
+        if job.status == FAILED and job.result is None:
+            # run_job raised instead of returning a result
+            self.status_var.set(f"ATA generation error: {job.error}")
+        try:
+            self.root.after(0, self.refresh_ata_jobs_list)
+        except Exception:
+            pass
 
-                def _ui_done():
-                    from tkinter import messagebox
-
-                    if result.get("success") and os.path.exists(ata_path):
-                        self.status_var.set(
-                            f"ATA generated: {os.path.basename(ata_path)}"
-                        )
-                        try:
-                            self.refresh_ata_files_list()
-                        except Exception:
-                            pass
-                        if open_after:
-                            try:
-                                os.startfile(ata_path)
-                            except Exception:
-                                messagebox.showinfo("ATA", f"Saved to: {ata_path}")
-                    else:
-                        msg = result.get("error") or "Failed to generate ATA"
-                        messagebox.showerror("ATA", msg)
+    def _start_ata_generation(
+        self, transcript_path: str, open_after: bool = True, use_cache: bool = True
+    ):
+        """Queue an ATA generation; a job already active for the file is reused."""
+        job = self.ata_jobs.submit(
+            transcript_path,
+            self._derive_ata_path(transcript_path),
+            self.config.get("language", "pt-BR"),
+            use_cache=use_cache,
+            open_after=open_after,
+        )
+        if job.status == RUNNING:
+            self.status_var.set(
+                f"ATA already being generated for {os.path.basename(transcript_path)}"
+            )
+        return job
+
+    def _run_ata_job(self, job):
+        """Worker body of an ATA job (runs on an AtaJobManager thread)."""
+        transcript_path = job.transcript_path
+        ata_path = job.output_path or self._derive_ata_path(transcript_path)
+
+        def _status(message):
+            self.ata_jobs.set_message(job, message)
+            self.status_var.set(f"Generating ATA... {message}")
+
+        summarizer = getattr(self, "_pending_rolling_summarizer", None)
+        if summarizer is not None and summarizer.transcript_path == transcript_path:
+            self.status_var.set("Finishing rolling summaries...")
+            summarizer.join(timeout=300)
+        self.status_var.set(f"Generating ATA from {os.path.basename(transcript_path)}...")
+        last_update = [0.0]
+
+        def _on_progress(text, metrics):
+            # Throttle status updates; tokens can arrive every few ms
+            now = time.monotonic()
+            if now - last_update[0] < 0.5:
+                return
+            last_update[0] = now
+            # No visible text yet: a reasoning model is still thinking
+            state = "" if text else "thinking... "
+            _status(
+                f"{state}{metrics.tokens} tokens "
+                f"({metrics.tokens_per_second:.1f} tok/s, "
+                f"{metrics.duration:.0f}s)"
+            )
 
+        result = self.ollama_service.generate_and_save_minutes(
+            transcript_path,
+            ata_path,
+            language=job.language,
+            on_progress=_on_progress,
+            on_status=_status,
+            use_cache=job.use_cache,
+            cancel_event=job.cancel_event,
+        )
+        if result.get("compaction"):
+            print(format_compaction_summary(result["compaction"]))
+        metrics = result.get("metrics")
+        if metrics:
+            ttft = metrics.get("ttft")
+            ttft_text = f"{ttft:.2f}s" if ttft is not None else "n/a"
+            print(
+                f"ATA generation: ttft={ttft_text} "
+                f"tokens={metrics['tokens']} "
+                f"{metrics['tokens_per_second']:.1f} tok/s "
+                f"duration={metrics['duration']:.1f}s"
+            )
+        try:
+            print(self.ollama_service.connection_stats().format_summary())
+            print(self.ollama_service.format_warm_up_summary())
+            if len(self.ollama_service.endpoint_pool) > 1:
+                print(self.ollama_service.endpoint_pool.format_summary())
+        except Exception:
+            pass
+
+        def _ui_done():
+            from tkinter import messagebox
+
+            if result.get("cancelled"):
+                self.status_var.set(
+                    f"ATA generation cancelled: {os.path.basename(transcript_path)}"
+                )
                 try:
-                    self.root.after(0, _ui_done)
+                    self.refresh_ata_files_list()
                 except Exception:
-                    _ui_done()
-            except Exception as e:
+                    pass
+            elif result.get("success") and os.path.exists(ata_path):
+                self.status_var.set(f"ATA generated: {os.path.basename(ata_path)}")
+                try:
+                    self.refresh_ata_files_list()
+                except Exception:
+                    pass
+                if job.open_after:
+                    try:
+                        os.startfile(ata_path)
+                    except Exception:
+                        messagebox.showinfo("ATA", f"Saved to: {ata_path}")
+            elif result.get("partial") and result.get("output_file"):
+                self.status_var.set(
+                    f"Partial ATA saved: {os.path.basename(ata_path)}"
+                )
                 try:
-                    self.status_var.set(f"ATA generation error: {e}")
+                    self.refresh_ata_files_list()
                 except Exception:
                     pass
+                messagebox.showwarning(
+                    "ATA",
+                    f"{result.get('error')}\n\nPartial ATA saved to: {ata_path}",
+                )
+            else:
+                msg = result.get("error") or "Failed to generate ATA"
+                messagebox.showerror("ATA", msg)
 
-        threading.Thread(target=_worker, daemon=True, name="Generate-ATA").start()
+        try:
+            self.root.after(0, _ui_done)
+        except Exception:
+            pass
+        return result
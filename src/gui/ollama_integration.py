@@ -17,12 +17,7 @@ class OllamaIntegrationMixin:
             if "base_url" in ollama_config:
                 current_url = ollama_config["base_url"]
                 if current_url and current_url != self.ollama_service.base_url:
-                    import ollama as _ollama
-
-                    self.ollama_service.base_url = current_url
-                    self.ollama_service.client = _ollama.Client(
-                        host=current_url, timeout=30
-                    )
+                    self.ollama_service.set_base_url(current_url)
                 self.ollama_url_var.set(current_url)
                 if hasattr(self, "url_status_label"):
                     self.url_status_label.config(
@@ -39,6 +34,10 @@ class OllamaIntegrationMixin:
                 self.model_var.set(current_model)
             else:
                 self.model_var.set("")
+            # Fill the combobox from the saved catalog before the network answers
+            cached_models = self.ollama_service.cached_models()
+            if cached_models and hasattr(self, "model_combobox"):
+                self.model_combobox["values"] = cached_models
             if "base_url" in ollama_config and ollama_config["base_url"]:
                 self.root.after(100, self._auto_test_connection_and_load_models)
         except Exception as e:
@@ -74,12 +73,7 @@ class OllamaIntegrationMixin:
             if "base_url" in ollama_config:
                 config_url = ollama_config["base_url"]
                 if config_url and config_url != self.ollama_service.base_url:
-                    import ollama as _ollama
-
-                    self.ollama_service.base_url = config_url
-                    self.ollama_service.client = _ollama.Client(
-                        host=config_url, timeout=30
-                    )
+                    self.ollama_service.set_base_url(config_url)
             if "model_name" in ollama_config:
                 config_model = ollama_config["model_name"]
                 if config_model and config_model != self.ollama_service.model_name:
@@ -127,7 +121,7 @@ class OllamaIntegrationMixin:
                     self.config.setdefault("ollama", {})["base_url"] = new_url
                     self.save_main_config()
                     self.status_var.set("Ollama URL updated and saved")
-                    self.model_combobox["values"] = []
+                    self.model_combobox["values"] = self.ollama_service.cached_models()
                     self.model_var.set("")
                     self.root.after(200, self._auto_test_connection_and_load_models)
                 else:
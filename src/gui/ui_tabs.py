@@ -324,6 +324,23 @@ class UITabsMixin:
         )
         open_ata_folder_btn.pack(side=tk.RIGHT)
 
+        jobs_section = ttk.LabelFrame(main_container, text="⏳ ATA Jobs", padding=10)
+        jobs_section.pack(fill=tk.X, pady=(5, 0))
+        self.ata_jobs_listbox = tk.Listbox(
+            jobs_section, selectmode=tk.SINGLE, height=4, font=("Consolas", 9)
+        )
+        self.ata_jobs_listbox.bind("<<ListboxSelect>>", self.on_ata_job_select)
+        self.ata_jobs_listbox.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_ata_job_btn = create_button(
+            jobs_section,
+            text=t("button_cancel_job", "⛔ Cancel"),
+            command=self.cancel_selected_ata_job,
+            kind="danger",
+            size="sm",
+            state="disabled",
+        )
+        self.cancel_ata_job_btn.pack(side=tk.RIGHT, padx=(5, 0))
+
         ata_info_section = ttk.LabelFrame(
             main_container, text="📄 File Information", padding=10
         )
@@ -338,6 +355,7 @@ class UITabsMixin:
         )
         self.ata_info_label.pack(fill=tk.X, pady=5)
         self.refresh_ata_files_list()
+        self.refresh_ata_jobs_list()
 
     def setup_output_mapping(self):
         self.output_widgets = {
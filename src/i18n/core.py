@@ -97,6 +97,7 @@ TRANSLATIONS = {
         "button_open": "\ud83d\udcd6 Abrir",
         "button_save_as": "\ud83d\udcbe Salvar Como",
         "button_regenerate_ata": "\ud83e\udd16 Regenerar ATA",
+        "button_cancel_job": "\u26d4 Cancelar",
         "button_open_folder": "\ud83d\udcc1 Abrir Pasta",
         "button_apply": "\u2705 Aplicar Mudanças",
         "button_reset": "\ud83d\udd04 Resetar para Atual",
@@ -210,6 +211,7 @@ TRANSLATIONS = {
         "button_open": "\ud83d\udcd6 Open",
         "button_save_as": "\ud83d\udcbe Save As",
         "button_regenerate_ata": "\ud83e\udd16 Regenerate ATA",
+        "button_cancel_job": "\u26d4 Cancel",
         "button_open_folder": "\ud83d\udcc1 Open Folder",
         "button_apply": "\u2705 Apply Changes",
         "button_reset": "\ud83d\udd04 Reset to Current",
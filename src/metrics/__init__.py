@@ -0,0 +1,6 @@
+"""Lightweight in-process metrics shared by the audio, transcription and service layers."""
+
+from .generation import GenerationMetrics
+from .latency import LatencyStats
+
+__all__ = ["GenerationMetrics", "LatencyStats"]
@@ -0,0 +1,111 @@
+"""
+Per-request metrics for streamed LLM generations (time to first token,
+throughput, total duration).
+"""
+
+import time
+
+
+class GenerationMetrics:
+    """Timings of a single streamed generation.
+
+    Call :meth:`on_chunk` for every streamed chunk and :meth:`finish` once the
+    stream ends (or fails). Server-side counters from the final chunk
+    (``eval_count``, ``eval_duration``, ``load_duration``...) take precedence
+    over the client-side estimates when present.
+    """
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.first_token_at = None
+        self.first_visible_at = None
+        self.finished_at = None
+        self.chunks = 0
+        self.visible_chars = 0
+        self.eval_count = None
+        self.eval_duration_ns = None
+        self.prompt_eval_count = None
+        self.load_duration_ns = None
+
+    def on_chunk(self, content: str, visible: str = "") -> None:
+        now = time.monotonic()
+        if content:
+            self.chunks += 1
+            if self.first_token_at is None:
+                self.first_token_at = now
+        if visible:
+            self.visible_chars += len(visible)
+            if self.first_visible_at is None:
+                self.first_visible_at = now
+
+    def on_done(self, chunk) -> None:
+        """Pick up the server counters from the final (``done``) chunk."""
+        for attr, key in (
+            ("eval_count", "eval_count"),
+            ("eval_duration_ns", "eval_duration"),
+            ("prompt_eval_count", "prompt_eval_count"),
+            ("load_duration_ns", "load_duration"),
+        ):
+            try:
+                value = chunk.get(key)
+            except Exception:
+                value = None
+            if value is not None:
+                setattr(self, attr, value)
+
+    def finish(self) -> None:
+        if self.finished_at is None:
+            self.finished_at = time.monotonic()
+
+    @property
+    def ttft(self):
+        """Seconds until the first token (thinking included), or None."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def duration(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def tokens(self) -> int:
+        return self.eval_count if self.eval_count is not None else self.chunks
+
+    @property
+    def tokens_per_second(self) -> float:
+        if self.eval_count and self.eval_duration_ns:
+            return self.eval_count / (self.eval_duration_ns / 1e9)
+        if self.first_token_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        elapsed = end - self.first_token_at
+        return self.chunks / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        first_visible = (
+            self.first_visible_at - self.started_at
+            if self.first_visible_at is not None
+            else None
+        )
+        return {
+            "ttft": self.ttft,
+            "time_to_first_visible": first_visible,
+            "tokens": self.tokens,
+            "tokens_per_second": self.tokens_per_second,
+            "duration": self.duration,
+            "prompt_tokens": self.prompt_eval_count,
+            "load_duration": (
+                self.load_duration_ns / 1e9
+                if self.load_duration_ns is not None
+                else None
+            ),
+        }
+
+    def format_summary(self, label: str = "Generation") -> str:
+        ttft = f"{self.ttft:.2f}s" if self.ttft is not None else "n/a"
+        return (
+            f"{label}: ttft={ttft} tokens={self.tokens} "
+            f"{self.tokens_per_second:.1f} tok/s duration={self.duration:.1f}s"
+        )
@@ -0,0 +1,61 @@
+"""
+Latency accumulator used to report timings (dispatch, write, generation...).
+"""
+
+import threading
+from collections import deque
+
+
+class LatencyStats:
+    """Thread-safe running latency statistics.
+
+    Keeps exact count/mean/max over all samples and a bounded window of the
+    most recent samples for percentiles.
+    """
+
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+            self._recent.append(seconds)
+
+    @property
+    def mean(self) -> float:
+        with self._lock:
+            return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Return the ``pct`` percentile (0-100) of the recent window."""
+        with self._lock:
+            if not self._recent:
+                return 0.0
+            ordered = sorted(self._recent)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> dict:
+        """Return the current statistics in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max,
+        }
+
+    def format_summary(self, label: str) -> str:
+        snap = self.snapshot()
+        return (
+            f"{label}: n={snap['count']} mean={snap['mean'] * 1000:.1f}ms "
+            f"p50={snap['p50'] * 1000:.1f}ms p95={snap['p95'] * 1000:.1f}ms "
+            f"max={snap['max'] * 1000:.1f}ms"
+        )
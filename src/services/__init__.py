@@ -1,5 +1,6 @@
 """External/service integrations (e.g., Ollama)."""
 
 from .ollama_service import OllamaService
+from .transcript_writer import TranscriptWriter
 
-__all__ = ["OllamaService"]
+__all__ = ["OllamaService", "TranscriptWriter"]
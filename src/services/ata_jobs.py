@@ -0,0 +1,300 @@
+"""
+Job queue for ATA generation.
+
+Every Stop and every "Regenerate ATA" click used to start its own
+``Generate-ATA`` thread: two clicks meant two concurrent multi-minute
+generations of the same file on the same Ollama host, and neither could be
+stopped. Jobs now go through a manager with a bounded number of workers,
+duplicate requests for a transcript are coalesced, and queued or running
+jobs are persisted so they resume after a restart.
+"""
+
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+# Finished jobs kept for display
+MAX_FINISHED_JOBS = 50
+
+
+class AtaJob:
+    """One ATA generation request and its current state."""
+
+    _ids = itertools.count(1)
+
+    def __init__(
+        self,
+        transcript_path: str,
+        output_path: str = None,
+        language: str = "pt-BR",
+        use_cache: bool = True,
+        open_after: bool = False,
+    ):
+        self.id = next(AtaJob._ids)
+        self.transcript_path = transcript_path
+        self.output_path = output_path
+        self.language = language
+        self.use_cache = use_cache
+        self.open_after = open_after
+        self.status = QUEUED
+        self.message = ""
+        self.error = None
+        self.result = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        # Run again once finished: the transcript changed while it was running
+        self.rerun = False
+
+    @property
+    def key(self) -> str:
+        return os.path.normcase(os.path.abspath(self.transcript_path))
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATES
+
+    def describe(self) -> str:
+        name = os.path.basename(self.transcript_path)
+        text = f"#{self.id} {self.status:<9} {name}"
+        if self.message:
+            text += f" - {self.message}"
+        if self.error and self.status == FAILED:
+            text += f" - {self.error}"
+        return text
+
+    def to_dict(self) -> dict:
+        return {
+            "transcript_path": self.transcript_path,
+            "output_path": self.output_path,
+            "language": self.language,
+            "use_cache": self.use_cache,
+            "created_at": self.created_at,
+        }
+
+
+class AtaJobManager:
+    """Run ATA jobs on at most ``max_workers`` threads.
+
+    ``run_job(job)`` does the actual work and returns the result dict of
+    ``generate_and_save_minutes``; it should watch ``job.cancel_event``.
+    ``on_update(job)`` is called (from worker threads) on every state change.
+    """
+
+    def __init__(
+        self,
+        run_job,
+        max_workers: int = 1,
+        state_path: str = None,
+        on_update=None,
+    ):
+        self.run_job = run_job
+        self.max_workers = max(1, int(max_workers))
+        self.state_path = state_path
+        self.on_update = on_update
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._jobs = []
+        self._queue = queue.Queue()
+        self._workers = []
+        self._shutdown = False
+        self._pending_restore = self._load_state()
+
+    # --- Persistence ---
+    def _load_state(self) -> list:
+        if not self.state_path:
+            return []
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return list(json.load(f).get("jobs", []))
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            self.logger.warning(f"Could not read ATA job state: {e}")
+            return []
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        with self._lock:
+            pending = [job.to_dict() for job in self._jobs if job.active]
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"jobs": pending}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            self.logger.warning(f"Could not save ATA job state: {e}")
+
+    def resume_pending(self) -> list:
+        """Requeue the jobs that were queued or running when the app last exited."""
+        restored, self._pending_restore = self._pending_restore, []
+        jobs = []
+        for data in restored:
+            if not os.path.exists(data.get("transcript_path", "")):
+                continue
+            jobs.append(
+                self.submit(
+                    data["transcript_path"],
+                    data.get("output_path"),
+                    data.get("language", "pt-BR"),
+                    use_cache=data.get("use_cache", True),
+                )
+            )
+        return jobs
+
+    # --- Queue ---
+    def _notify(self, job: AtaJob) -> None:
+        if self.on_update is not None:
+            try:
+                self.on_update(job)
+            except Exception:
+                pass
+
+    def _ensure_workers(self) -> None:
+        # Called with the lock held
+        self._workers = [w for w in self._workers if w.is_alive()]
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker,
+                daemon=True,
+                name=f"Generate-ATA-{len(self._workers) + 1}",
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def submit(
+        self,
+        transcript_path: str,
+        output_path: str = None,
+        language: str = "pt-BR",
+        use_cache: bool = True,
+        open_after: bool = False,
+        rerun: bool = False,
+    ) -> AtaJob:
+        """
+        Queue an ATA generation, coalescing with an active job for the same file
+
+        A duplicate of a queued job upgrades it (fresh sample wins, open_after
+        is kept if either asked for it); a duplicate of a running job returns
+        the running job. With ``rerun`` the running job is generated again
+        once it finishes, because its transcript changed after it was read.
+
+        Returns:
+            AtaJob: The new job or the existing one it was merged into
+        """
+        candidate = AtaJob(
+            transcript_path, output_path, language, use_cache, open_after
+        )
+        with self._lock:
+            for job in self._jobs:
+                if job.active and job.key == candidate.key:
+                    if job.status == QUEUED:
+                        job.use_cache = job.use_cache and use_cache
+                        job.open_after = job.open_after or open_after
+                    else:
+                        job.rerun = job.rerun or rerun
+                    existing = job
+                    break
+            else:
+                existing = None
+                self._jobs.append(candidate)
+                self._trim_finished()
+                self._queue.put(candidate)
+                self._ensure_workers()
+        job = existing or candidate
+        self._save_state()
+        self._notify(job)
+        return job
+
+    def _trim_finished(self) -> None:
+        # Called with the lock held
+        finished = [job for job in self._jobs if not job.active]
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            self._jobs.remove(job)
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a queued job, or ask a running one to stop."""
+        with self._lock:
+            job = next((j for j in self._jobs if j.id == job_id), None)
+            if job is None or not job.active:
+                return False
+            job.cancel_event.set()
+            if job.status == QUEUED:
+                job.status = CANCELLED
+                job.finished_at = time.time()
+            else:
+                job.message = "cancelling..."
+        self._save_state()
+        self._notify(job)
+        return True
+
+    def jobs(self) -> list:
+        """Snapshot of known jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs)
+
+    def set_message(self, job: AtaJob, message: str) -> None:
+        job.message = message
+        self._notify(job)
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None or self._shutdown:
+                return
+            with self._lock:
+                if job.status != QUEUED:
+                    continue
+                job.status = RUNNING
+                job.started_at = time.time()
+            self._save_state()
+            self._notify(job)
+
+            try:
+                result = self.run_job(job) or {}
+                job.result = result
+                if job.cancel_event.is_set() or result.get("cancelled"):
+                    status = CANCELLED
+                elif result.get("success"):
+                    status = DONE
+                else:
+                    status = FAILED
+                    job.error = result.get("error") or "Failed to generate ATA"
+            except Exception as e:
+                status = FAILED
+                job.error = str(e)
+
+            with self._lock:
+                job.status = status
+                job.finished_at = time.time()
+                if status != FAILED:
+                    job.message = ""
+            self._save_state()
+            self._notify(job)
+            if job.rerun and status != CANCELLED:
+                self.submit(
+                    job.transcript_path, job.output_path, job.language, job.use_cache
+                )
+
+    def shutdown(self) -> None:
+        """Stop the workers after their current job; pending jobs stay persisted."""
+        with self._lock:
+            self._shutdown = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._queue.put(None)
@@ -0,0 +1,129 @@
+"""
+Transcript compaction before building LLM prompts.
+
+The raw transcript has a ``- [HH:MM:SS] [MicN]`` prefix on every line, many
+short consecutive lines from the same mic, words repeated by the chunk
+overlap and error strings returned by the transcription layer. None of that
+helps the model, and prompt prefill time grows with every token.
+"""
+
+import re
+
+from .summarization import estimate_tokens, parse_transcript
+
+_ENTRY = re.compile(
+    r"^- \[(\d{1,2}):(\d{2})(?::\d{2})?\]\s*(?:\[([^\]]+)\])?\s*(.*)$", re.DOTALL
+)
+
+# Texts written in place of a transcription by src.transcription.core
+ERROR_TEXT = re.compile(
+    r"^(Could not understand audio|Could not request results|Error during "
+    r"transcription|Network error|Transcription error|Transcription timeout|"
+    r"Async error|Error:)",
+    re.IGNORECASE,
+)
+
+_WORD_STRIP = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def _normalize(word: str) -> str:
+    return _WORD_STRIP.sub("", word).lower()
+
+
+def _overlap_length(previous, current, max_words: int) -> int:
+    """Number of leading words of ``current`` that repeat the end of ``previous``."""
+    limit = min(max_words, len(previous), len(current))
+    tail = [_normalize(w) for w in previous[-limit:]] if limit else []
+    head = [_normalize(w) for w in current[:limit]]
+    for size in range(limit, 0, -1):
+        if tail[len(tail) - size :] == head[:size]:
+            return size
+    return 0
+
+
+def compact_transcript(content: str, marker_minutes: int = 5, max_overlap_words=8):
+    """
+    Shrink a transcript for the ATA prompt
+
+    - Error lines and empty transcriptions are dropped.
+    - Consecutive lines from the same speaker are merged into one, removing
+      words repeated at the boundary by the chunk overlap.
+    - Per-line timestamps are replaced by a ``[HH:MM]`` marker every
+      ``marker_minutes``; merged lines never cross a marker.
+
+    Args:
+        content: Transcript markdown as written by the recorder
+        marker_minutes: Spacing of the time markers
+        max_overlap_words: Longest repeated run removed at a merge
+
+    Returns:
+        tuple: (compacted_text, stats) where stats holds line, token, dropped
+        error and removed overlap word counts
+    """
+    header, entries = parse_transcript(content)
+    marker_minutes = max(1, int(marker_minutes))
+    out = [header, ""] if header else []
+    stats = {
+        "lines_before": len(entries),
+        "lines_after": 0,
+        "errors_dropped": 0,
+        "overlap_words_dropped": 0,
+        "tokens_before": estimate_tokens(content),
+        "tokens_after": 0,
+    }
+
+    bucket = None
+    speaker = None
+    words = []
+
+    def flush():
+        if words:
+            out.append(f"{speaker}: {' '.join(words)}")
+            stats["lines_after"] += 1
+
+    for entry in entries:
+        match = _ENTRY.match(entry)
+        if not match:
+            continue
+        hours, minutes, label, text = match.groups()
+        text = " ".join(text.split())
+        if not text or ERROR_TEXT.match(text):
+            stats["errors_dropped"] += 1
+            continue
+
+        entry_bucket = (int(hours) * 60 + int(minutes)) // marker_minutes
+        if entry_bucket != bucket:
+            flush()
+            words = []
+            speaker = None
+            bucket = entry_bucket
+            start = bucket * marker_minutes
+            out.append(f"[{start // 60 % 24:02d}:{start % 60:02d}]")
+
+        new_words = text.split()
+        label = label or "?"
+        if label == speaker:
+            repeated = _overlap_length(words, new_words, max_overlap_words)
+            stats["overlap_words_dropped"] += repeated
+            words.extend(new_words[repeated:])
+        else:
+            flush()
+            speaker = label
+            words = list(new_words)
+    flush()
+
+    compacted = "\n".join(out) + "\n"
+    stats["tokens_after"] = estimate_tokens(compacted)
+    return compacted, stats
+
+
+def format_compaction_summary(stats: dict) -> str:
+    before = stats["tokens_before"]
+    after = stats["tokens_after"]
+    saved = (1 - after / before) * 100 if before else 0.0
+    return (
+        f"Transcript compaction: ~{before} -> ~{after} tokens (-{saved:.0f}%), "
+        f"lines {stats['lines_before']} -> {stats['lines_after']}, "
+        f"errors dropped={stats['errors_dropped']}, "
+        f"overlap words dropped={stats['overlap_words_dropped']}"
+    )
@@ -0,0 +1,170 @@
+"""
+Routing of Ollama requests across several servers.
+
+With a single ``ollama.base_url`` a busy or unreachable host made every ATA
+fail after the full timeout. The pool probes each configured server in the
+background, sends each request to the least-loaded healthy one and lets the
+caller fail over to the next server when a request fails.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from src.metrics import LatencyStats
+
+DEFAULT_PROBE_INTERVAL = 15.0
+
+
+def normalize_url(base_url: str) -> str:
+    return (base_url or "").strip().rstrip("/")
+
+
+class Endpoint:
+    """Health and load of one Ollama server, as seen from this process.
+
+    Ollama does not report its request queue, so ``in_flight`` (requests this
+    process has open on the server) stands in for queue depth.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.healthy = True  # optimistic until the first probe or failure
+        self.in_flight = 0
+        self.loaded_models = []
+        self.failures = 0
+        self.last_error = None
+        # A failed request keeps the endpoint out of rotation until then,
+        # even if its health probe still answers
+        self.down_until = 0.0
+        self.probe_latency = LatencyStats()
+        self.request_latency = LatencyStats()
+        self.ttft = LatencyStats()
+
+    def has_model(self, model_name: str) -> bool:
+        return any(model_name and model_name in name for name in self.loaded_models)
+
+    def load_key(self, model_name: str = None):
+        """Sort key: fewer open requests, model resident, faster responses."""
+        latency = (
+            self.request_latency.mean
+            if self.request_latency.count
+            else self.probe_latency.mean
+        )
+        return (self.in_flight, 0 if self.has_model(model_name) else 1, latency)
+
+
+class EndpointPool:
+    """Ordered candidate servers for each request, refreshed by a probe thread.
+
+    ``probe(url)`` must return the names of the models loaded on the server
+    (``/api/ps``) and raise if the server is unreachable.
+    """
+
+    def __init__(self, urls, probe=None, interval: float = DEFAULT_PROBE_INTERVAL):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.endpoints = []
+        for url in urls:
+            url = normalize_url(url)
+            if url and all(e.url != url for e in self.endpoints):
+                self.endpoints.append(Endpoint(url))
+        self.probe = probe
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    @property
+    def primary(self) -> Endpoint:
+        return self.endpoints[0]
+
+    def start(self) -> "EndpointPool":
+        """Start background probing (only useful with two or more servers)."""
+        if self.probe is None or len(self.endpoints) < 2 or self._thread is not None:
+            return self
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="OllamaHealthProbe"
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.probe_all()
+            self._stop.wait(self.interval)
+
+    def probe_all(self) -> None:
+        for endpoint in self.endpoints:
+            if self._stop.is_set():
+                return
+            started = time.monotonic()
+            try:
+                models = self.probe(endpoint.url)
+            except Exception as e:
+                with self._lock:
+                    if endpoint.healthy:
+                        self.logger.warning(f"Ollama {endpoint.url} is down: {e}")
+                    endpoint.healthy = False
+                    endpoint.last_error = str(e)
+                continue
+            endpoint.probe_latency.record(time.monotonic() - started)
+            with self._lock:
+                endpoint.loaded_models = list(models or [])
+                if endpoint.healthy or time.monotonic() < endpoint.down_until:
+                    continue
+                self.logger.info(f"Ollama endpoint {endpoint.url} is back")
+                endpoint.healthy = True
+
+    def candidates(self, model_name: str = None) -> list:
+        """
+        Endpoints in the order they should be tried
+
+        Healthy endpoints come first, least loaded first; unhealthy ones are
+        kept at the end as a last resort.
+        """
+        with self._lock:
+            healthy = [e for e in self.endpoints if e.healthy]
+            unhealthy = [e for e in self.endpoints if not e.healthy]
+            healthy.sort(key=lambda e: e.load_key(model_name))
+            return healthy + unhealthy
+
+    @contextmanager
+    def track(self, endpoint: Endpoint):
+        """Count a request as in flight and record its outcome and latency."""
+        with self._lock:
+            endpoint.in_flight += 1
+        started = time.monotonic()
+        try:
+            yield endpoint
+        except Exception as e:
+            with self._lock:
+                endpoint.failures += 1
+                endpoint.last_error = str(e)
+                endpoint.healthy = False
+                endpoint.down_until = time.monotonic() + self.interval
+            raise
+        else:
+            endpoint.request_latency.record(time.monotonic() - started)
+            with self._lock:
+                endpoint.healthy = True
+        finally:
+            with self._lock:
+                endpoint.in_flight -= 1
+
+    def format_summary(self) -> str:
+        lines = []
+        for endpoint in self.endpoints:
+            state = "up" if endpoint.healthy else "down"
+            lines.append(
+                endpoint.request_latency.format_summary(
+                    f"{endpoint.url} [{state}, failures={endpoint.failures}]"
+                )
+            )
+        return "\n".join(lines)
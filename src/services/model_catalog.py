@@ -0,0 +1,161 @@
+"""
+Model catalog cache for Ollama servers.
+
+The list endpoint was called by ``is_ollama_available``,
+``is_model_available`` and ``get_available_models`` separately, several
+times within seconds at startup. The catalog keeps the parsed model names per
+base URL for a TTL, and persists them so the model combobox can be filled on
+the next launch before the network answers.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+
+def parse_model_list(response) -> list:
+    """
+    Extract model names from any ``client.list()`` response shape
+
+    Handles the typed ``ListResponse`` (``.models`` with ``.model``), the raw
+    ``{"models": [...]}`` dict and a bare list of model dicts.
+
+    Returns:
+        list: Model names, in server order
+    """
+    if hasattr(response, "models"):
+        models = response.models
+    elif isinstance(response, dict):
+        models = response.get("models", [])
+    elif isinstance(response, list):
+        models = response
+    else:
+        raise ValueError(f"Unexpected models response format: {response}")
+
+    names = []
+    for model in models or []:
+        if isinstance(model, dict):
+            name = model.get("name") or model.get("model", "")
+        else:
+            name = getattr(model, "model", None) or getattr(model, "name", "")
+        if name:
+            names.append(name)
+    return names
+
+
+class ModelCatalog:
+    """Per-URL model lists with a TTL, backed by a JSON file.
+
+    ``get`` serves the list from memory while it is younger than ``ttl``
+    seconds; concurrent callers share a single fetch. ``cached`` never touches
+    the network and also returns expired or on-disk lists.
+    """
+
+    def __init__(self, ttl: float, path: str = None):
+        self.ttl = ttl
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._entries = {}  # base_url -> {"models": [...], "fetched_at": epoch}
+        self._load()
+
+    @staticmethod
+    def _key(base_url: str) -> str:
+        return (base_url or "").strip().rstrip("/")
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for url, entry in data.items():
+                self._entries[self._key(url)] = {
+                    "models": list(entry.get("models", [])),
+                    "fetched_at": float(entry.get("fetched_at", 0)),
+                }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Could not read model catalog: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with self._lock:
+                data = dict(self._entries)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.warning(f"Could not save model catalog: {e}")
+
+    def _fresh(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry["fetched_at"] >= self.ttl:
+            return None
+        return list(entry["models"])
+
+    def get(self, base_url: str, fetch, force: bool = False) -> list:
+        """
+        Return the model names for a server, fetching them when needed
+
+        Args:
+            base_url: Ollama server URL
+            fetch: Callable returning a ``client.list()`` response
+            force: Ignore the TTL and fetch now
+
+        Returns:
+            list: Model names
+
+        Raises:
+            Exception: Whatever ``fetch`` raises when a fetch is needed
+        """
+        key = self._key(base_url)
+        if not force:
+            with self._lock:
+                models = self._fresh(key)
+            if models is not None:
+                return models
+
+        requested_at = time.time()
+        with self._fetch_lock:
+            if not force:
+                # Another caller may have refreshed it while we waited
+                with self._lock:
+                    models = self._fresh(key)
+                if models is not None:
+                    return models
+            else:
+                with self._lock:
+                    entry = self._entries.get(key)
+                    # A fetch that completed while we waited is just as new
+                    if entry is not None and entry["fetched_at"] >= requested_at:
+                        return list(entry["models"])
+            models = parse_model_list(fetch())
+            with self._lock:
+                self._entries[key] = {"models": models, "fetched_at": time.time()}
+        self._save()
+        return list(models)
+
+    def cached(self, base_url: str) -> list:
+        """Last known model names for a server, without any network access."""
+        with self._lock:
+            entry = self._entries.get(self._key(base_url))
+            return list(entry["models"]) if entry else []
+
+    def invalidate(self, base_url: str = None) -> None:
+        """Force the next ``get`` to fetch; the last list stays in ``cached``."""
+        with self._lock:
+            keys = [self._key(base_url)] if base_url else list(self._entries)
+            for key in keys:
+                if key in self._entries:
+                    self._entries[key]["fetched_at"] = 0.0
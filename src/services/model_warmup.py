@@ -0,0 +1,75 @@
+"""
+Keep the Ollama model resident while a meeting is being recorded.
+
+Loading ``qwen3:8b`` on the Ollama host takes seconds to tens of seconds
+after a quiet period. A warm-up request at recording start, repeated before
+``keep_alive`` expires, means the model is already in memory when the ATA
+generation starts on Stop.
+"""
+
+import re
+import threading
+
+# Warm-ups are repeated at this fraction of keep_alive
+REWARM_FRACTION = 0.8
+
+_DURATION = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*$")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, None: 1}
+
+
+def keep_alive_seconds(keep_alive):
+    """
+    Convert an Ollama ``keep_alive`` value ("30m", "1h", 300) to seconds
+
+    Returns:
+        float: Seconds, or None for "forever" (negative) or unparsable values
+    """
+    if keep_alive is None:
+        return None
+    if isinstance(keep_alive, (int, float)):
+        seconds = float(keep_alive)
+    else:
+        match = _DURATION.match(str(keep_alive))
+        if not match:
+            return None
+        seconds = float(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+    return seconds if seconds > 0 else None
+
+
+class ModelWarmer:
+    """Background thread that warms the model now and before keep_alive ends.
+
+    With a "forever" keep_alive only the first warm-up is sent.
+    """
+
+    def __init__(self, service, interval: float = None):
+        self.service = service
+        if interval is None:
+            seconds = keep_alive_seconds(service.keep_alive)
+            interval = seconds * REWARM_FRACTION if seconds else None
+        self.interval = interval
+        self.results = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="OllamaWarmUp"
+        )
+
+    def start(self) -> "ModelWarmer":
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            result = self.service.warm_up()
+            self.results.append(result)
+            if result.get("success"):
+                print(
+                    f"Ollama warm-up ({result['state']}): "
+                    f"{result['latency']:.2f}s, load {result['load_duration']:.2f}s"
+                )
+            if not self.interval:
+                return
+            self._stop.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,160 @@
+"""
+Shared Ollama clients: one HTTP connection pool per base URL.
+
+Creating an ``ollama.Client`` per call (or per config change) throws away its
+connection pool, so every probe or request to the HTTPS endpoint paid a new
+TCP + TLS handshake. The factory keeps one ``httpx`` transport per base URL
+and hands out a client per operation (probe, list, generate) with that
+operation's timeout; all clients of a URL share the same pooled connections.
+"""
+
+import threading
+
+import httpx
+import ollama
+
+# Per-operation timeouts in seconds, overridable from config.json
+DEFAULT_TIMEOUTS = {
+    "probe": 5,
+    "list": 30,
+    "generate": 3000,
+}
+
+
+class ConnectionStats:
+    """Counts requests and new connections using the httpcore trace hook."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+
+    def trace(self, event_name: str, info: dict) -> None:
+        with self._lock:
+            if event_name == "connection.connect_tcp.complete":
+                self.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                self.tls_handshakes += 1
+            elif event_name.endswith("send_request_headers.started"):
+                self.requests += 1
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": max(0, self.requests - self.connections_opened),
+                "tls_handshakes": self.tls_handshakes,
+            }
+
+    def format_summary(self, label: str = "Ollama connections") -> str:
+        snap = self.snapshot()
+        return (
+            f"{label}: requests={snap['requests']} "
+            f"opened={snap['connections_opened']} "
+            f"reused={snap['connections_reused']} tls={snap['tls_handshakes']}"
+        )
+
+
+class _TracingTransport(httpx.HTTPTransport):
+    """HTTP transport that reports connection events to ``ConnectionStats``."""
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        super().__init__(**kwargs)
+        self._stats = stats
+
+    def handle_request(self, request):
+        request.extensions["trace"] = self._stats.trace
+        return super().handle_request(request)
+
+
+class _Endpoint:
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.stats = ConnectionStats()
+        self.transport = _TracingTransport(
+            self.stats,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        )
+        self.clients = {}
+
+
+class OllamaClientFactory:
+    """Hands out ``ollama.Client`` objects that share one pool per base URL."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    @staticmethod
+    def _key(base_url: str) -> str:
+        return (base_url or "").strip().rstrip("/")
+
+    def _endpoint(self, base_url: str) -> _Endpoint:
+        key = self._key(base_url)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = _Endpoint(key)
+            self._endpoints[key] = endpoint
+        return endpoint
+
+    def client(self, base_url: str, operation: str = "generate", timeout=None):
+        """
+        Get the client for an operation on a base URL
+
+        Args:
+            base_url: Ollama server URL
+            operation: "probe", "list" or "generate"
+            timeout: Timeout in seconds (default: DEFAULT_TIMEOUTS[operation])
+
+        Returns:
+            ollama.Client: Client sharing the endpoint's connection pool
+        """
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUTS.get(operation, DEFAULT_TIMEOUTS["generate"])
+        with self._lock:
+            endpoint = self._endpoint(base_url)
+            client = endpoint.clients.get((operation, timeout))
+            if client is None:
+                client = ollama.Client(
+                    host=endpoint.base_url, timeout=timeout, transport=endpoint.transport
+                )
+                endpoint.clients[(operation, timeout)] = client
+            return client
+
+    def stats(self, base_url: str) -> ConnectionStats:
+        with self._lock:
+            return self._endpoint(base_url).stats
+
+    def close(self, base_url: str = None) -> None:
+        """Close the pooled connections of one base URL (or of all of them)."""
+        with self._lock:
+            if base_url is None:
+                endpoints = list(self._endpoints.values())
+                self._endpoints.clear()
+            else:
+                endpoint = self._endpoints.pop(self._key(base_url), None)
+                endpoints = [endpoint] if endpoint is not None else []
+        for endpoint in endpoints:
+            try:
+                endpoint.transport.close()
+            except Exception:
+                pass
+
+
+_factory = None
+_factory_lock = threading.Lock()
+
+
+def get_client_factory() -> OllamaClientFactory:
+    """Return the process-wide client factory."""
+    global _factory
+    with _factory_lock:
+        if _factory is None:
+            _factory = OllamaClientFactory()
+        return _factory
@@ -2,12 +2,116 @@
 Ollama integration for generating meeting minutes from transcripts
 """
 
-import ollama
+import itertools
 import json
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.metrics import GenerationMetrics, LatencyStats
+from .summarization import (
+    estimate_tokens,
+    pack_by_budget,
+    parse_transcript,
+    strip_placeholder_lines,
+    window_hash,
+)
+from .compaction import compact_transcript, format_compaction_summary
+from .endpoint_pool import DEFAULT_PROBE_INTERVAL, EndpointPool
+from .model_catalog import ModelCatalog, parse_model_list
+from .ollama_client import get_client_factory
+from .response_cache import ResponseCache, default_cache_dir
+from .rolling_summary import load_partial_summaries
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+# A model load longer than this means the model was not resident (seconds)
+COLD_LOAD_THRESHOLD = 1.0
+
+# Tokens kept free in the context window for chat template overhead and the
+# error of the token estimate
+PROMPT_SAFETY_MARGIN = 256
+
+
+class GenerationCancelled(Exception):
+    """Raised inside a generation when its ``cancel_event`` is set."""
+
+
+def _check_cancelled(cancel_event) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise GenerationCancelled("ATA generation cancelled")
+
+
+class ThinkTagStripper:
+    """Incrementally remove ``<think>...</think>`` blocks from streamed text.
+
+    Tags may be split across chunks, so a trailing fragment that could be the
+    start of a tag is held back until the next chunk. Leading whitespace of
+    the visible answer is dropped, matching ``_sanitize_model_output``.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._inside = False
+        self._started = False
+
+    def _emit(self, text: str) -> str:
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
+
+    def feed(self, text: str) -> str:
+        """Add streamed text; return the visible part that is now certain."""
+        self._buffer += text or ""
+        out = []
+        while True:
+            if self._inside:
+                idx = self._buffer.find(_THINK_CLOSE)
+                if idx < 0:
+                    keep = self._partial_suffix(_THINK_CLOSE)
+                    self._buffer = self._buffer[len(self._buffer) - keep :]
+                    break
+                self._buffer = self._buffer[idx + len(_THINK_CLOSE) :]
+                self._inside = False
+                continue
+
+            open_idx = self._buffer.find(_THINK_OPEN)
+            close_idx = self._buffer.find(_THINK_CLOSE)
+            if open_idx < 0 and close_idx < 0:
+                keep = max(
+                    self._partial_suffix(_THINK_OPEN),
+                    self._partial_suffix(_THINK_CLOSE),
+                )
+                out.append(self._emit(self._buffer[: len(self._buffer) - keep]))
+                self._buffer = self._buffer[len(self._buffer) - keep :]
+                break
+            if close_idx >= 0 and (open_idx < 0 or close_idx < open_idx):
+                # Stray closing tag: drop the tag itself
+                out.append(self._emit(self._buffer[:close_idx]))
+                self._buffer = self._buffer[close_idx + len(_THINK_CLOSE) :]
+                continue
+            out.append(self._emit(self._buffer[:open_idx]))
+            self._buffer = self._buffer[open_idx + len(_THINK_OPEN) :]
+            self._inside = True
+        return "".join(out)
+
+    def flush(self) -> str:
+        """Return any held-back visible text at the end of the stream."""
+        text = "" if self._inside else self._emit(self._buffer)
+        self._buffer = ""
+        return text
+
+    def _partial_suffix(self, tag: str) -> int:
+        # Length of the longest buffer suffix that is a proper prefix of tag
+        for size in range(min(len(tag) - 1, len(self._buffer)), 0, -1):
+            if self._buffer.endswith(tag[:size]):
+                return size
+        return 0
 
 
 class OllamaService:
@@ -32,8 +136,169 @@ class OllamaService:
         )
         self.logger = logging.getLogger(__name__)
 
-        # Configure Ollama client with custom base URL and timeout
-        self.client = ollama.Client(host=self.base_url, timeout=3000)
+        self.response_cache = self._create_response_cache()
+        self.keep_alive = self.config.get("ollama", {}).get("keep_alive", "30m")
+        # Latency split by whether the model had to be loaded first
+        self.warm_up_latency = {"cold": LatencyStats(), "warm": LatencyStats()}
+        self.generation_ttft = {"cold": LatencyStats(), "warm": LatencyStats()}
+        self.model_catalog = ModelCatalog(
+            ttl=self.config.get("ollama", {}).get("model_list_ttl", 300),
+            path=os.path.join(default_cache_dir("catalog"), "models.json"),
+        )
+        self.endpoint_pool = self._create_endpoint_pool()
+
+    def _client(self, operation: str = "generate", base_url: str = None):
+        """Pooled client for ``base_url`` with the operation's timeout."""
+        timeout = self.config.get("ollama", {}).get("timeouts", {}).get(operation)
+        return get_client_factory().client(
+            base_url or self.base_url, operation, timeout
+        )
+
+    @property
+    def client(self):
+        return self._client("generate")
+
+    def _create_endpoint_pool(self) -> EndpointPool:
+        """Pool of ``base_url`` followed by the extra ``ollama.base_urls``."""
+        ollama_config = self.config.get("ollama", {})
+        return EndpointPool(
+            [self.base_url] + list(ollama_config.get("base_urls") or []),
+            probe=self._probe_endpoint,
+            interval=ollama_config.get("health_probe_interval", DEFAULT_PROBE_INTERVAL),
+        ).start()
+
+    def _probe_endpoint(self, base_url: str) -> list:
+        """Health probe: names of the models currently loaded on a server."""
+        return parse_model_list(self._client("probe", base_url).ps())
+
+    def set_base_url(self, base_url: str) -> None:
+        """Point the service at another Ollama server."""
+        self.base_url = base_url
+        self.model_catalog.invalidate(base_url)
+        self.endpoint_pool.stop()
+        self.endpoint_pool = self._create_endpoint_pool()
+
+    def _with_failover(self, call, operation: str = "generate"):
+        """
+        Run ``call(client)`` on the best endpoint, trying the next on failure
+
+        Returns:
+            Whatever ``call`` returns for the first endpoint that succeeds
+
+        Raises:
+            Exception: The last endpoint's error if every endpoint failed
+        """
+        error = None
+        for endpoint in self.endpoint_pool.candidates(self.model_name):
+            try:
+                with self.endpoint_pool.track(endpoint):
+                    return call(self._client(operation, endpoint.url))
+            except Exception as e:
+                error = e
+                if len(self.endpoint_pool) > 1:
+                    self.logger.warning(f"Ollama request to {endpoint.url} failed: {e}")
+        raise error or RuntimeError("No Ollama endpoint configured")
+
+    def _load_state(self, load_seconds) -> str:
+        if load_seconds is not None and load_seconds >= COLD_LOAD_THRESHOLD:
+            return "cold"
+        return "warm"
+
+    def warm_up(self) -> Dict[str, Any]:
+        """
+        Load the model into memory with an empty prompt
+
+        Uses the same ``num_ctx`` as the generation requests (a different
+        context size would make Ollama reload the model) and asks the server
+        to keep it resident for ``keep_alive``.
+
+        Returns:
+            Dict with success, state ("cold"/"warm"), latency and load_duration
+        """
+        started = time.monotonic()
+        try:
+            response = self._with_failover(
+                lambda client: client.generate(
+                    model=self.model_name,
+                    prompt="",
+                    options={"num_ctx": self._generation_options()["num_ctx"]},
+                    keep_alive=self.keep_alive,
+                )
+            )
+        except Exception as e:
+            self.logger.warning(f"Model warm-up failed: {e}")
+            return {"success": False, "error": str(e)}
+        latency = time.monotonic() - started
+        load_ns = response.get("load_duration")
+        load_seconds = load_ns / 1e9 if load_ns is not None else 0.0
+        state = self._load_state(load_seconds)
+        self.warm_up_latency[state].record(latency)
+        return {
+            "success": True,
+            "state": state,
+            "latency": latency,
+            "load_duration": load_seconds,
+        }
+
+    def format_warm_up_summary(self) -> str:
+        return "\n".join(
+            stats.format_summary(label)
+            for label, stats in (
+                ("Warm-up (cold)", self.warm_up_latency["cold"]),
+                ("Warm-up (warm)", self.warm_up_latency["warm"]),
+                ("ATA first token (cold model)", self.generation_ttft["cold"]),
+                ("ATA first token (warm model)", self.generation_ttft["warm"]),
+            )
+            if stats.count
+        )
+
+    def connection_stats(self):
+        """Connection reuse counters for the current base URL."""
+        return get_client_factory().stats(self.base_url)
+
+    def _create_response_cache(self):
+        ollama_config = self.config.get("ollama", {})
+        if not ollama_config.get("cache_enabled", True):
+            return None
+        try:
+            return ResponseCache(
+                ollama_config.get("cache_dir") or default_cache_dir(),
+                int(ollama_config.get("cache_max_mb", 64) * 1024 * 1024),
+            )
+        except Exception as e:
+            self.logger.warning(f"Response cache disabled: {e}")
+            return None
+
+    def _cache_key(self, prompt: str, options: Dict[str, Any]):
+        if self.response_cache is None:
+            return None
+        return ResponseCache.make_key(self.model_name, prompt, options)
+
+    def _chat_text(
+        self, prompt: str, options: Dict[str, Any], use_cache: bool = True
+    ) -> str:
+        """Blocking chat returning the visible answer, served from cache if possible.
+
+        With ``use_cache=False`` the model is always called; the fresh answer
+        still replaces the cached one.
+        """
+        key = self._cache_key(prompt, options)
+        if use_cache and key is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+        response = self._with_failover(
+            lambda client: client.chat(
+                model=self.model_name,
+                messages=[{"role": "user", "content": prompt}],
+                options=options,
+                keep_alive=self.keep_alive,
+            )
+        )
+        content = self._sanitize_model_output(response["message"]["content"])
+        if key is not None:
+            self.response_cache.put(key, content, model=self.model_name)
+        return content
 
     def _config_path(self) -> str:
         # Resolve to project root config.json regardless of package nesting
@@ -59,6 +324,23 @@ class OllamaService:
                 "temperature": 0.3,
                 "top_p": 0.8,
                 "num_predict": 2048,
+                "stream": True,
+                "num_ctx": 8192,
+                "segment_num_predict": 512,
+                "map_parallelism": 2,
+                "rolling_summary": True,
+                "rolling_summary_minutes": 5,
+                "cache_enabled": True,
+                "cache_max_mb": 64,
+                "timeouts": {"probe": 5, "list": 30, "generate": 3000},
+                "model_list_ttl": 300,
+                "keep_alive": "30m",
+                "warm_up_on_record": True,
+                "compact_transcript": True,
+                "timestamp_marker_minutes": 5,
+                "ata_max_workers": 1,
+                "base_urls": [],
+                "health_probe_interval": 15,
             },
             "auto_generate_ata": True,
             "language": "pt-BR",
@@ -100,9 +382,7 @@ class OllamaService:
 
         if ollama_url is not None:
             config.setdefault("ollama", {})["base_url"] = ollama_url
-            self.base_url = ollama_url
-            # Reinitialize client with new URL and timeout
-            self.client = ollama.Client(host=self.base_url, timeout=30)
+            self.set_base_url(ollama_url)
 
         if model_name is not None:
             config.setdefault("ollama", {})["model_name"] = model_name
@@ -114,14 +394,16 @@ class OllamaService:
         """
         Check if Ollama is available and running
 
+        The probe lists the models, so it also refreshes the model catalog.
+
         Returns:
             bool: True if Ollama is available, False otherwise
         """
         try:
-            # Create a temporary client with shorter timeout for testing
-            test_client = ollama.Client(host=self.base_url, timeout=5)
-            # List available models to test connection
-            models = test_client.list()
+            # List available models to test connection (short probe timeout)
+            self.model_catalog.get(
+                self.base_url, self._client("probe").list, force=True
+            )
             return True
         except Exception as e:
             self.logger.error(f"Ollama not available at {self.base_url}: {e}")
@@ -135,62 +417,36 @@ class OllamaService:
             bool: True if model is available, False otherwise
         """
         try:
-            response = self.client.list()
-
-            # Handle different response formats
-            if hasattr(response, "models"):
-                models = response.models
-                model_names = [model.model for model in models]
-            elif isinstance(response, dict) and "models" in response:
-                model_names = [
-                    model.get("name", model.get("model", ""))
-                    for model in response["models"]
-                ]
-            elif isinstance(response, list):
-                model_names = [
-                    model.get("name", model.get("model", "")) for model in response
-                ]
-            else:
-                self.logger.warning(f"Unexpected models response format: {response}")
-                return False
-
-            return any(self.model_name in name for name in model_names if name)
+            model_names = self.model_catalog.get(
+                self.base_url, self._client("list").list
+            )
+            return any(self.model_name in name for name in model_names)
         except Exception as e:
             self.logger.error(f"Error checking model availability: {e}")
             return False
 
-    def get_available_models(self) -> list:
+    def get_available_models(self, force: bool = False) -> list:
         """
         Get list of available models from Ollama
 
+        Args:
+            force: Ignore the catalog TTL and ask the server now
+
         Returns:
             list: List of available model names
         """
         try:
-            response = self.client.list()
-            model_names = []
-
-            if hasattr(response, "models"):
-                models = response.models
-                model_names = [model.model for model in models]
-            elif isinstance(response, dict) and "models" in response:
-                model_names = [
-                    model.get("name", model.get("model", ""))
-                    for model in response["models"]
-                ]
-            elif isinstance(response, list):
-                model_names = [
-                    model.get("name", model.get("model", "")) for model in response
-                ]
-            else:
-                self.logger.warning(f"Unexpected models response format: {response}")
-                return []
-
-            return [name for name in model_names if name]
+            return self.model_catalog.get(
+                self.base_url, self._client("list").list, force=force
+            )
         except Exception as e:
             self.logger.error(f"Error getting available models: {e}")
             return []
 
+    def cached_models(self) -> list:
+        """Last known models for ``base_url`` (possibly from a previous run)."""
+        return self.model_catalog.cached(self.base_url)
+
     def pull_model(self) -> bool:
         """
         Pull the model if it's not available
@@ -224,7 +480,10 @@ class OllamaService:
                 options={
                     "temperature": 0.3,
                     "num_predict": 50,
+                    # Same context size as the ATA so the model is not reloaded
+                    "num_ctx": self._generation_options()["num_ctx"],
                 },
+                keep_alive=self.keep_alive,
             )
 
             generated_content = response["message"]["content"]
@@ -249,46 +508,377 @@ class OllamaService:
                 "timestamp": datetime.now().isoformat(),
             }
 
+    def _generation_options(self, num_predict: int = None) -> Dict[str, Any]:
+        ollama_config = self.config.get("ollama", {})
+        return {
+            "temperature": ollama_config.get("temperature", 0.3),
+            "top_p": ollama_config.get("top_p", 0.8),
+            "num_predict": num_predict or ollama_config.get("num_predict", 2048),
+            "num_ctx": ollama_config.get("num_ctx", 8192),
+        }
+
+    def _build_minutes_prompt(self, markdown_content: str, language: str) -> str:
+        if language.startswith("pt"):
+            prompt_template = self._get_portuguese_prompt()
+        else:
+            prompt_template = self._get_english_prompt()
+        return prompt_template.format(transcript=markdown_content)
+
+    def _fits_context(self, prompt: str, num_predict: int) -> bool:
+        num_ctx = self.config.get("ollama", {}).get("num_ctx", 8192)
+        return (
+            estimate_tokens(prompt) + num_predict + PROMPT_SAFETY_MARGIN <= num_ctx
+        )
+
+    def minutes_token_budget(self, language: str = "pt-BR") -> int:
+        """Transcript tokens that fit in the single-pass ATA prompt."""
+        return (
+            self.config.get("ollama", {}).get("num_ctx", 8192)
+            - estimate_tokens(self._build_minutes_prompt("", language))
+            - self._generation_options()["num_predict"]
+            - PROMPT_SAFETY_MARGIN
+        )
+
+    def segment_token_budget(self, language: str = "pt-BR") -> int:
+        """Transcript tokens that fit in one segment (map) prompt."""
+        ollama_config = self.config.get("ollama", {})
+        budget = (
+            ollama_config.get("num_ctx", 8192)
+            - estimate_tokens(self._get_segment_prompt(language))
+            - ollama_config.get("segment_num_predict", 512)
+            - PROMPT_SAFETY_MARGIN
+        )
+        return max(256, budget)
+
+    def summarize_segment(
+        self, segment: str, language: str = "pt-BR", use_cache: bool = True
+    ) -> str:
+        """
+        Summarize one part of a transcript (the map step)
+
+        Args:
+            segment: Transcript lines of one segment
+            language: Language for the output
+            use_cache: Reuse a cached summary of the same segment
+
+        Returns:
+            str: Markdown bullet summary of the segment
+        """
+        num_predict = self.config.get("ollama", {}).get("segment_num_predict", 512)
+        segment = self._compact(segment)[0]
+        return self._chat_text(
+            self._get_segment_prompt(language).format(transcript=segment),
+            self._generation_options(num_predict),
+            use_cache,
+        )
+
+    def summarize_segments(
+        self,
+        segments: list,
+        language: str = "pt-BR",
+        on_status=None,
+        use_cache: bool = True,
+        cancel_event=None,
+    ) -> list:
+        """
+        Summarize segments concurrently, returning summaries in segment order
+
+        At most ``ollama.map_parallelism`` requests are in flight at once.
+        Segments not yet started when ``cancel_event`` is set are skipped and
+        ``GenerationCancelled`` is raised.
+        """
+        if not segments:
+            return []
+        parallelism = max(
+            1, int(self.config.get("ollama", {}).get("map_parallelism", 2))
+        )
+        finished = itertools.count(1)
+
+        def _summarize(segment):
+            _check_cancelled(cancel_event)
+            summary = self.summarize_segment(segment, language, use_cache)
+            if on_status is not None:
+                on_status(f"Summarized part {next(finished)}/{len(segments)}")
+            return summary
+
+        with ThreadPoolExecutor(
+            max_workers=min(parallelism, len(segments)),
+            thread_name_prefix="ATA-Map",
+        ) as executor:
+            return list(executor.map(_summarize, segments))
+
+    def _build_reduce_prompt(
+        self,
+        header: str,
+        partials: list,
+        language: str,
+        on_status=None,
+        use_cache: bool = True,
+        cancel_event=None,
+    ) -> str:
+        """Build the final ATA prompt from partial summaries (the reduce step).
+
+        If the summaries themselves do not fit the context, they are grouped
+        and summarized again until they do.
+        """
+        num_predict = self._generation_options()["num_predict"]
+        budget = self.segment_token_budget(language)
+        label = "Parte" if language.startswith("pt") else "Part"
+        while True:
+            body = "\n\n".join(
+                f"### {label} {i + 1}\n{summary}" for i, summary in enumerate(partials)
+            )
+            transcript = "\n\n".join(
+                part for part in (header, self._get_reduce_note(language), body) if part
+            )
+            prompt = self._build_minutes_prompt(transcript, language)
+            if self._fits_context(prompt, num_predict) or len(partials) <= 1:
+                return prompt
+            groups = pack_by_budget(partials, budget, separator="\n\n")
+            if len(groups) >= len(partials):
+                self.logger.warning(
+                    "Partial summaries exceed the context window; sending as is"
+                )
+                return prompt
+            if on_status is not None:
+                on_status(f"Condensing {len(partials)} partial summaries...")
+            partials = self.summarize_segments(
+                groups, language, on_status, use_cache, cancel_event
+            )
+
+    def _compact(self, transcript: str):
+        """Compact a transcript (or segment) when enabled in the config.
+
+        Returns:
+            tuple: (text, stats) where stats is None if compaction is disabled
+        """
+        ollama_config = self.config.get("ollama", {})
+        if not ollama_config.get("compact_transcript", True):
+            return transcript, None
+        return compact_transcript(
+            transcript, ollama_config.get("timestamp_marker_minutes", 5)
+        )
+
+    def _prepare_minutes_prompt(
+        self,
+        markdown_content: str,
+        language: str,
+        on_status=None,
+        cached_windows=None,
+        use_cache: bool = True,
+        compacted_content: str = None,
+        cancel_event=None,
+    ) -> str:
+        """Return the ATA prompt, using map-reduce when the transcript is too long.
+
+        ``compacted_content`` is used for the single-pass prompt; the map step
+        splits the raw transcript (so rolling windows still match) and compacts
+        each segment. ``cached_windows`` are rolling summaries made during
+        recording; the leading ones that still match the transcript replace
+        their segments.
+        """
+        full_prompt = self._build_minutes_prompt(
+            compacted_content or markdown_content, language
+        )
+        if self._fits_context(full_prompt, self._generation_options()["num_predict"]):
+            return full_prompt
+
+        header, entries = parse_transcript(markdown_content)
+        partials = []
+        covered = 0
+        for window in cached_windows or []:
+            count = window.get("lines", 0)
+            lines = entries[covered : covered + count]
+            if not lines or len(lines) != count:
+                break
+            if window_hash(lines) != window.get("hash"):
+                break
+            partials.append(window["summary"])
+            covered += count
+
+        segments = pack_by_budget(entries[covered:], self.segment_token_budget(language))
+        self.logger.info(
+            f"Transcript too long for one prompt; reusing {len(partials)} cached "
+            f"summaries and summarizing {len(segments)} parts"
+        )
+        if on_status is not None and segments:
+            on_status(f"Summarizing {len(segments)} transcript parts...")
+        partials += self.summarize_segments(
+            segments, language, on_status, use_cache, cancel_event
+        )
+        return self._build_reduce_prompt(
+            header, partials, language, on_status, use_cache, cancel_event
+        )
+
+    def stream_chat(
+        self,
+        prompt: str,
+        options: Dict[str, Any],
+        metrics=None,
+        cancel_event=None,
+    ):
+        """
+        Stream a chat completion, yielding visible text as it arrives
+
+        ``<think>`` blocks are stripped on the fly. Timing and token counters
+        are recorded on ``metrics`` (a ``GenerationMetrics``) if given. If an
+        endpoint fails before the first chunk, the next endpoint is tried.
+
+        Args:
+            prompt: User message sent to the model
+            options: Ollama generation options
+            metrics: Optional GenerationMetrics to fill in
+            cancel_event: ``threading.Event`` checked on every raw chunk, so a
+                cancel also works while the model is still thinking; raises
+                ``GenerationCancelled`` and closes the HTTP stream
+
+        Yields:
+            str: Pieces of visible text, in order; "" for a chunk with no
+            visible text (e.g. inside ``<think>``) so callers can still
+            report progress
+        """
+        started = time.monotonic()
+        try:
+            error = None
+            for endpoint in self.endpoint_pool.candidates(self.model_name):
+                stripper = ThinkTagStripper()
+                received = False
+                try:
+                    with self.endpoint_pool.track(endpoint):
+                        client = self._client("generate", endpoint.url)
+                        response = client.chat(
+                            model=self.model_name,
+                            messages=[{"role": "user", "content": prompt}],
+                            options=options,
+                            stream=True,
+                            keep_alive=self.keep_alive,
+                        )
+                        try:
+                            for chunk in response:
+                                _check_cancelled(cancel_event)
+                                if not received:
+                                    received = True
+                                    endpoint.ttft.record(time.monotonic() - started)
+                                content = chunk["message"]["content"] or ""
+                                visible = stripper.feed(content)
+                                if metrics is not None:
+                                    metrics.on_chunk(content, visible)
+                                    if chunk.get("done"):
+                                        metrics.on_done(chunk)
+                                yield visible
+                        finally:
+                            # Drop the HTTP stream right away, also on cancel
+                            if hasattr(response, "close"):
+                                response.close()
+                except GenerationCancelled:
+                    raise
+                except Exception as e:
+                    # Once text has been yielded the answer cannot be restarted
+                    if received:
+                        raise
+                    error = e
+                    if len(self.endpoint_pool) > 1:
+                        self.logger.warning(
+                            f"Ollama stream from {endpoint.url} failed: {e}"
+                        )
+                    continue
+                tail = stripper.flush()
+                if tail:
+                    if metrics is not None:
+                        metrics.on_chunk("", tail)
+                    yield tail
+                return
+            raise error or RuntimeError("No Ollama endpoint configured")
+        finally:
+            if metrics is not None:
+                metrics.finish()
+
     def generate_meeting_minutes(
-        self, markdown_content: str, language: str = "pt-BR"
+        self,
+        markdown_content: str,
+        language: str = "pt-BR",
+        stream: bool = False,
+        output_path: str = None,
+        on_progress=None,
+        on_status=None,
+        cached_windows: list = None,
+        use_cache: bool = True,
+        cancel_event=None,
     ) -> Dict[str, Any]:
         """
         Generate meeting minutes from markdown transcript content
 
+        Transcripts that do not fit ``ollama.num_ctx`` are split at timestamp
+        boundaries, the parts are summarized concurrently and the final ATA
+        is generated from the partial summaries.
+
         Args:
             markdown_content: Raw markdown content from the meeting transcript
             language: Language for the output (default: pt-BR)
+            stream: Stream tokens instead of waiting for the whole answer
+            output_path: In streaming mode, append visible text to this file
+                as it arrives so a partial ATA survives a failure
+            on_progress: In streaming mode, called as
+                ``on_progress(text_so_far, metrics)`` after each piece of text
+            on_status: Called with a short message for each map-reduce stage
+            cached_windows: Rolling summaries of the leading transcript lines
+            use_cache: Return a cached answer for an identical request; pass
+                False to force a fresh sample
+            cancel_event: ``threading.Event``; when set, the generation stops
+                at the next segment or streamed token with ``cancelled: True``
 
         Returns:
             Dict containing the generated meeting minutes with topics and summaries
         """
-        if language.startswith("pt"):
-            prompt_template = self._get_portuguese_prompt()
-        else:
-            prompt_template = self._get_english_prompt()
-
-        full_prompt = prompt_template.format(transcript=markdown_content)
+        try:
+            # Chunks still in the transcription spool have no text yet
+            markdown_content = strip_placeholder_lines(markdown_content)
+            compacted_content, compaction = self._compact(markdown_content)
+            if compaction is not None:
+                self.logger.info(format_compaction_summary(compaction))
+            full_prompt = self._prepare_minutes_prompt(
+                markdown_content,
+                language,
+                on_status,
+                cached_windows,
+                use_cache,
+                compacted_content,
+                cancel_event,
+            )
+        except GenerationCancelled as e:
+            self.logger.info("ATA generation cancelled while summarizing parts")
+            return {
+                "success": False,
+                "cancelled": True,
+                "error": str(e),
+                "timestamp": datetime.now().isoformat(),
+            }
+        except Exception as e:
+            self.logger.error(f"Error summarizing transcript parts: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "timestamp": datetime.now().isoformat(),
+            }
+        if stream:
+            result = self._generate_streaming(
+                full_prompt,
+                language,
+                output_path,
+                on_progress,
+                use_cache,
+                cancel_event,
+            )
+            result["compaction"] = compaction
+            return result
 
         try:
             self.logger.info("Generating meeting minutes with Ollama...")
 
-            response = self.client.chat(
-                model=self.model_name,
-                messages=[{"role": "user", "content": full_prompt}],
-                options={
-                    "temperature": self.config.get("ollama", {}).get(
-                        "temperature", 0.3
-                    ),
-                    "top_p": self.config.get("ollama", {}).get("top_p", 0.8),
-                    "num_predict": self.config.get("ollama", {}).get(
-                        "num_predict", 2048
-                    ),
-                },
+            generated_content = self._chat_text(
+                full_prompt, self._generation_options(), use_cache
             )
 
-            generated_content = response["message"]["content"]
-            generated_content = self._sanitize_model_output(generated_content)
-
             parsed_minutes = self._parse_generated_minutes(generated_content, language)
 
             return {
@@ -297,6 +887,7 @@ class OllamaService:
                 "raw_response": generated_content,
                 "timestamp": datetime.now().isoformat(),
                 "model_used": self.model_name,
+                "compaction": compaction,
             }
 
         except Exception as e:
@@ -307,6 +898,115 @@ class OllamaService:
                 "timestamp": datetime.now().isoformat(),
             }
 
+    def _generate_streaming(
+        self,
+        full_prompt: str,
+        language: str,
+        output_path: str,
+        on_progress,
+        use_cache: bool = True,
+        cancel_event=None,
+    ) -> Dict[str, Any]:
+        metrics = GenerationMetrics()
+        pieces = []
+        out = None
+        stream = None
+        promote = False
+        # Stream next to the ATA so a failed or cancelled run never truncates
+        # the previous version; the file replaces it only once it has text
+        partial_path = f"{output_path}.partial" if output_path else None
+        options = self._generation_options()
+        key = self._cache_key(full_prompt, options)
+        cached = self.response_cache.get(key) if use_cache and key else None
+        try:
+            self.logger.info("Streaming meeting minutes from Ollama...")
+            if cached is not None:
+                self.logger.info("Using cached meeting minutes")
+                stream = iter([cached])
+                metrics.finish()
+            else:
+                stream = self.stream_chat(
+                    full_prompt, options, metrics, cancel_event
+                )
+            for piece in stream:
+                _check_cancelled(cancel_event)
+                pieces.append(piece)
+                if partial_path and piece:
+                    if out is None:
+                        out = open(partial_path, "w", encoding="utf-8")
+                    out.write(piece)
+                    out.flush()
+                if on_progress is not None:
+                    try:
+                        on_progress("".join(pieces), metrics)
+                    except Exception:
+                        pass
+
+            generated_content = self._sanitize_model_output("".join(pieces))
+            promote = out is not None
+            if cached is None and key is not None:
+                self.response_cache.put(key, generated_content, model=self.model_name)
+            if cached is None and metrics.ttft is not None:
+                load_seconds = (
+                    metrics.load_duration_ns / 1e9
+                    if metrics.load_duration_ns is not None
+                    else None
+                )
+                self.generation_ttft[self._load_state(load_seconds)].record(
+                    metrics.ttft
+                )
+            self.logger.info(metrics.format_summary("Meeting minutes"))
+            return {
+                "success": True,
+                "cached": cached is not None,
+                "content": self._parse_generated_minutes(generated_content, language),
+                "raw_response": generated_content,
+                "timestamp": datetime.now().isoformat(),
+                "model_used": self.model_name,
+                "metrics": metrics.as_dict(),
+            }
+        except Exception as e:
+            cancelled = isinstance(e, GenerationCancelled)
+            if cancelled:
+                self.logger.info("ATA generation cancelled")
+            else:
+                self.logger.error(f"Error generating meeting minutes: {e}")
+            partial = "".join(pieces)
+            # A cancelled run never replaces an existing ATA; a failed one
+            # keeps what was generated (e.g. after a timeout)
+            promote = out is not None and not (
+                cancelled and os.path.exists(output_path)
+            )
+            if promote:
+                note = self._get_partial_note(language, cancelled, e)
+                try:
+                    out.write(f"\n\n> {note}\n")
+                except Exception:
+                    pass
+            return {
+                "success": False,
+                "cancelled": cancelled,
+                "error": str(e),
+                "partial": bool(partial),
+                "raw_response": partial,
+                "output_file": output_path if promote else None,
+                "timestamp": datetime.now().isoformat(),
+                "metrics": metrics.as_dict(),
+            }
+        finally:
+            # Closing the generator closes the HTTP stream on cancellation
+            if hasattr(stream, "close"):
+                stream.close()
+            if out is not None:
+                out.close()
+                try:
+                    if promote:
+                        os.replace(partial_path, output_path)
+                    else:
+                        os.remove(partial_path)
+                except OSError as e:
+                    self.logger.error(f"Error finishing {output_path}: {e}")
+
     def _get_portuguese_prompt(self) -> str:
         return """
 Você é um assistente especializado em criar atas de reunião. Analise a transcrição de áudio fornecida e crie uma ata de reunião bem estruturada seguindo estas diretrizes:
@@ -343,6 +1043,54 @@ TRANSCRIÇÃO DA REUNIÃO:
 GERE A ATA DA REUNIÃO:
 """
 
+    def _get_segment_prompt(self, language: str) -> str:
+        if language.startswith("pt"):
+            return """
+Você está resumindo uma parte de uma reunião mais longa. Resuma o trecho da transcrição abaixo de forma concisa, preservando:
+- Os temas discutidos, em ordem cronológica, com o horário aproximado
+- Decisões tomadas
+- Ações, responsáveis e prazos mencionados
+- Participantes identificados
+
+Não escreva introdução nem conclusão; use apenas tópicos em markdown.
+
+TRECHO DA TRANSCRIÇÃO:
+{transcript}
+
+RESUMO DO TRECHO:
+"""
+        return """
+You are summarizing one part of a longer meeting. Summarize the transcription excerpt below concisely, preserving:
+- Topics discussed, in chronological order, with the approximate time
+- Decisions made
+- Actions, responsible parties and deadlines mentioned
+- Identified participants
+
+Do not write an introduction or conclusion; use markdown bullet points only.
+
+TRANSCRIPTION EXCERPT:
+{transcript}
+
+EXCERPT SUMMARY:
+"""
+
+    def _get_partial_note(self, language: str, cancelled: bool, error) -> str:
+        """Note appended to an ATA whose generation did not finish."""
+        if language.startswith("pt"):
+            return "ATA cancelada" if cancelled else f"ATA incompleta: {error}"
+        return "ATA cancelled" if cancelled else f"Incomplete ATA: {error}"
+
+    def _get_reduce_note(self, language: str) -> str:
+        if language.startswith("pt"):
+            return (
+                "(A transcrição foi longa demais e foi resumida em partes, em ordem "
+                "cronológica. Use os resumos parciais abaixo como a transcrição.)"
+            )
+        return (
+            "(The transcription was too long and was summarized in parts, in "
+            "chronological order. Use the partial summaries below as the transcription.)"
+        )
+
     def _get_english_prompt(self) -> str:
         return """
 You are an assistant specialized in creating meeting minutes. Analyze the provided audio transcription and create a well-structured meeting minutes following these guidelines:
@@ -463,13 +1211,35 @@ GENERATE THE MEETING MINUTES:
             return False
 
     def generate_and_save_minutes(
-        self, markdown_file_path: str, output_file_path: str, language: str = "pt-BR"
+        self,
+        markdown_file_path: str,
+        output_file_path: str,
+        language: str = "pt-BR",
+        stream: bool = None,
+        on_progress=None,
+        on_status=None,
+        use_cache: bool = True,
+        cancel_event=None,
     ) -> Dict[str, Any]:
+        if stream is None:
+            stream = self.config.get("ollama", {}).get("stream", True)
         try:
             with open(markdown_file_path, "r", encoding="utf-8") as f:
                 transcript_content = f.read()
 
-            minutes_result = self.generate_meeting_minutes(transcript_content, language)
+            minutes_result = self.generate_meeting_minutes(
+                transcript_content,
+                language,
+                stream=stream,
+                output_path=output_file_path if stream else None,
+                on_progress=on_progress,
+                on_status=on_status,
+                cached_windows=load_partial_summaries(
+                    markdown_file_path, self.model_name, language
+                ),
+                use_cache=use_cache,
+                cancel_event=cancel_event,
+            )
 
             if minutes_result["success"]:
                 saved = self.save_meeting_minutes(minutes_result, output_file_path)
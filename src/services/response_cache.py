@@ -0,0 +1,122 @@
+"""
+On-disk cache of LLM responses, keyed by model, prompt and generation options.
+
+Regenerating an ATA for an unchanged transcript (or retrying after a UI
+error) sends exactly the same request again; the cached visible answer is
+returned instead of paying for the whole generation a second time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from src.config_pkg import meet_audio_dir
+
+# Options that change the output; anything else (e.g. keep_alive) is ignored
+_KEY_OPTIONS = ("temperature", "top_p", "num_predict", "num_ctx")
+
+
+def default_cache_dir(name: str = "llm") -> str:
+    """Cache folder ``Documents/meet_audio/cache/<name>``."""
+    return os.path.join(meet_audio_dir("cache"), name)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Ignore trailing spaces, CRLF and repeated blank lines."""
+    lines = (prompt or "").replace("\r\n", "\n").strip().split("\n")
+    normalized = []
+    for line in lines:
+        line = line.rstrip()
+        if line or (normalized and normalized[-1]):
+            normalized.append(line)
+    return "\n".join(normalized)
+
+
+class ResponseCache:
+    """Content-addressed response store with size-bounded LRU eviction.
+
+    Each entry is one JSON file named after its key. A hit refreshes the
+    file's modification time, and eviction removes the least recently used
+    files until the directory is under ``max_bytes``.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, prompt: str, options: dict) -> str:
+        prompt_hash = hashlib.sha256(
+            normalize_prompt(prompt).encode("utf-8")
+        ).hexdigest()
+        material = {
+            "model": model,
+            "prompt": prompt_hash,
+            "options": {name: (options or {}).get(name) for name in _KEY_OPTIONS},
+        }
+        return hashlib.sha256(
+            json.dumps(material, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str):
+        """Return the cached response text, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                response = json.load(f)["response"]
+            os.utime(path, None)
+        except Exception:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return response
+
+    def put(self, key: str, response: str, model: str = None) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"model": model, "created": time.time(), "response": response},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Could not write response cache entry: {e}")
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+                total += stat.st_size
+            entries.sort()
+            for _, size, name in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    total -= size
+                except OSError:
+                    pass
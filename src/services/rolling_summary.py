@@ -0,0 +1,160 @@
+"""
+Rolling summarization while a meeting is being recorded.
+
+Once the transcript outgrows the single-pass ATA prompt, finished windows of
+transcript lines are summarized in the background and cached next to the
+transcript (``<name>_partials.json``). When the ATA is generated, cached
+windows that still match the transcript are reused, so only the last window
+and the reduce step remain after Stop.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from .summarization import estimate_tokens, window_hash
+
+_CLOSE = object()
+
+
+def partials_path_for(transcript_path: str) -> str:
+    stem, _ = os.path.splitext(transcript_path)
+    return f"{stem}_partials.json"
+
+
+def load_partial_summaries(transcript_path: str, model: str, language: str) -> list:
+    """
+    Load cached window summaries for a transcript
+
+    Returns:
+        list: ``{"lines", "hash", "summary"}`` dicts in transcript order, or an
+        empty list if there is no cache for this model and language
+    """
+    try:
+        with open(partials_path_for(transcript_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("model") != model or data.get("language") != language:
+            return []
+        return list(data.get("windows", []))
+    except Exception:
+        return []
+
+
+def save_partial_summaries(
+    transcript_path: str, model: str, language: str, windows: list
+) -> None:
+    path = partials_path_for(transcript_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"model": model, "language": language, "windows": windows},
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+    os.replace(tmp_path, path)
+
+
+class RollingSummarizer:
+    """Summarize transcript windows on a background thread during recording.
+
+    A window closes when it spans ``window_seconds`` or reaches the service's
+    segment token budget; the next line starts a new window. Closed windows
+    are summarized one at a time so recording never competes with more than
+    one LLM request. The window still open at :meth:`close` is left for the
+    ATA generation.
+
+    Windows closed while the whole transcript still fits the single-pass
+    prompt are held back: the ATA of such a meeting would not use them. They
+    are queued as soon as the transcript grows past that budget.
+    """
+
+    def __init__(self, service, transcript_path: str, language: str, window_seconds):
+        self.service = service
+        self.transcript_path = transcript_path
+        self.language = language
+        self.window_seconds = window_seconds
+        self.max_tokens = service.segment_token_budget(language)
+        self.start_tokens = service.minutes_token_budget(language)
+        self.model = service.model_name
+        self.logger = logging.getLogger(__name__)
+
+        self._lines = []
+        self._tokens = 0
+        self._window_started = None
+        self._total_tokens = 0
+        self._held = []
+        self._windows = []
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="RollingSummarizer"
+        )
+        self._thread.start()
+
+    def add_line(self, line: str) -> None:
+        """Add one transcript entry, exactly as written to the file."""
+        now = time.monotonic()
+        tokens = estimate_tokens(line) + 1
+        if self._lines and (
+            now - self._window_started >= self.window_seconds
+            or self._tokens + tokens > self.max_tokens
+        ):
+            self._held.append(self._lines)
+            self._lines = []
+            self._tokens = 0
+        if not self._lines:
+            self._window_started = now
+        self._lines.append(line)
+        self._tokens += tokens
+        self._total_tokens += tokens
+        if self._held and self._total_tokens > self.start_tokens:
+            for lines in self._held:
+                self._queue.put(lines)
+            self._held = []
+
+    @property
+    def summarized_windows(self) -> int:
+        return len(self._windows)
+
+    def _run(self):
+        while True:
+            lines = self._queue.get()
+            if lines is _CLOSE:
+                return
+            try:
+                summary = self.service.summarize_segment(
+                    "\n".join(lines), self.language
+                )
+            except Exception as e:
+                # Leave the rest to the map step of the final generation;
+                # later windows would no longer be contiguous
+                self.logger.warning(f"Rolling summary failed: {e}")
+                self._drain()
+                return
+            self._windows.append(
+                {"lines": len(lines), "hash": window_hash(lines), "summary": summary}
+            )
+            try:
+                save_partial_summaries(
+                    self.transcript_path, self.model, self.language, self._windows
+                )
+            except Exception as e:
+                self.logger.warning(f"Could not cache rolling summary: {e}")
+
+    def _drain(self):
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def close(self) -> None:
+        """Stop accepting lines; windows already closed are still summarized."""
+        self._queue.put(_CLOSE)
+
+    def join(self, timeout: float = None) -> None:
+        """Wait until the queued windows are summarized and cached."""
+        self._thread.join(timeout)
@@ -0,0 +1,105 @@
+"""
+Helpers for hierarchical (map-reduce) summarization of long transcripts.
+
+Only text handling lives here: token estimates and splitting the transcript
+into segments that fit a token budget. The LLM calls are made by
+``OllamaService``.
+"""
+
+import hashlib
+import math
+import re
+
+from src.config_pkg import SPOOL_PLACEHOLDER_PREFIX
+
+# Conservative characters-per-token ratio for Portuguese/English text with
+# markdown; real tokenizers average ~4, so this overestimates slightly
+CHARS_PER_TOKEN = 3.5
+
+# Transcript lines written by RecordingMixin: "- [HH:MM:SS] [Mic1] text"
+TIMESTAMP_LINE = re.compile(r"^- \[\d{1,2}:\d{2}(?::\d{2})?\]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text`` without loading a tokenizer."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def pack_by_budget(items, max_tokens: int, separator: str = "\n"):
+    """
+    Greedily group consecutive text items so each group fits ``max_tokens``
+
+    An item larger than the budget on its own becomes a group by itself.
+
+    Returns:
+        list: Joined text of each group, in order
+    """
+    groups = []
+    current = []
+    current_tokens = 0
+    for item in items:
+        tokens = estimate_tokens(item) + estimate_tokens(separator)
+        if current and current_tokens + tokens > max_tokens:
+            groups.append(separator.join(current))
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += tokens
+    if current:
+        groups.append(separator.join(current))
+    return groups
+
+
+def parse_transcript(content: str):
+    """
+    Separate the transcript header from its timestamped entries
+
+    Lines before the first timestamped line form the header (title, start
+    time, devices). Lines without a timestamp stay attached to the previous
+    timestamped line, so an utterance is never split.
+
+    Returns:
+        tuple: (header, entries) where entries is a list of strings
+    """
+    header = []
+    entries = []
+    for line in content.splitlines():
+        if TIMESTAMP_LINE.match(line):
+            entries.append(line)
+        elif entries:
+            if line.strip():
+                entries[-1] += "\n" + line
+        else:
+            header.append(line)
+    return "\n".join(header).strip(), entries
+
+
+def strip_placeholder_lines(content: str) -> str:
+    """Drop transcript lines of chunks still waiting in the transcription spool."""
+    return "".join(
+        line
+        for line in content.splitlines(keepends=True)
+        if SPOOL_PLACEHOLDER_PREFIX not in line
+    )
+
+
+def split_transcript(content: str, max_tokens: int):
+    """
+    Split a transcript into segments at timestamp boundaries
+
+    Args:
+        content: Transcript markdown
+        max_tokens: Token budget of one segment
+
+    Returns:
+        tuple: (header, segments) where segments is a list of strings
+    """
+    header, entries = parse_transcript(content)
+    return header, pack_by_budget(entries, max_tokens)
+
+
+def window_hash(entries) -> str:
+    """Stable identifier of a run of transcript entries."""
+    return hashlib.sha1("\n".join(entries).encode("utf-8")).hexdigest()
@@ -0,0 +1,245 @@
+"""
+Buffered transcript writer: one thread per recording session keeps the
+transcript file open and batches lines instead of reopening it per line.
+
+Lines written as placeholders (e.g. for chunks whose transcription is retried
+later) can be filled in afterwards with :func:`splice_transcript` or, while
+the session is open, :meth:`TranscriptWriter.splice`.
+"""
+
+import os
+import queue
+import threading
+import time
+
+from src.config_pkg import (
+    TRANSCRIPT_FLUSH_BYTES,
+    TRANSCRIPT_FLUSH_INTERVAL,
+    TRANSCRIPT_FSYNC_INTERVAL,
+)
+from src.metrics import LatencyStats
+
+_CLOSE = object()
+# Serializes edits made on the file directly (splices, lines after close)
+_file_lock = threading.Lock()
+
+
+def splice_transcript(path: str, marker: str, text) -> bool:
+    """
+    Replace ``marker`` in the first line containing it
+
+    With ``text`` None the whole line is removed. The file is rewritten
+    atomically.
+
+    Returns:
+        bool: False if no line contains the marker
+    """
+    with _file_lock:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        for i, line in enumerate(lines):
+            if marker in line:
+                break
+        else:
+            return False
+        if text is None:
+            del lines[i]
+        else:
+            safe_text = text.strip().replace("\r", " ").replace("\n", " ")
+            lines[i] = line.replace(marker, safe_text, 1)
+        tmp_path = f"{path}.splice"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return True
+
+
+class _Splice:
+    __slots__ = ("marker", "text", "done", "found")
+
+    def __init__(self, marker, text):
+        self.marker = marker
+        self.text = text
+        self.done = threading.Event()
+        self.found = False
+
+
+class TranscriptWriter:
+    """Append lines to a transcript file from a dedicated thread.
+
+    Lines are buffered and written with one ``write``/``flush`` when
+    ``flush_bytes`` are pending or the oldest pending line is
+    ``flush_interval`` seconds old. The file is fsync'ed at most every
+    ``fsync_interval`` seconds and always on :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        header: str = "",
+        flush_bytes: int = TRANSCRIPT_FLUSH_BYTES,
+        flush_interval: float = TRANSCRIPT_FLUSH_INTERVAL,
+        fsync_interval: float = TRANSCRIPT_FSYNC_INTERVAL,
+    ):
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._file = open(path, "w", encoding="utf-8")
+        if header:
+            self._file.write(header)
+            self._file.flush()
+        self._last_fsync = time.monotonic()
+
+        self.write_latency = LatencyStats()
+        self.lines_written = 0
+        self.flushes = 0
+        self.fsyncs = 0
+
+        self._thread = threading.Thread(
+            target=self._run,
+            daemon=True,
+            name=f"TranscriptWriter-{os.path.basename(path)}",
+        )
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Lines submitted but not yet handed to the writer thread."""
+        return self._queue.qsize()
+
+    def write_line(self, line: str) -> None:
+        """
+        Queue a line (including its trailing newline) for writing
+
+        Once the writer is closed the line is appended to the file directly.
+        """
+        with self._close_lock:
+            if not self._closed:
+                self._queue.put((line, time.monotonic()))
+                return
+        # Let the writer finish the file before appending to it
+        self._thread.join()
+        with _file_lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def _run(self):
+        pending = []
+        pending_bytes = 0
+        while True:
+            timeout = None
+            if pending:
+                deadline = pending[0][1] + self.flush_interval
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+
+            if entry is _CLOSE:
+                self._flush(pending, fsync=True)
+                self._file.close()
+                return
+            if isinstance(entry, _Splice):
+                self._flush(pending)
+                pending = []
+                pending_bytes = 0
+                self._splice(entry)
+                continue
+            if entry is not None:
+                pending.append(entry)
+                pending_bytes += len(entry[0])
+
+            due = pending and (
+                pending_bytes >= self.flush_bytes
+                or time.monotonic() - pending[0][1] >= self.flush_interval
+            )
+            if due:
+                self._flush(pending)
+                pending = []
+                pending_bytes = 0
+
+    def _flush(self, pending, fsync: bool = False):
+        try:
+            if pending:
+                self._file.write("".join(line for line, _ in pending))
+                self._file.flush()
+                now = time.monotonic()
+                for _, queued_at in pending:
+                    self.write_latency.record(now - queued_at)
+                self.lines_written += len(pending)
+                self.flushes += 1
+            if fsync or time.monotonic() - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = time.monotonic()
+                self.fsyncs += 1
+        except Exception as e:
+            print(f"Error writing transcript {self.path}: {e}")
+
+    def _splice(self, request):
+        """Rewrite the file with the placeholder filled in, then keep appending"""
+        try:
+            self._file.close()
+            request.found = splice_transcript(
+                self.path, request.marker, request.text
+            )
+        except Exception as e:
+            print(f"Error splicing transcript {self.path}: {e}")
+        finally:
+            self._file = open(self.path, "a", encoding="utf-8")
+            request.done.set()
+
+    def splice(self, marker: str, text, timeout: float = None) -> bool:
+        """
+        Fill in a placeholder line already written (see splice_transcript)
+
+        Queued lines are written first; works on the file directly once the
+        writer is closed.
+
+        Returns:
+            bool: False if the marker was not found (or the timeout expired)
+        """
+        request = None
+        with self._close_lock:
+            if not self._closed:
+                request = _Splice(marker, text)
+                self._queue.put(request)
+        if request is None:
+            # Let the writer finish the file before rewriting it
+            self._thread.join(timeout)
+            return splice_transcript(self.path, marker, text)
+        request.done.wait(timeout)
+        return request.found
+
+    def stats(self) -> dict:
+        snapshot = self.write_latency.snapshot()
+        snapshot.update(
+            {
+                "queue_depth": self.queue_depth,
+                "lines_written": self.lines_written,
+                "flushes": self.flushes,
+                "fsyncs": self.fsyncs,
+            }
+        )
+        return snapshot
+
+    def format_summary(self) -> str:
+        return (
+            f"{self.write_latency.format_summary('Transcript write latency')} "
+            f"lines={self.lines_written} flushes={self.flushes} "
+            f"fsyncs={self.fsyncs} queue_depth={self.queue_depth}"
+        )
+
+    def close(self, timeout: float = None) -> None:
+        """Write everything still queued, fsync and close the file."""
+        with self._close_lock:
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._thread.join(timeout)
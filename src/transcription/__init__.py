@@ -3,17 +3,53 @@
 from .core import (
     transcribe_audio,
     transcribe_audio_async,
+    submit_transcription,
+    get_transcription_executor,
+    get_transcription_executor_stats,
+    shutdown_transcription_executor,
     transcribe_audio_fast,
     transcribe_audio_realtime,
     transcribe_and_display,
     batch_transcribe,
+    is_retryable_failure,
 )
+from .recognizers import (
+    FakeRecognizer,
+    GoogleRecognizer,
+    Recognizer,
+    configure_recognizer,
+    create_recognizer,
+    get_recognizer,
+    set_recognizer,
+)
+from .reorder import ReorderBuffer
+from .spool import ChunkSpool, is_placeholder, pending_sessions, placeholder
+from .worker_pool import TranscriptionWorkerPool, get_transcription_pool
 
 __all__ = [
     "transcribe_audio",
     "transcribe_audio_async",
+    "submit_transcription",
+    "get_transcription_executor",
+    "get_transcription_executor_stats",
+    "shutdown_transcription_executor",
     "transcribe_audio_fast",
     "transcribe_audio_realtime",
     "transcribe_and_display",
     "batch_transcribe",
+    "is_retryable_failure",
+    "Recognizer",
+    "GoogleRecognizer",
+    "FakeRecognizer",
+    "configure_recognizer",
+    "create_recognizer",
+    "get_recognizer",
+    "set_recognizer",
+    "ReorderBuffer",
+    "ChunkSpool",
+    "is_placeholder",
+    "pending_sessions",
+    "placeholder",
+    "TranscriptionWorkerPool",
+    "get_transcription_pool",
 ]
@@ -6,27 +6,28 @@ import queue
 import numpy as np
 import concurrent.futures
 from src.config_pkg import (
-    SPEECH_RECOGNITION_ENERGY_THRESHOLD,
-    SPEECH_RECOGNITION_PAUSE_THRESHOLD,
-    SPEECH_RECOGNITION_PHRASE_THRESHOLD,
-    TRANSCRIPTION_OPERATION_TIMEOUT,
     TRANSCRIPTION_ASYNC_TIMEOUT,
-    CHUNK_DURATION,
+    TRANSCRIPTION_EXECUTOR_WORKERS,
     validate_speech_recognition_config,
 )
+from .recognizers import get_recognizer
 
 # Validate configuration on import
 validate_speech_recognition_config()
 
-# Global recognizer instance to avoid recreation overhead
-_recognizer = sr.Recognizer()
-_recognizer.energy_threshold = SPEECH_RECOGNITION_ENERGY_THRESHOLD
-_recognizer.dynamic_energy_threshold = True
-_recognizer.pause_threshold = SPEECH_RECOGNITION_PAUSE_THRESHOLD
-_recognizer.phrase_threshold = SPEECH_RECOGNITION_PHRASE_THRESHOLD
+# Status strings returned instead of text when the audio may still be
+# transcribable later (service unreachable or too slow)
+RETRYABLE_FAILURE_PREFIXES = ("Network error:", "Transcription timeout")
 
-# Set operation timeout for configured audio chunks
-_recognizer.operation_timeout = TRANSCRIPTION_OPERATION_TIMEOUT
+
+def is_retryable_failure(text) -> bool:
+    """True if a transcription result is a network/timeout status message"""
+    return isinstance(text, str) and text.startswith(RETRYABLE_FAILURE_PREFIXES)
+
+
+def _recognize(audio_data, samplerate, language):
+    """Transcribe one chunk with the active recognizer backend"""
+    return get_recognizer().recognize(audio_data, samplerate, language)
 
 
 def transcribe_audio(audio_data, samplerate, language="pt-BR"):
@@ -41,15 +42,9 @@ def transcribe_audio(audio_data, samplerate, language="pt-BR"):
     Returns:
         str: Transcribed text or error message
     """
-    global _recognizer
-
     try:
-        # Convert audio data to speech_recognition format
-        audio_bytes = audio_data.tobytes()
-        audio_data_sr = sr.AudioData(audio_bytes, samplerate, 2)
-
         # Perform transcription with extended timeout for longer chunks
-        text = _recognizer.recognize_google(audio_data_sr, language=language)
+        text = _recognize(audio_data, samplerate, language)
         return text
     except sr.UnknownValueError:
         return "Could not understand audio"
@@ -71,21 +66,14 @@ def transcribe_audio_realtime(audio_data, samplerate, language="pt-BR"):
     Returns:
         str: Transcribed text or None if no meaningful audio
     """
-    global _recognizer
-
     try:
         # Quick check for meaningful audio content
         if np.max(np.abs(audio_data)) < 100:
             return None  # Too quiet, skip transcription
 
-        # Convert audio data to speech_recognition format
-        audio_bytes = audio_data.tobytes()
-        audio_data_sr = sr.AudioData(audio_bytes, samplerate, 2)
-
         # Perform transcription with extended timeout for 1-second chunks
         start_time = time.time()
-        # Use shorter timeout for 1-second audio chunks
-        text = _recognizer.recognize_google(audio_data_sr, language=language)
+        text = _recognize(audio_data, samplerate, language)
 
         # Log processing time for debugging
         processing_time = time.time() - start_time
@@ -101,33 +89,86 @@ def transcribe_audio_realtime(audio_data, samplerate, language="pt-BR"):
         return f"Transcription error: {e}"
 
 
-def transcribe_audio_async(audio_data, samplerate, language="pt-BR"):
+_executor = None
+_executor_lock = threading.Lock()
+_abandoned = set()
+_abandoned_stats = {"abandoned": 0, "abandoned_completed": 0}
+
+
+def get_transcription_executor():
+    """Return the process-wide transcription executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=TRANSCRIPTION_EXECUTOR_WORKERS,
+                thread_name_prefix="Recognizer",
+            )
+        return _executor
+
+
+def shutdown_transcription_executor(wait=False):
     """
-    Ultra-fast asynchronous transcription optimized for continuous real-time processing
+    Shut down the shared transcription executor
+
+    Pending (not yet started) requests are cancelled; requests already talking
+    to the recognizer finish in the background. The next submit creates a new
+    executor, so recording can be restarted.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _track_abandoned(future):
+    """Remember a request whose caller gave up waiting for it"""
+    with _executor_lock:
+        _abandoned.add(future)
+        _abandoned_stats["abandoned"] += 1
+
+    def _release(done):
+        with _executor_lock:
+            if done in _abandoned:
+                _abandoned.discard(done)
+                _abandoned_stats["abandoned_completed"] += 1
+
+    future.add_done_callback(_release)
+
+
+def get_transcription_executor_stats():
+    """
+    Get counters for requests abandoned after a timeout
 
     Returns:
-        str: Transcribed text or status message
+        dict: total abandoned, abandoned that later finished, still running
     """
-    import concurrent.futures
+    with _executor_lock:
+        stats = dict(_abandoned_stats)
+        stats["abandoned_running"] = len(_abandoned)
+    return stats
+
 
+def submit_transcription(audio_data, samplerate, language="pt-BR"):
+    """
+    Submit a chunk to the shared transcription executor without blocking
+
+    Returns:
+        concurrent.futures.Future: resolves to the transcribed text, None for
+        silence/no speech, or a status message on errors
+    """
     # Quick silence check - skip transcription for very quiet audio
     if np.max(np.abs(audio_data)) < 80:
-        return None
+        future = concurrent.futures.Future()
+        future.set_result(None)
+        return future
 
     def transcribe_worker():
-        """Fast transcription worker with extended timeout for 1s chunks"""
-        global _recognizer
-
+        """Fast transcription worker for real-time chunks"""
         try:
-            # Convert audio data to speech_recognition format
-            audio_bytes = audio_data.tobytes()
-            audio_data_sr = sr.AudioData(audio_bytes, samplerate, 2)
-
-            # Use shorter timeout for 1-second audio chunks
-            _recognizer.operation_timeout = 5.0  # Extended timeout for 1s chunks
-
-            # Perform transcription with extended timeout
-            text = _recognizer.recognize_google(audio_data_sr, language=language)
+            # Perform transcription with the active recognizer
+            text = _recognize(audio_data, samplerate, language)
             return text
 
         except sr.UnknownValueError:
@@ -137,36 +178,53 @@ def transcribe_audio_async(audio_data, samplerate, language="pt-BR"):
         except Exception as e:
             return f"Error: {e}"
 
-    # Use ThreadPoolExecutor for better performance
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(transcribe_worker)
-        try:
-            # Wait for result with configured timeout for audio chunks
-            result = future.result(timeout=TRANSCRIPTION_ASYNC_TIMEOUT)
-            return result
-        except concurrent.futures.TimeoutError:
-            return f"Transcription timeout ({TRANSCRIPTION_ASYNC_TIMEOUT}s limit for {CHUNK_DURATION}s chunk)"
-        except Exception as e:
-            return f"Async error: {e}"
+    return get_transcription_executor().submit(transcribe_worker)
+
+
+def transcribe_audio_async(audio_data, samplerate, language="pt-BR"):
+    """
+    Ultra-fast asynchronous transcription optimized for continuous real-time processing
+
+    The request runs on the shared transcription executor; if it does not
+    finish within TRANSCRIPTION_ASYNC_TIMEOUT the caller is released and the
+    request is tracked as abandoned.
+
+    Returns:
+        str: Transcribed text or status message
+    """
+    try:
+        future = submit_transcription(audio_data, samplerate, language)
+    except RuntimeError as e:
+        # Executor shut down between lookup and submit
+        return f"Async error: {e}"
+
+    try:
+        # Wait for result with configured timeout for audio chunks
+        return future.result(timeout=TRANSCRIPTION_ASYNC_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        _track_abandoned(future)
+        chunk_seconds = len(audio_data) / samplerate
+        return (
+            f"Transcription timeout ({TRANSCRIPTION_ASYNC_TIMEOUT}s limit "
+            f"for {chunk_seconds:.1f}s chunk)"
+        )
+    except concurrent.futures.CancelledError:
+        return None  # Cancelled by shutdown_transcription_executor
+    except Exception as e:
+        return f"Async error: {e}"
 
 
 def transcribe_audio_fast(audio_data, samplerate, language="pt-BR"):
     """
     Fastest possible transcription for continuous pipeline - no timeout handling
     """
-    global _recognizer
-
     try:
         # Ultra-quick silence check
         if np.max(np.abs(audio_data)) < 100:
             return None
 
-        # Convert audio data to speech_recognition format
-        audio_bytes = audio_data.tobytes()
-        audio_data_sr = sr.AudioData(audio_bytes, samplerate, 2)
-
         # Direct transcription without timeout handling for speed
-        text = _recognizer.recognize_google(audio_data_sr, language=language)
+        text = _recognize(audio_data, samplerate, language)
         return text
 
     except sr.UnknownValueError:
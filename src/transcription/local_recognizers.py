@@ -0,0 +1,293 @@
+"""
+Offline CPU speech recognizers.
+
+Both engines are optional dependencies, imported only when their backend is
+selected:
+
+- ``whisper``: faster-whisper (CTranslate2). The model is loaded once and kept
+  warm for the lifetime of the recognizer. Whisper always encodes a padded
+  30-second window, so chunks that are already queued when the model becomes
+  free are concatenated into one window and the words are split back by their
+  timestamps - one encoder pass for two 10-second chunks, or several shorter
+  VAD utterances.
+- ``vosk``: Kaldi-based streaming decoder. Its cost grows with the audio
+  length rather than per call, so chunks are decoded individually (the shared
+  model is thread-safe).
+
+Audio at other sample rates is resampled to the 16 kHz both engines expect.
+"""
+
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+import speech_recognition as sr
+
+from .recognizers import Recognizer
+
+MODEL_SAMPLE_RATE = 16000
+# Whisper's encoder window; a batch never exceeds it
+WHISPER_WINDOW_SECONDS = 30.0
+# Silence between concatenated chunks so words do not straddle two chunks
+BATCH_GAP_SECONDS = 0.4
+
+
+def _import_engine(module, package):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise RuntimeError(
+            f"The {package} package is not installed (pip install {package})"
+        ) from None
+
+
+def _to_model_audio(audio_data, samplerate):
+    """int16 chunk -> float32 in [-1, 1] at MODEL_SAMPLE_RATE"""
+    audio = np.asarray(audio_data).reshape(-1).astype(np.float32) / 32768.0
+    if samplerate != MODEL_SAMPLE_RATE:
+        from src.audio.resample import resample
+
+        audio = resample(audio, samplerate, MODEL_SAMPLE_RATE)
+    return audio
+
+
+def _closed_error():
+    # A RequestError makes the chunk retryable, so the spool hands it to the
+    # recognizer that replaced this one
+    return sr.RequestError("Whisper recognizer was closed")
+
+
+class _Request:
+    __slots__ = ("audio", "language", "future")
+
+    def __init__(self, audio, language):
+        self.audio = audio
+        self.language = language
+        self.future = Future()
+
+    @property
+    def seconds(self):
+        return self.audio.shape[0] / MODEL_SAMPLE_RATE
+
+
+class WhisperRecognizer(Recognizer):
+    """faster-whisper on the CPU with adaptive batching of queued chunks.
+
+    ``recognize`` may be called from any number of threads; a single
+    inference thread owns the model, so CTranslate2 uses all ``cpu_threads``
+    for one batch at a time instead of oversubscribing the cores.
+
+    Args:
+        model: Model size ("tiny", "base", "small", ...) or a local path
+        compute_type: CTranslate2 quantization, "int8" is fastest on CPU
+        cpu_threads: Threads used by the model (0 = library default)
+        beam_size: 1 is greedy decoding, the fastest
+        batch_size: Maximum number of chunks transcribed in one window
+        batch_window: Seconds to wait for more chunks before running a batch
+            (0 = only batch chunks that are already queued)
+        download_root: Directory for downloaded models (library default if None)
+        local_files_only: Never download, fail if the model is not cached
+        warm_up: Run one silent inference right after loading
+    """
+
+    name = "whisper"
+
+    def __init__(
+        self,
+        model: str = "small",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        beam_size: int = 1,
+        batch_size: int = 3,
+        batch_window: float = 0.0,
+        download_root: str = None,
+        local_files_only: bool = False,
+        warm_up: bool = True,
+    ):
+        faster_whisper = _import_engine("faster_whisper", "faster-whisper")
+        self.model_name = model
+        self.cpu_threads = cpu_threads
+        self.beam_size = beam_size
+        self.batch_size = max(1, int(batch_size))
+        self.batch_window = batch_window
+        self._model = faster_whisper.WhisperModel(
+            model,
+            device="cpu",
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            download_root=download_root,
+            local_files_only=local_files_only,
+        )
+        self._queue = queue.Queue()
+        self._carry = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._stats = {
+            "batches": 0,
+            "chunks": 0,
+            "audio_seconds": 0.0,
+            "inference_seconds": 0.0,
+        }
+        if warm_up:
+            # The first call initializes the CTranslate2 kernels
+            self._transcribe(np.zeros(MODEL_SAMPLE_RATE, dtype=np.float32), None)
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="WhisperInference"
+        )
+        self._thread.start()
+
+    def recognize(self, audio_data, samplerate: int, language: str) -> str:
+        request = _Request(_to_model_audio(audio_data, samplerate), language)
+        with self._lock:
+            # Checked and queued together so nothing lands behind the sentinel
+            if self._closed:
+                raise _closed_error()
+            self._queue.put(request)
+        text = request.future.result()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join(timeout=30)
+        # Requests the inference thread will never take must not block
+        # their callers forever
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                request.future.set_exception(_closed_error())
+        if self._thread.is_alive():
+            # Still finishing a batch: let it stop once done
+            self._queue.put(None)
+
+    def stats(self) -> dict:
+        """Batches run, chunks transcribed and audio/inference seconds."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _next_batch(self):
+        """Collect the next batch; None once closed."""
+        first = self._carry or self._queue.get()
+        self._carry = None
+        if first is None:
+            return None
+        batch = [first]
+        seconds = first.seconds
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.batch_size:
+            try:
+                timeout = deadline - time.monotonic()
+                if timeout > 0:
+                    request = self._queue.get(timeout=timeout)
+                else:
+                    request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Closed: finish this batch, then stop
+                self._queue.put(None)
+                break
+            fits = (
+                seconds + BATCH_GAP_SECONDS + request.seconds
+                <= WHISPER_WINDOW_SECONDS
+            )
+            if request.language != first.language or not fits:
+                self._carry = request  # starts the next batch
+                break
+            batch.append(request)
+            seconds += BATCH_GAP_SECONDS + request.seconds
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                texts = self._transcribe_batch(batch)
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            for request, text in zip(batch, texts):
+                request.future.set_result(text)
+
+    def _transcribe(self, audio, language, word_timestamps=False):
+        segments, _info = self._model.transcribe(
+            audio,
+            language=language.split("-")[0] if language else None,
+            beam_size=self.beam_size,
+            condition_on_previous_text=False,
+            word_timestamps=word_timestamps,
+        )
+        # Segments are generated lazily; decoding happens here
+        return list(segments)
+
+    def _transcribe_batch(self, batch):
+        started = time.perf_counter()
+        language = batch[0].language
+        if len(batch) == 1:
+            segments = self._transcribe(batch[0].audio, language)
+            texts = [" ".join(s.text.strip() for s in segments).strip()]
+        else:
+            gap = np.zeros(int(BATCH_GAP_SECONDS * MODEL_SAMPLE_RATE), np.float32)
+            parts, bounds, position = [], [], 0.0
+            for request in batch:
+                parts += [request.audio, gap]
+                bounds.append(position + request.seconds + BATCH_GAP_SECONDS / 2)
+                position += request.seconds + BATCH_GAP_SECONDS
+            audio = np.concatenate(parts[:-1])
+            segments = self._transcribe(audio, language, word_timestamps=True)
+            words = [[] for _ in batch]
+            for segment in segments:
+                for word in segment.words or ():
+                    middle = (word.start + word.end) / 2
+                    index = next(
+                        (i for i, bound in enumerate(bounds) if middle < bound),
+                        len(batch) - 1,
+                    )
+                    words[index].append(word.word)
+            texts = ["".join(w).strip() for w in words]
+
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["chunks"] += len(batch)
+            self._stats["audio_seconds"] += sum(r.seconds for r in batch)
+            self._stats["inference_seconds"] += time.perf_counter() - started
+        return texts
+
+
+class VoskRecognizer(Recognizer):
+    """Vosk (Kaldi) offline recognizer; the language is fixed by the model.
+
+    Args:
+        model_path: Directory of an unpacked Vosk model
+            (e.g. vosk-model-small-pt-0.3)
+    """
+
+    name = "vosk"
+
+    def __init__(self, model_path: str):
+        vosk = _import_engine("vosk", "vosk")
+        vosk.SetLogLevel(-1)
+        self._vosk = vosk
+        self._model = vosk.Model(model_path)
+
+    def recognize(self, audio_data, samplerate: int, language: str) -> str:
+        audio = _to_model_audio(audio_data, samplerate)
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+        decoder = self._vosk.KaldiRecognizer(self._model, MODEL_SAMPLE_RATE)
+        decoder.AcceptWaveform(pcm.tobytes())
+        text = json.loads(decoder.FinalResult()).get("text", "").strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
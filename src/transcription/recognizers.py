@@ -0,0 +1,284 @@
+"""
+Pluggable speech recognizers.
+
+Every transcription entry point in ``src.transcription.core`` used to call
+the Google Web Speech API directly, which made the capture-to-transcript
+pipeline impossible to benchmark offline. Backends now implement
+``Recognizer.recognize`` and the active one is chosen by
+``TRANSCRIPTION_BACKEND``, the "transcription" section of config.json
+(``configure_recognizer``) or replaced at runtime with ``set_recognizer``.
+The offline CPU engines live in ``src.transcription.local_recognizers``.
+
+Backends follow the ``speech_recognition`` error contract so the callers'
+error handling is unchanged: ``sr.UnknownValueError`` when no speech was
+recognized and ``sr.RequestError`` when the service could not be reached.
+"""
+
+import itertools
+import json
+import math
+import random
+import threading
+import time
+
+import speech_recognition as sr
+
+from src.config_pkg import (
+    SPEECH_RECOGNITION_ENERGY_THRESHOLD,
+    SPEECH_RECOGNITION_PAUSE_THRESHOLD,
+    SPEECH_RECOGNITION_PHRASE_THRESHOLD,
+    TRANSCRIPTION_BACKEND,
+    TRANSCRIPTION_OPERATION_TIMEOUT,
+    TRANSCRIPTION_UPLOAD_FORMAT,
+)
+from .google_upload import recognize_google_pcm
+
+
+class Recognizer:
+    """Interface of a speech recognition backend."""
+
+    name = "base"
+
+    def recognize(self, audio_data, samplerate: int, language: str) -> str:
+        """
+        Transcribe one chunk of int16 mono audio
+
+        Args:
+            audio_data: int16 numpy array
+            samplerate (int): Sample rate of the audio
+            language (str): Language code, e.g. "pt-BR"
+
+        Returns:
+            str: Recognized text
+
+        Raises:
+            sr.UnknownValueError: No speech recognized
+            sr.RequestError: The backend could not be reached
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class GoogleRecognizer(Recognizer):
+    """Google Web Speech API (the default, needs network access)."""
+
+    name = "google"
+
+    def __init__(self, upload_format: str = TRANSCRIPTION_UPLOAD_FORMAT):
+        self.upload_format = upload_format
+        # One recognizer per thread: recognizer state (e.g. the dynamic energy
+        # threshold) is mutable, so concurrent chunks must not share an instance
+        self._local = threading.local()
+
+    @staticmethod
+    def _create_recognizer():
+        """Create a recognizer configured from the config constants"""
+        recognizer = sr.Recognizer()
+        recognizer.energy_threshold = SPEECH_RECOGNITION_ENERGY_THRESHOLD
+        recognizer.dynamic_energy_threshold = True
+        recognizer.pause_threshold = SPEECH_RECOGNITION_PAUSE_THRESHOLD
+        recognizer.phrase_threshold = SPEECH_RECOGNITION_PHRASE_THRESHOLD
+
+        # Set operation timeout for configured audio chunks
+        recognizer.operation_timeout = TRANSCRIPTION_OPERATION_TIMEOUT
+        return recognizer
+
+    def _get_recognizer(self):
+        """Return the calling thread's recognizer, creating it on first use"""
+        recognizer = getattr(self._local, "recognizer", None)
+        if recognizer is None:
+            recognizer = self._create_recognizer()
+            self._local.recognizer = recognizer
+        return recognizer
+
+    def recognize(self, audio_data, samplerate: int, language: str) -> str:
+        """
+        Send one chunk to the Google recognizer using the configured upload format
+
+        "l16" posts the raw samples in-process; "flac" uses speech_recognition,
+        which spawns the external flac encoder for every chunk.
+        """
+        recognizer = self._get_recognizer()
+        if self.upload_format == "l16":
+            return recognize_google_pcm(
+                audio_data,
+                samplerate,
+                language=language,
+                timeout=recognizer.operation_timeout,
+            )
+        audio_data_sr = sr.AudioData(audio_data.tobytes(), samplerate, 2)
+        return recognizer.recognize_google(audio_data_sr, language=language)
+
+
+DEFAULT_FAKE_TEXTS = (
+    "bom dia a todos vamos começar a reunião",
+    "o primeiro ponto é o cronograma das entregas deste trimestre",
+    "precisamos revisar as metas de vendas com a equipe comercial",
+    "alguém tem alguma dúvida sobre o relatório do cliente",
+    "fica combinado que o João atualiza a planilha até sexta-feira",
+)
+
+
+class FakeRecognizer(Recognizer):
+    """Stand-in backend with a configurable latency distribution and error rate.
+
+    The returned text is taken from ``texts`` in turn, trimmed or extended to
+    about ``words_per_second`` words per second of audio.
+
+    Args:
+        latency_mean: Mean seconds per request
+        latency_jitter: Standard deviation of the latency (seconds)
+        distribution: "normal" (clipped at 0), "lognormal" (long tail) or
+            "uniform" (mean ± jitter)
+        error_rate: Probability of ``sr.RequestError``
+        no_speech_rate: Probability of ``sr.UnknownValueError``
+        texts: Canned sentences
+        words_per_second: Length of the returned text per second of audio
+        seed: Seed for the latency and error draws
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency_mean: float = 0.8,
+        latency_jitter: float = 0.2,
+        distribution: str = "normal",
+        error_rate: float = 0.0,
+        no_speech_rate: float = 0.0,
+        texts=DEFAULT_FAKE_TEXTS,
+        words_per_second: float = 2.5,
+        seed: int = None,
+    ):
+        if distribution not in ("normal", "lognormal", "uniform"):
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.latency_mean = latency_mean
+        self.latency_jitter = latency_jitter
+        self.distribution = distribution
+        self.error_rate = error_rate
+        self.no_speech_rate = no_speech_rate
+        self.words_per_second = words_per_second
+        self._words = itertools.cycle(" ".join(texts).split())
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def _latency(self) -> float:
+        mean, jitter = self.latency_mean, self.latency_jitter
+        if self.distribution == "uniform":
+            return max(0.0, self._random.uniform(mean - jitter, mean + jitter))
+        if self.distribution == "lognormal" and mean > 0:
+            sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2))
+            return self._random.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+        return max(0.0, self._random.gauss(mean, jitter))
+
+    def recognize(self, audio_data, samplerate: int, language: str) -> str:
+        duration = len(audio_data) / samplerate if samplerate else 0.0
+        with self._lock:
+            self.requests += 1
+            latency = self._latency()
+            draw = self._random.random()
+            count = max(1, round(duration * self.words_per_second))
+            words = [next(self._words) for _ in range(count)]
+        time.sleep(latency)
+        if draw < self.error_rate:
+            raise sr.RequestError("fake recognizer: injected failure")
+        if draw < self.error_rate + self.no_speech_rate:
+            raise sr.UnknownValueError()
+        return " ".join(words)
+
+
+def _whisper_recognizer(**options):
+    from .local_recognizers import WhisperRecognizer
+
+    return WhisperRecognizer(**options)
+
+
+def _vosk_recognizer(**options):
+    from .local_recognizers import VoskRecognizer
+
+    return VoskRecognizer(**options)
+
+
+# The offline engines are optional dependencies, imported on first use
+RECOGNIZER_BACKENDS = {
+    "google": GoogleRecognizer,
+    "fake": FakeRecognizer,
+    "whisper": _whisper_recognizer,
+    "vosk": _vosk_recognizer,
+}
+
+_active = None
+_active_key = None
+_active_lock = threading.Lock()
+# Serializes model loads so concurrent callers reuse one instance
+_configure_lock = threading.Lock()
+
+
+def create_recognizer(name: str, **options) -> Recognizer:
+    """Instantiate a registered backend by name."""
+    try:
+        factory = RECOGNIZER_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown transcription backend: {name}") from None
+    return factory(**options)
+
+
+def get_recognizer() -> Recognizer:
+    """Return the active recognizer, creating ``TRANSCRIPTION_BACKEND`` on first use."""
+    global _active
+    with _active_lock:
+        if _active is None:
+            _active = create_recognizer(TRANSCRIPTION_BACKEND)
+        return _active
+
+
+def set_recognizer(recognizer: Recognizer) -> Recognizer:
+    """
+    Replace the active recognizer (e.g. with a FakeRecognizer for benchmarks)
+
+    Returns:
+        Recognizer: The previously active recognizer (None if none was created)
+    """
+    global _active, _active_key
+    with _active_lock:
+        previous, _active = _active, recognizer
+        _active_key = None
+    return previous
+
+
+def configure_recognizer(settings: dict = None) -> Recognizer:
+    """
+    Activate the backend described by the config.json "transcription" section
+
+    ``settings["backend"]`` names the backend (TRANSCRIPTION_BACKEND if
+    missing) and ``settings[<backend>]`` holds its options. The active
+    recognizer is kept - models stay loaded - when name and options are
+    unchanged; otherwise the new backend is created and the previous one
+    closed.
+
+    Returns:
+        Recognizer: The active recognizer
+
+    Raises:
+        ValueError: Unknown backend
+        RuntimeError: The backend's optional package is not installed
+    """
+    global _active, _active_key
+    settings = settings or {}
+    name = settings.get("backend") or TRANSCRIPTION_BACKEND
+    options = dict(settings.get(name) or {})
+    key = (name, json.dumps(options, sort_keys=True))
+    with _configure_lock:
+        with _active_lock:
+            if _active is not None and _active_key == key:
+                return _active
+        recognizer = create_recognizer(name, **options)
+        with _active_lock:
+            previous, _active = _active, recognizer
+            _active_key = key
+    if previous is not None and previous is not recognizer:
+        previous.close()
+    return recognizer
@@ -0,0 +1,158 @@
+"""
+Reorder stage for transcription results.
+
+Chunks are transcribed in parallel and finish in any order. The reorder buffer
+releases results strictly by sequence number, waiting a bounded time for a
+missing (slow or lost) chunk before giving up on it.
+"""
+
+import threading
+import time
+
+
+class SequenceCounter:
+    """Session-wide chunk numbers; remembers how many were handed out."""
+
+    def __init__(self, first_seq: int = 0):
+        self._next = first_seq
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> int:
+        with self._lock:
+            seq = self._next
+            self._next += 1
+            return seq
+
+    @property
+    def issued(self) -> int:
+        return self._next
+
+
+class ReorderBuffer:
+    """Release ``(seq, item)`` results in sequence order on a single thread.
+
+    - ``submit(seq, item)``: a chunk finished; ``item`` None means the chunk
+      produced nothing (silence, no speech) and only fills its slot.
+    - ``skip(seq)``: the chunk will never produce a result (e.g. dropped).
+    - A gap is waited on for at most ``max_wait`` seconds, measured from when
+      the first later result arrived. Results that arrive after their slot
+      was given up are released immediately rather than lost.
+
+    ``release(item)`` is always called from the reorder thread, one item at a
+    time, so it can write to files without extra locking.
+
+    Every chunk is expected to be submitted or skipped exactly once;
+    :meth:`wait_for_results` lets the session wait for its last chunks before
+    closing.
+    """
+
+    def __init__(self, release, max_wait: float, first_seq: int = 0):
+        self._release = release
+        self.max_wait = max_wait
+        self._next_seq = first_seq
+        self._pending = {}  # seq -> (item, arrival monotonic time)
+        self._ready = []
+        self._closed = False
+        self._received = 0
+        self._cond = threading.Condition()
+        self.gaps_skipped = 0
+        self.late_results = 0
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="TranscriptReorder"
+        )
+        self._thread.start()
+
+    def submit(self, seq: int, item) -> bool:
+        """Queue a result; False if the buffer was already closed (item dropped)."""
+        with self._cond:
+            self._received += 1
+            # Wakes the reorder thread and wait_for_results
+            self._cond.notify_all()
+            if self._closed:
+                return False
+            if seq < self._next_seq:
+                # Its slot was already given up: release out of order
+                if item is not None:
+                    self.late_results += 1
+                    self._ready.append(item)
+                return True
+            self._pending[seq] = (item, time.monotonic())
+            return True
+
+    def skip(self, seq: int) -> None:
+        self.submit(seq, None)
+
+    @property
+    def received(self) -> int:
+        """Chunks submitted or skipped so far."""
+        with self._cond:
+            return self._received
+
+    @property
+    def closed(self) -> bool:
+        with self._cond:
+            return self._closed
+
+    def wait_for_results(self, count: int, timeout: float = None) -> bool:
+        """Wait until ``count`` chunks were submitted or skipped; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._received >= count, timeout)
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def _collect_in_order(self):
+        # Called with the lock held
+        while self._next_seq in self._pending:
+            item, _ = self._pending.pop(self._next_seq)
+            self._next_seq += 1
+            if item is not None:
+                self._ready.append(item)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                timeout = None
+                while True:
+                    self._collect_in_order()
+                    if self._ready or self._closed:
+                        break
+                    if self._pending:
+                        # Head is missing: wait for it until the oldest waiting
+                        # result has been held for max_wait
+                        oldest = min(arrived for _, arrived in self._pending.values())
+                        timeout = oldest + self.max_wait - time.monotonic()
+                        if timeout <= 0:
+                            self.gaps_skipped += min(self._pending) - self._next_seq
+                            self._next_seq = min(self._pending)
+                            continue
+                    self._cond.wait(timeout)
+                    timeout = None
+
+                if self._closed and not self._ready:
+                    if not self._pending:
+                        return
+                    # Flush whatever is left in sequence order
+                    self._next_seq = min(self._pending)
+                    self._collect_in_order()
+                    continue
+                ready, self._ready = self._ready, []
+
+            for item in ready:
+                try:
+                    self._release(item)
+                except Exception as e:
+                    print(f"Error releasing transcription result: {e}")
+
+    def close(self, wait: bool = True, timeout: float = None) -> None:
+        """Stop accepting results and release everything still pending in order."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
@@ -0,0 +1,385 @@
+"""
+Persistent spool for chunks whose transcription failed.
+
+When the recognizer cannot be reached (``sr.RequestError``) or a request
+times out, the audio used to be discarded and the status message written to
+the transcript. The recorder now saves those chunks here as 16-bit mono WAV
+files named after their sequence number, device and capture time, writes a
+placeholder line (:func:`placeholder`) in the transcript and lets a
+:class:`ChunkSpool` retry them in the background:
+
+- one drainer thread per session retries the oldest chunk first;
+- after a failure the next attempt waits an exponentially growing delay
+  (with jitter), capped at ``max_delay``;
+- after ``breaker_threshold`` consecutive failures the circuit breaker opens
+  and nothing is sent for ``breaker_cooldown`` seconds; then a single probe
+  request decides whether it closes again;
+- recovered text is handed to ``on_result`` so the placeholder can be
+  replaced in place, keeping the transcript in capture order.
+
+Spool directories survive restarts: each holds a ``session.json`` with the
+transcript path, so chunks left over when the app was closed are retried the
+next time it starts (:func:`pending_sessions`).
+"""
+
+import json
+import os
+import random
+import shutil
+import threading
+import time
+import wave
+
+import numpy as np
+import speech_recognition as sr
+
+from src.config_pkg import (
+    SPOOL_BREAKER_COOLDOWN,
+    SPOOL_BREAKER_THRESHOLD,
+    SPOOL_MAX_ATTEMPTS,
+    SPOOL_PLACEHOLDER_PREFIX,
+    SPOOL_RETRY_INITIAL_DELAY,
+    SPOOL_RETRY_MAX_DELAY,
+)
+from .recognizers import get_recognizer
+
+SESSION_FILE = "session.json"
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+def placeholder(seq: int) -> str:
+    """Transcript text standing in for chunk ``seq`` until it is recovered."""
+    return f"{SPOOL_PLACEHOLDER_PREFIX}{seq}]"
+
+
+def is_placeholder(text) -> bool:
+    return isinstance(text, str) and text.startswith(SPOOL_PLACEHOLDER_PREFIX)
+
+
+class SpooledChunk:
+    """One chunk on disk; the file name carries its metadata."""
+
+    __slots__ = ("path", "seq", "device_index", "captured_at", "attempts", "ready_at")
+
+    def __init__(self, path, seq, device_index, captured_at, ready_at=0.0):
+        self.path = path
+        self.seq = seq
+        self.device_index = device_index
+        self.captured_at = captured_at
+        self.attempts = 0
+        # Monotonic time of the first attempt
+        self.ready_at = ready_at
+
+    @classmethod
+    def file_name(cls, seq, device_index, captured_at) -> str:
+        return f"{seq:06d}_{device_index}_{int(captured_at * 1000)}.wav"
+
+    @classmethod
+    def from_path(cls, path):
+        """Parse a spooled file name; None if it is not one."""
+        try:
+            seq, device_index, stamp = os.path.basename(path)[:-4].split("_")
+            return cls(path, int(seq), int(device_index), int(stamp) / 1000)
+        except ValueError:
+            return None
+
+    def read(self):
+        """Return (int16 samples, samplerate)."""
+        with wave.open(self.path, "rb") as wav:
+            samplerate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+        return np.frombuffer(frames, dtype=np.int16), samplerate
+
+
+class ChunkSpool:
+    """Disk-backed retry queue for one recording session.
+
+    Args:
+        directory: Folder of this session's spooled chunks
+        transcript_path: Transcript the placeholders were written to
+        on_result: Called as on_result(chunk, text) from the drainer thread;
+            ``text`` is the recovered text, None when the chunk turned out to
+            hold no speech, or "" when it was given up after ``max_attempts``
+        language: Language code for the recognizer
+        recognize: Callable(audio, samplerate, language) raising the
+            speech_recognition errors (the active recognizer if None)
+        session_open: False for a spool resumed from an earlier session; its
+            folder is removed as soon as it is drained
+        on_drained: Called as on_drained(spool) from the drainer thread once
+            the session has ended and every chunk is resolved
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        transcript_path: str,
+        on_result,
+        language: str = "pt-BR",
+        recognize=None,
+        initial_delay: float = SPOOL_RETRY_INITIAL_DELAY,
+        max_delay: float = SPOOL_RETRY_MAX_DELAY,
+        breaker_threshold: int = SPOOL_BREAKER_THRESHOLD,
+        breaker_cooldown: float = SPOOL_BREAKER_COOLDOWN,
+        max_attempts: int = SPOOL_MAX_ATTEMPTS,
+        session_open: bool = True,
+        on_drained=None,
+    ):
+        self.directory = directory
+        self.transcript_path = transcript_path
+        self.language = language
+        self._on_result = on_result
+        self._on_drained = on_drained
+        self._recognize = recognize
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.max_attempts = max_attempts
+
+        self._chunks = {}  # seq -> SpooledChunk
+        self._cond = threading.Condition()
+        self._closed = False
+        self._session_open = session_open
+        self._thread = None
+        self._random = random.Random()
+        self.breaker = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self._next_attempt = 0.0
+        self.counters = {
+            "spooled": 0,
+            "recovered": 0,
+            "no_speech": 0,
+            "gave_up": 0,
+            "attempts": 0,
+            "failures": 0,
+        }
+
+        self._ensure_directory()
+        for name in sorted(os.listdir(directory)):
+            chunk = SpooledChunk.from_path(os.path.join(directory, name))
+            if name.endswith(".wav") and chunk is not None:
+                self._chunks[chunk.seq] = chunk
+        self._start()
+
+    def _ensure_directory(self):
+        os.makedirs(self.directory, exist_ok=True)
+        session_path = os.path.join(self.directory, SESSION_FILE)
+        if not os.path.exists(session_path):
+            with open(session_path, "w", encoding="utf-8") as f:
+                session = {"transcript_path": self.transcript_path}
+                json.dump(dict(session, language=self.language), f)
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._chunks)
+
+    def add(self, device_index, audio_chunk, samplerate, seq, captured_at) -> bool:
+        """
+        Save a failed chunk and schedule its retry
+
+        Returns:
+            bool: False if the chunk could not be written
+        """
+        name = SpooledChunk.file_name(seq, device_index, captured_at)
+        path = os.path.join(self.directory, name)
+        try:
+            # A chunk failing while the session stops may find it drained
+            self._ensure_directory()
+            with wave.open(path, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(int(samplerate))
+                wav.writeframes(np.asarray(audio_chunk, dtype=np.int16).tobytes())
+        except Exception as e:
+            print(f"Error spooling chunk #{seq}: {e}")
+            return False
+        # The first attempt waits until the placeholder is in the file
+        ready_at = time.monotonic() + self.initial_delay
+        with self._cond:
+            self._chunks[seq] = SpooledChunk(
+                path, seq, device_index, captured_at, ready_at
+            )
+            self.counters["spooled"] += 1
+            self._cond.notify()
+        self._start()
+        return True
+
+    def _start(self):
+        with self._cond:
+            if self._thread is None and self._chunks and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    daemon=True,
+                    name=f"SpoolDrainer-{os.path.basename(self.directory)}",
+                )
+                self._thread.start()
+
+    def _backoff(self) -> float:
+        delay = self.initial_delay * 2 ** max(0, self.consecutive_failures - 1)
+        delay = min(self.max_delay, delay)
+        # Jitter keeps several spools from retrying in lockstep
+        return delay * self._random.uniform(0.8, 1.2)
+
+    def _next_chunk(self):
+        """Wait for the next attempt; None once closed or empty."""
+        with self._cond:
+            while not self._closed and self._chunks:
+                chunk = self._chunks[min(self._chunks)]
+                wait = max(self._next_attempt, chunk.ready_at) - time.monotonic()
+                if wait <= 0:
+                    if self.breaker == BREAKER_OPEN:
+                        self.breaker = BREAKER_HALF_OPEN
+                    return chunk
+                self._cond.wait(wait)
+            # add() starts a new drainer for later chunks
+            self._thread = None
+            drained = not self._closed and not self._session_open
+        if drained:
+            self._drained()
+        return None
+
+    def _run(self):
+        while True:
+            chunk = self._next_chunk()
+            if chunk is None:
+                return
+            self._attempt(chunk)
+
+    def _attempt(self, chunk):
+        recognize = self._recognize or get_recognizer().recognize
+        try:
+            audio, samplerate = chunk.read()
+        except Exception as e:
+            print(f"Spooled chunk #{chunk.seq} unreadable, dropping: {e}")
+            self._finish(chunk, "", "gave_up")
+            return
+
+        chunk.attempts += 1
+        with self._cond:
+            self.counters["attempts"] += 1
+        try:
+            text = recognize(audio, samplerate, self.language)
+        except sr.UnknownValueError:
+            self._finish(chunk, None, "no_speech")
+        except Exception as e:
+            self._failed(chunk, e)
+        else:
+            self._finish(chunk, text, "recovered")
+
+    def _failed(self, chunk, error):
+        with self._cond:
+            self.counters["failures"] += 1
+            self.consecutive_failures += 1
+            if (
+                self.breaker == BREAKER_HALF_OPEN
+                or self.consecutive_failures >= self.breaker_threshold
+            ):
+                if self.breaker != BREAKER_OPEN:
+                    print(
+                        f"Transcription spool: circuit open for "
+                        f"{self.breaker_cooldown:.0f}s after {error}"
+                    )
+                self.breaker = BREAKER_OPEN
+                delay = self.breaker_cooldown
+            else:
+                delay = self._backoff()
+            self._next_attempt = time.monotonic() + delay
+        if chunk.attempts >= self.max_attempts:
+            print(f"Transcription spool: giving up on chunk #{chunk.seq}: {error}")
+            self._finish(chunk, "", "gave_up", reset=False)
+
+    def _finish(self, chunk, text, outcome, reset=True):
+        with self._cond:
+            self._chunks.pop(chunk.seq, None)
+            self.counters[outcome] += 1
+            if reset:
+                self.consecutive_failures = 0
+                self.breaker = BREAKER_CLOSED
+                self._next_attempt = 0.0
+        try:
+            self._on_result(chunk, text)
+        except Exception as e:
+            print(f"Error handling recovered chunk #{chunk.seq}: {e}")
+        try:
+            if outcome == "gave_up":
+                # Kept for manual recovery, but no longer retried
+                os.replace(chunk.path, chunk.path[:-4] + ".failed.wav")
+            else:
+                os.remove(chunk.path)
+        except OSError:
+            pass
+
+    def _drained(self):
+        self._remove_directory()
+        if self._on_drained is not None:
+            try:
+                self._on_drained(self)
+            except Exception as e:
+                print(f"Error handling drained spool {self.directory}: {e}")
+
+    def _remove_directory(self):
+        """Remove the session folder once every chunk was resolved."""
+        try:
+            names = [n for n in os.listdir(self.directory) if n != SESSION_FILE]
+        except OSError:
+            return
+        if not names:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def stats(self) -> dict:
+        with self._cond:
+            snapshot = dict(self.counters)
+            snapshot["pending"] = len(self._chunks)
+            snapshot["breaker"] = self.breaker
+        return snapshot
+
+    def format_summary(self) -> str:
+        s = self.stats()
+        return (
+            f"Transcription spool: pending={s['pending']} spooled={s['spooled']} "
+            f"recovered={s['recovered']} no_speech={s['no_speech']} "
+            f"gave_up={s['gave_up']} attempts={s['attempts']} "
+            f"failures={s['failures']} breaker={s['breaker']}"
+        )
+
+    def end_session(self) -> None:
+        """No more chunks will be added; the folder goes once it is drained."""
+        with self._cond:
+            self._session_open = False
+            idle = self._thread is None and not self._chunks
+        if idle:
+            self._drained()
+
+    def close(self, timeout: float = None) -> None:
+        """Stop retrying; spooled files stay on disk for the next start."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def pending_sessions(root: str):
+    """
+    Find spool folders left with chunks by earlier sessions
+
+    Returns:
+        list: (directory, session dict) pairs
+    """
+    sessions = []
+    if not os.path.isdir(root):
+        return sessions
+    for name in sorted(os.listdir(root)):
+        directory = os.path.join(root, name)
+        try:
+            with open(os.path.join(directory, SESSION_FILE), encoding="utf-8") as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            continue
+        names = os.listdir(directory)
+        if any(n.endswith(".wav") and SpooledChunk.from_path(n) for n in names):
+            sessions.append((directory, session))
+    return sessions
@@ -0,0 +1,271 @@
+"""
+Bounded worker pool that runs chunk handlers (transcription + output) for all
+capture devices.
+
+Replaces one-thread-per-chunk spawning: a fixed number of workers drain a
+bounded queue, and an overflow policy decides what happens when the recognizer
+cannot keep up with capture.
+"""
+
+import threading
+from collections import deque
+
+import numpy as np
+
+from src.config_pkg import (
+    MAX_TRANSCRIPTION_WORKERS,
+    TRANSCRIPTION_QUEUE_SIZE,
+    TRANSCRIPTION_OVERFLOW_POLICY,
+    TRANSCRIPTION_MAX_MERGED_DURATION,
+)
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_MERGE_ADJACENT = "merge_adjacent"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_MERGE_ADJACENT)
+
+
+class _TranscriptionJob:
+    __slots__ = (
+        "handler",
+        "device_index",
+        "audio",
+        "samplerate",
+        "extra_args",
+        "overlap_samples",
+        "on_discard",
+    )
+
+    def __init__(
+        self,
+        handler,
+        device_index,
+        audio,
+        samplerate,
+        extra_args,
+        overlap_samples,
+        on_discard,
+    ):
+        self.handler = handler
+        self.device_index = device_index
+        self.audio = audio
+        self.samplerate = samplerate
+        self.extra_args = extra_args
+        self.overlap_samples = overlap_samples
+        self.on_discard = on_discard
+
+    def args(self):
+        return (self.device_index, self.audio, self.samplerate) + self.extra_args
+
+
+class TranscriptionWorkerPool:
+    """Fixed-size pool of worker threads fed by a bounded queue.
+
+    Overflow policies when the queue is full:
+
+    - ``block``: the submitting (capture) thread waits for a free slot.
+    - ``drop_oldest``: the oldest queued chunk is discarded.
+    - ``merge_adjacent``: the new chunk is appended to the newest queued chunk
+      of the same device (minus the overlap) as long as the merged audio stays
+      under ``max_merged_duration``; otherwise falls back to ``drop_oldest``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_TRANSCRIPTION_WORKERS,
+        queue_size: int = TRANSCRIPTION_QUEUE_SIZE,
+        overflow_policy: str = TRANSCRIPTION_OVERFLOW_POLICY,
+        max_merged_duration: float = TRANSCRIPTION_MAX_MERGED_DURATION,
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.max_merged_duration = max_merged_duration
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._workers = []
+        self._shutdown = False
+
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "merged": 0,
+            "in_flight": 0,
+            "peak_queued": 0,
+        }
+
+    def _ensure_workers(self):
+        # Called with the lock held
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                daemon=True,
+                name=f"TranscriptionWorker-{len(self._workers) + 1}",
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def submit(
+        self,
+        handler,
+        device_index,
+        audio_chunk,
+        samplerate,
+        *extra_args,
+        overlap_samples: int = 0,
+        on_discard=None,
+    ) -> bool:
+        """Queue ``handler(device_index, audio_chunk, samplerate, *extra_args)``.
+
+        ``extra_args`` (e.g. sequence number and capture time) travel with the
+        chunk; a merged chunk keeps those of the earlier chunk.
+        ``overlap_samples`` is how much of the start of ``audio_chunk`` repeats
+        the previous chunk; it is trimmed when chunks are merged.
+        ``on_discard`` is called with the same arguments if the chunk is
+        dropped or absorbed into another chunk instead of being handled.
+
+        Returns False if the pool has been shut down.
+        """
+        job = _TranscriptionJob(
+            handler,
+            device_index,
+            audio_chunk,
+            samplerate,
+            extra_args,
+            overlap_samples,
+            on_discard,
+        )
+        discarded = []
+        with self._lock:
+            if self._shutdown:
+                return False
+            self._ensure_workers()
+            self._counters["submitted"] += 1
+
+            if len(self._queue) >= self.queue_size:
+                if self.overflow_policy == OVERFLOW_BLOCK:
+                    self._not_full.wait_for(
+                        lambda: self._shutdown or len(self._queue) < self.queue_size
+                    )
+                    if self._shutdown:
+                        return False
+                elif self.overflow_policy == OVERFLOW_MERGE_ADJACENT and self._merge(
+                    job
+                ):
+                    self._counters["merged"] += 1
+                    discarded.append(job)
+                    job = None
+                else:
+                    discarded.append(self._queue.popleft())
+                    self._counters["dropped"] += 1
+
+            if job is not None:
+                self._queue.append(job)
+                self._counters["peak_queued"] = max(
+                    self._counters["peak_queued"], len(self._queue)
+                )
+                self._not_empty.notify()
+
+        for old in discarded:
+            self._notify_discard(old)
+        return True
+
+    def _merge(self, job) -> bool:
+        """Append ``job``'s audio to the newest queued job of the same device."""
+        for queued in reversed(self._queue):
+            if (
+                queued.device_index != job.device_index
+                or queued.handler is not job.handler
+                or queued.samplerate != job.samplerate
+            ):
+                continue
+            tail = job.audio[job.overlap_samples :]
+            merged_samples = len(queued.audio) + len(tail)
+            if merged_samples > self.max_merged_duration * job.samplerate:
+                return False
+            queued.audio = np.concatenate((queued.audio, tail))
+            return True
+        return False
+
+    def _notify_discard(self, job):
+        if job.on_discard is None:
+            return
+        try:
+            job.on_discard(*job.args())
+        except Exception as e:
+            print(f"Error in discard callback for device {job.device_index}: {e}")
+
+    def _worker_loop(self):
+        while True:
+            with self._lock:
+                self._not_empty.wait_for(lambda: self._shutdown or self._queue)
+                if not self._queue:
+                    return
+                job = self._queue.popleft()
+                self._counters["in_flight"] += 1
+                self._not_full.notify()
+
+            ok = True
+            try:
+                job.handler(*job.args())
+            except Exception as e:
+                ok = False
+                print(
+                    f"Error handling audio chunk from device {job.device_index}: {e}"
+                )
+
+            with self._lock:
+                self._counters["in_flight"] -= 1
+                self._counters["completed" if ok else "failed"] += 1
+
+    def stats(self) -> dict:
+        """Return a snapshot of the pool counters and current queue depth."""
+        with self._lock:
+            snapshot = dict(self._counters)
+            snapshot["queued"] = len(self._queue)
+        return snapshot
+
+    def format_summary(self) -> str:
+        s = self.stats()
+        return (
+            f"Transcription pool: queued={s['queued']} in_flight={s['in_flight']} "
+            f"submitted={s['submitted']} completed={s['completed']} "
+            f"failed={s['failed']} dropped={s['dropped']} merged={s['merged']} "
+            f"peak_queued={s['peak_queued']}"
+        )
+
+    def shutdown(self, cancel_pending: bool = False):
+        """Stop accepting chunks; workers exit once the queue is drained.
+
+        With ``cancel_pending`` the queued chunks are discarded instead.
+        """
+        with self._lock:
+            self._shutdown = True
+            pending = list(self._queue) if cancel_pending else []
+            if cancel_pending:
+                self._queue.clear()
+                self._counters["dropped"] += len(pending)
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        for job in pending:
+            self._notify_discard(job)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_transcription_pool() -> TranscriptionWorkerPool:
+    """Return the process-wide transcription pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = TranscriptionWorkerPool()
+        return _pool